@@ -511,7 +511,7 @@ def match_streams(
             league=r.league,
             home_team=r.event.home_team.name if r.event else None,
             away_team=r.event.away_team.name if r.event else None,
-            start_time=r.event.start_time.isoformat() if r.event else None,
+            start_time=r.event.start_iso if r.event else None,
             included=r.included,
             exclusion_reason=r.exclusion_reason,
             from_cache=r.from_cache,
@@ -1025,7 +1025,7 @@ def search_events(
                     event_name=event.name,
                     league=lg,
                     league_name=lg_info.get("display_name"),
-                    start_time=event.start_time.isoformat(),
+                    start_time=event.start_iso,
                     home_team=event.home_team.name if event.home_team else None,
                     away_team=event.away_team.name if event.away_team else None,
                     status=event.status.state if event.status else None,
@@ -139,6 +139,9 @@ class Config:
     # EPG Timezone - From TZ env var or loaded from DB at startup
     _timezone_from_env: str | None = os.getenv("TZ") or os.getenv("USER_TIMEZONE")
     _timezone_cache: str | None = None
+    # ZoneInfo for the current timezone string, built on first use; reset
+    # whenever _timezone_cache changes
+    _zone_cache: ZoneInfo | None = None
 
     # UI Timezone - From TZ env var (immutable at runtime)
     # Falls back to EPG timezone if not set
@@ -199,12 +202,16 @@ class Config:
 
         This is THE method for getting timezone. Use it everywhere.
         """
-        return ZoneInfo(cls.get_timezone_str())
+        zone = cls._zone_cache
+        if zone is None:
+            zone = cls._zone_cache = ZoneInfo(cls.get_timezone_str())
+        return zone
 
     @classmethod
     def set_timezone(cls, timezone: str) -> None:
         """Set the cached timezone (called by app startup or settings update)."""
         cls._timezone_cache = timezone
+        cls._zone_cache = None
 
     @classmethod
     def reload(cls) -> None:
@@ -254,6 +261,7 @@ class Config:
     def clear_timezone_cache(cls) -> None:
         """Clear cached timezone (forces reload on next access)."""
         cls._timezone_cache = None
+        cls._zone_cache = None
 
     # =========================================================================
     # UI Timezone (for frontend display, from env var)
@@ -403,50 +403,58 @@ class CacheRefresher:
 
         url = "https://sports.core.api.espn.com/v2/sports/soccer/leagues?limit=500"
 
+        # One client (connection pool) for the index and every slug lookup:
+        # hundreds of refs on one host, so reusing keep-alive connections
+        # skips a TCP/TLS handshake (and DNS lookup) per request
         try:
-            with httpx.Client(timeout=30) as client:
+            with httpx.Client(
+                timeout=30,
+                limits=httpx.Limits(
+                    max_connections=self.MAX_WORKERS,
+                    max_keepalive_connections=self.MAX_WORKERS,
+                ),
+            ) as client:
                 response = client.get(url)
                 response.raise_for_status()
                 data = response.json()
 
-            # Extract league refs and fetch slugs
-            league_refs = data.get("items", [])
-            slugs = []
-            total = len(league_refs)
-            completed = 0
+                # Extract league refs and fetch slugs
+                league_refs = data.get("items", [])
+                slugs = []
+                total = len(league_refs)
+                completed = 0
 
-            def fetch_slug(ref_url: str) -> str | None:
-                try:
-                    with httpx.Client(timeout=10) as client:
-                        resp = client.get(ref_url)
+                def fetch_slug(ref_url: str) -> str | None:
+                    try:
+                        resp = client.get(ref_url, timeout=10)
                         if resp.status_code == 200:
                             return resp.json().get("slug")
-                except (httpx.RequestError, httpx.HTTPStatusError) as e:
-                    logger.debug(
-                        "[CACHE_REFRESH] Failed to fetch league slug from %s: %s", ref_url, e
-                    )
-                return None
-
-            # Fetch slugs in parallel
-            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
-                futures = {
-                    executor.submit(fetch_slug, ref["$ref"]): ref
-                    for ref in league_refs
-                    if "$ref" in ref
-                }
-
-                for future in as_completed(futures):
-                    completed += 1
-                    # Report progress during discovery (maps to 0-10% of provider range)
-                    if progress_callback and completed % 5 == 0:
-                        discovery_pct = int((completed / total) * 10)  # 0-10%
-                        progress_callback(
-                            f"Discovering soccer leagues: {completed}/{total}", discovery_pct
+                    except (httpx.RequestError, httpx.HTTPStatusError) as e:
+                        logger.debug(
+                            "[CACHE_REFRESH] Failed to fetch league slug from %s: %s", ref_url, e
                         )
-
-                    slug = future.result()
-                    if slug and self._should_include_soccer_league(slug):
-                        slugs.append(slug)
+                    return None
+
+                # Fetch slugs in parallel
+                with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                    futures = {
+                        executor.submit(fetch_slug, ref["$ref"]): ref
+                        for ref in league_refs
+                        if "$ref" in ref
+                    }
+
+                    for future in as_completed(futures):
+                        completed += 1
+                        # Report progress during discovery (maps to 0-10% of provider range)
+                        if progress_callback and completed % 5 == 0:
+                            discovery_pct = int((completed / total) * 10)  # 0-10%
+                            progress_callback(
+                                f"Discovering soccer leagues: {completed}/{total}", discovery_pct
+                            )
+
+                        slug = future.result()
+                        if slug and self._should_include_soccer_league(slug):
+                            slugs.append(slug)
 
             logger.info("[CACHE_REFRESH] Found %d ESPN soccer leagues", len(slugs))
             return slugs
@@ -126,10 +126,9 @@ class CrossGroupEnforcer:
 
                 # Filter to specified groups if provided
                 if multi_league_group_ids is not None:
+                    wanted_ids = set(multi_league_group_ids)
                     multi_league_groups = {
-                        gid: g
-                        for gid, g in multi_league_groups.items()
-                        if gid in set(multi_league_group_ids)
+                        gid: g for gid, g in multi_league_groups.items() if gid in wanted_ids
                     }
 
                 if not multi_league_groups:
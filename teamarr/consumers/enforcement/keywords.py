@@ -111,11 +111,9 @@ class KeywordEnforcer:
                 channel_lookup: dict[tuple, dict[str | None, Any]] = {}
                 for ch in channels:
                     key = (ch.event_epg_group_id, ch.event_id, ch.event_provider)
-                    if key not in channel_lookup:
-                        channel_lookup[key] = {}
                     # Use None as key for main channel (no keyword)
                     kw = ch.exception_keyword if ch.exception_keyword else None
-                    channel_lookup[key][kw] = ch
+                    channel_lookup.setdefault(key, {})[kw] = ch
 
                 # Check each channel's streams
                 for channel in channels:
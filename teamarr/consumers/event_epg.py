@@ -16,7 +16,8 @@ import logging
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 
-from teamarr.core import Event, Programme
+from teamarr.consumers.io_pool import get_io_pool
+from teamarr.core import Event, EventState, Programme
 from teamarr.database.templates import EventTemplateConfig
 from teamarr.services import SportsDataService
 from teamarr.templates.context_builder import ContextBuilder
@@ -63,7 +64,7 @@ def is_event_postponed(event: Event) -> bool:
     """Check if an event is postponed based on its status."""
     if not event.status:
         return False
-    return event.status.state.lower() == "postponed"
+    return event.status.code is EventState.POSTPONED
 
 
 def prepend_postponed_label(text: str | None, event: Event, enabled: bool) -> str | None:
@@ -91,7 +92,8 @@ class EventEPGGenerator:
 
     def __init__(self, service: SportsDataService):
         self._service = service
-        self._context_builder = ContextBuilder(service)
+        # Home/away stats for each event are fetched together on the shared I/O pool
+        self._context_builder = ContextBuilder(service, io_pool=get_io_pool())
         self._resolver = TemplateResolver()
 
     def generate_for_leagues(
@@ -296,7 +298,7 @@ class EventEPGGenerator:
             categories=resolved_categories,
             xmltv_flags=template.xmltv_flags,
             xmltv_video=template.xmltv_video,
-        )
+        ).freeze()
 
     # Keywords for detecting UFC prelim streams
     UFC_PRELIM_KEYWORDS = ["prelim", "prelims", "early", "pre-show", "early prelim"]
@@ -18,6 +18,7 @@ from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict, dataclass, field
 from datetime import date, datetime, timedelta
+from operator import attrgetter, itemgetter
 from sqlite3 import Connection
 from typing import Any
 
@@ -61,6 +62,7 @@ from teamarr.database.stats import (
 )
 from teamarr.services import SportsDataService, create_default_service
 from teamarr.services.stream_filter import FilterResult
+from teamarr.utilities.event_status import is_event_final
 from teamarr.utilities.xmltv import merge_xmltv_content, programmes_to_xmltv
 
 logger = logging.getLogger(__name__)
@@ -352,6 +354,23 @@ class EventGroupProcessor:
         # while ensuring groups that need fresh API data can still get it
         self._shared_events: dict[str, tuple[list[Event], bool]] = {}
 
+        # Global settings read once per run rather than once per group.
+        # Keyed by loader; a processor lives for one generation run.
+        self._run_settings: dict[Callable, Any] = {}
+
+    def _load_run_settings(self, conn: Connection | None, loader: Callable[[Connection], Any]):
+        """Load a settings group via loader(conn), cached for the rest of the run.
+
+        conn may be None to open a connection only on a cache miss.
+        """
+        if loader not in self._run_settings:
+            if conn is None:
+                with self._db_factory() as new_conn:
+                    self._run_settings[loader] = loader(new_conn)
+            else:
+                self._run_settings[loader] = loader(conn)
+        return self._run_settings[loader]
+
     def _resolve_effective_leagues(
         self, conn: Connection, group: EventEPGGroup
     ) -> list[str]:
@@ -529,7 +548,7 @@ class EventGroupProcessor:
                     home_team=r.event.home_team.name if r.event else None,
                     away_team=r.event.away_team.name if r.event else None,
                     league=r.league,
-                    start_time=r.event.start_time.isoformat() if r.event else None,
+                    start_time=r.event.start_iso if r.event else None,
                     from_cache=getattr(r, "from_cache", False),
                     exclusion_reason=r.exclusion_reason,
                 )
@@ -1487,7 +1506,7 @@ class EventGroupProcessor:
                 for s in streams
             ]
             # Sort by stream ID ascending for consistent processing order
-            stream_dicts.sort(key=lambda s: s["id"])
+            stream_dicts.sort(key=itemgetter("id"))
             return stream_dicts
 
         except Exception as e:
@@ -1514,8 +1533,7 @@ class EventGroupProcessor:
         from teamarr.services.stream_filter import StreamFilter, StreamFilterConfig
 
         # Load global stream filter settings
-        with self._db_factory() as conn:
-            global_settings = get_stream_filter_settings(conn)
+        global_settings = self._load_run_settings(None, get_stream_filter_settings)
 
         # Build config combining global and group settings
         config = StreamFilterConfig(
@@ -1675,7 +1693,7 @@ class EventGroupProcessor:
             row = conn.execute("SELECT include_final_events FROM settings WHERE id = 1").fetchone()
             include_final_events = bool(row["include_final_events"]) if row else False
 
-        sport_durations = self._load_sport_durations_cached()
+        sport_durations = self._load_run_settings(None, self._load_sport_durations)
 
         # Use resolved_leagues if provided (e.g., inherited from parent), else group.leagues
         include_leagues = resolved_leagues if resolved_leagues else group.leagues
@@ -1721,13 +1739,6 @@ class EventGroupProcessor:
 
         return result
 
-    def _load_sport_durations_cached(self) -> dict[str, float]:
-        """Load sport durations (cached for reuse within a run)."""
-        if not hasattr(self, "_sport_durations_cache"):
-            with self._db_factory() as conn:
-                self._sport_durations_cache = self._load_sport_durations(conn)
-        return self._sport_durations_cache
-
     def _build_matched_stream_list(
         self,
         streams: list[dict],
@@ -1783,7 +1794,7 @@ class EventGroupProcessor:
         """
         from teamarr.consumers.ufc_segments import expand_ufc_segments
 
-        sport_durations = self._load_sport_durations_cached()
+        sport_durations = self._load_run_settings(None, self._load_sport_durations)
         return expand_ufc_segments(matched_streams, sport_durations, stream_timezone)
 
     def _enrich_matched_events(self, matched_streams: list[dict]) -> list[dict]:
@@ -1791,7 +1802,9 @@ class EventGroupProcessor:
 
         Fetches fresh event data from summary endpoint for each matched event.
         This ensures lifecycle filtering uses current final status, not stale
-        cached status from scoreboard/schedule.
+        cached status from scoreboard/schedule. Each distinct event is
+        refreshed once, however many streams matched it, and events already
+        final are not refreshed at all.
 
         Args:
             matched_streams: List of {'stream': ..., 'event': ...} dicts
@@ -1802,13 +1815,25 @@ class EventGroupProcessor:
         if not matched_streams:
             return matched_streams
 
+        refreshed_events: dict[tuple[str, str], Event] = {}
         enriched = []
         for match in matched_streams:
             event = match.get("event")
-            if event:
+            if not event:
+                enriched.append(match)
+                continue
+
+            # A final event (with its final score) cannot change again
+            if is_event_final(event):
+                enriched.append(match)
+                continue
+
+            event_key = (event.league, event.id)
+            refreshed = refreshed_events.get(event_key)
+            if refreshed is None:
                 old_status = event.status.state if event.status else "N/A"
                 # Refresh event status from provider (invalidates cache, fetches fresh)
-                refreshed = self._service.refresh_event_status(event)
+                refreshed = refreshed_events[event_key] = self._service.refresh_event_status(event)
                 new_status = refreshed.status.state if refreshed.status else "N/A"
                 if old_status != new_status:
                     logger.debug(
@@ -1817,12 +1842,15 @@ class EventGroupProcessor:
                         old_status,
                         new_status,
                     )
+
+            if refreshed is event:
+                # Refresh failed (original returned) - nothing to replace
+                enriched.append(match)
+            else:
                 # Preserve all keys (including segment info for UFC)
                 enriched_match = dict(match)
                 enriched_match["event"] = refreshed
                 enriched.append(enriched_match)
-            else:
-                enriched.append(match)
 
         logger.debug("[EVENT_EPG] Enriched %d matched events with fresh status", len(enriched))
         return enriched
@@ -1900,9 +1928,10 @@ class EventGroupProcessor:
                 else:
                     filtered_count += 1
                     logger.debug(
-                        f"Team filter excluded: {event.name} - "
-                        f"neither {event.home_team.name if event.home_team else 'N/A'} "
-                        f"nor {event.away_team.name if event.away_team else 'N/A'} in include list"
+                        "Team filter excluded: %s - neither %s nor %s in include list",
+                        event.name,
+                        event.home_team.name if event.home_team else "N/A",
+                        event.away_team.name if event.away_team else "N/A",
                     )
             else:
                 # Exclude mode: keep if team is NOT in list
@@ -1910,7 +1939,7 @@ class EventGroupProcessor:
                     filtered.append(match)
                 else:
                     filtered_count += 1
-                    logger.debug(f"Team filter excluded: {event.name} - team in exclude list")
+                    logger.debug("Team filter excluded: %s - team in exclude list", event.name)
 
         if playoff_bypass_count > 0:
             logger.info(
@@ -1947,7 +1976,7 @@ class EventGroupProcessor:
         from teamarr.database.settings import get_team_filter_settings
 
         # Get global settings for defaults
-        settings = get_team_filter_settings(conn)
+        settings = self._load_run_settings(conn, get_team_filter_settings)
 
         # Determine bypass_filter_for_playoffs (group override -> global default)
         bypass_playoffs = group.bypass_filter_for_playoffs
@@ -2234,9 +2263,7 @@ class EventGroupProcessor:
 
             if result.matched and result.included and result.event:
                 # Successfully matched and included
-                event_date = (
-                    result.event.start_time.isoformat() if result.event.start_time else None
-                )
+                event_date = result.event.start_iso if result.event.start_time else None
                 # Extract match method and confidence if available (Phase 7 enhancement)
                 match_method = getattr(result, "match_method", None)
                 if match_method and hasattr(match_method, "value"):
@@ -2454,7 +2481,7 @@ class EventGroupProcessor:
                 combined_result.merge(cleanup_result)
                 if cleanup_result.deleted:
                     deleted_count = len(cleanup_result.deleted)
-                    logger.info(f"Deleted {deleted_count} channels with missing/changed streams")
+                    logger.info("Deleted %d channels with missing/changed streams", deleted_count)
             except Exception as e:
                 logger.debug("[EVENT_EPG] Error cleaning up deleted streams: %s", e)
 
@@ -2627,8 +2654,8 @@ class EventGroupProcessor:
                     match["_exception_keyword"] = keyword_label
 
         # Load sport durations and lookback from settings
-        options.sport_durations = self._load_sport_durations(conn)
-        lookback_hours = self._load_lookback_hours(conn)
+        options.sport_durations = self._load_run_settings(conn, self._load_sport_durations)
+        lookback_hours = self._load_run_settings(conn, self._load_lookback_hours)
 
         # Generate programmes and channels from matched streams
         programmes, channels = self._epg_generator.generate_for_matched_streams(
@@ -2660,7 +2687,7 @@ class EventGroupProcessor:
                 postgame_count = filler_result.postgame_count
                 programmes.extend(filler_result.programmes)
                 # Sort all programmes by channel_id then start time
-                programmes.sort(key=lambda p: (p.channel_id, p.start))
+                programmes.sort(key=attrgetter("channel_id", "start"))
                 logger.debug(
                     f"Added {len(filler_result.programmes)} filler programmes "
                     f"({pregame_count} pregame, {postgame_count} postgame) "
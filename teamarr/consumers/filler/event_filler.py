@@ -14,10 +14,17 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
 from teamarr.consumers.event_epg import POSTPONED_LABEL, is_event_postponed
-from teamarr.core import Event, Programme, TeamStats
+from teamarr.core import Event, FillerProgramme, Programme, TeamStats
 from teamarr.services.sports_data import SportsDataService
-from teamarr.templates.context import GameContext, Odds, TeamChannelContext, TemplateContext
+from teamarr.templates.context import (
+    GameContext,
+    Odds,
+    TeamChannelContext,
+    TemplateContext,
+    to_quarter_points,
+)
 from teamarr.templates.resolver import TemplateResolver
+from teamarr.utilities.event_status import is_event_final
 from teamarr.utilities.sports import get_sport_duration
 from teamarr.utilities.time_blocks import create_filler_chunks
 
@@ -110,6 +117,9 @@ class EventFillerGenerator:
         self._resolver = TemplateResolver()
         # Cache for team stats to avoid redundant API calls within a generation run
         self._stats_cache: dict[tuple[str, str], TeamStats | None] = {}
+        # Final status of non-final events by (league, event id), once
+        # refreshed; several streams (and UFC segments) share one event
+        self._final_checks: dict[tuple[str, str], bool] = {}
 
     def generate(
         self,
@@ -300,42 +310,43 @@ class EventFillerGenerator:
         # Check if we should prepend "Postponed: " label
         should_prepend = prepend_postponed_label and event and is_event_postponed(event)
 
+        # Resolve templates once: every chunk shares the same template and
+        # context, so only the start/stop times differ between chunks
+        title = self._resolver.resolve(template.title, context)
+        description = ""
+        if template.description:
+            description = self._resolver.resolve(template.description, context)
+        subtitle = None
+        if template.subtitle:
+            subtitle = self._resolver.resolve(template.subtitle, context)
+
+        # Prepend "Postponed: " label if applicable
+        if should_prepend:
+            title = f"{POSTPONED_LABEL}{title}"
+            if subtitle:
+                subtitle = f"{POSTPONED_LABEL}{subtitle}"
+            if description:
+                description = f"{POSTPONED_LABEL}{description}"
+
+        # Resolve art URL if present
+        # Unknown variables stay literal (e.g., {bad_var}) so user can identify issues
+        icon = self._resolver.resolve(template.art_url, context) if template.art_url else None
+
+        # Only include categories if categories_apply_to == "all"
+        # Filler never gets xmltv_flags (new/live/date are for live events only)
+        # Apply title case for proper XMLTV formatting (e.g., "Football" not "football")
+        filler_categories = []
+        if config.categories_apply_to == "all":
+            # Resolve any {sport} variables in categories
+            for cat in config.xmltv_categories:
+                if "{" in cat:
+                    filler_categories.append(self._resolver.resolve(cat, context).title())
+                else:
+                    filler_categories.append(cat.title())
+
         programmes: list[Programme] = []
         for chunk_start, chunk_end in chunks:
-            # Resolve templates
-            title = self._resolver.resolve(template.title, context)
-            description = ""
-            if template.description:
-                description = self._resolver.resolve(template.description, context)
-            subtitle = None
-            if template.subtitle:
-                subtitle = self._resolver.resolve(template.subtitle, context)
-
-            # Prepend "Postponed: " label if applicable
-            if should_prepend:
-                title = f"{POSTPONED_LABEL}{title}"
-                if subtitle:
-                    subtitle = f"{POSTPONED_LABEL}{subtitle}"
-                if description:
-                    description = f"{POSTPONED_LABEL}{description}"
-
-            # Resolve art URL if present
-            # Unknown variables stay literal (e.g., {bad_var}) so user can identify issues
-            icon = self._resolver.resolve(template.art_url, context) if template.art_url else None
-
-            # Only include categories if categories_apply_to == "all"
-            # Filler never gets xmltv_flags (new/live/date are for live events only)
-            # Apply title case for proper XMLTV formatting (e.g., "Football" not "football")
-            filler_categories = []
-            if config.categories_apply_to == "all":
-                # Resolve any {sport} variables in categories
-                for cat in config.xmltv_categories:
-                    if "{" in cat:
-                        filler_categories.append(self._resolver.resolve(cat, context).title())
-                    else:
-                        filler_categories.append(cat.title())
-
-            programme = Programme(
+            programme = FillerProgramme(
                 channel_id=channel_id,
                 title=title,
                 start=chunk_start,
@@ -344,9 +355,10 @@ class EventFillerGenerator:
                 subtitle=subtitle,
                 icon=icon,
                 filler_type=filler_type,
-                categories=filler_categories,
+                # Each programme gets its own list
+                categories=list(filler_categories),
                 # No xmltv_flags for filler - new/live/date are for live events only
-            )
+            ).freeze()
             programmes.append(programme)
 
         return programmes
@@ -418,8 +430,8 @@ class EventFillerGenerator:
 
         return Odds(
             provider=odds_data.get("provider", ""),
-            spread=abs(odds_data.get("spread", 0.0)),
-            over_under=odds_data.get("over_under", 0.0),
+            spread_quarter=abs(to_quarter_points(odds_data.get("spread"))),
+            over_under_quarter=to_quarter_points(odds_data.get("over_under")),
             details=odds_data.get("details", ""),
             team_moneyline=team_ml,
             opponent_moneyline=opp_ml,
@@ -475,20 +487,25 @@ class EventFillerGenerator:
         """Check if event is final, refreshing status from provider if needed.
 
         Fetches fresh status via summary endpoint to get accurate final detection.
+        An event already final is final for good, so it skips the refresh.
         """
         if not event:
             return False
 
-        # Refresh event status from provider for accurate final detection
-        if self._service:
-            refreshed = self._service.refresh_event_status(event)
-        else:
-            refreshed = event
-
         # Use unified final status check
-        from teamarr.utilities.event_status import is_event_final
+        if is_event_final(event):
+            return True
 
-        return is_event_final(refreshed)
+        # Refresh event status from provider for accurate final detection
+        if not self._service:
+            return False
+
+        cache_key = (event.league, event.id)
+        is_final = self._final_checks.get(cache_key)
+        if is_final is None:
+            refreshed = self._service.refresh_event_status(event)
+            is_final = self._final_checks[cache_key] = is_event_final(refreshed)
+        return is_final
 
 
 def template_to_event_filler_config(template) -> EventFillerConfig:
@@ -15,18 +15,24 @@ Design principles:
 """
 
 import logging
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from dataclasses import fields, is_dataclass
 from datetime import date as date_type
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
 
 from teamarr.consumers.event_epg import POSTPONED_LABEL, is_event_postponed
-from teamarr.core import Event, Programme, TeamStats
+from teamarr.consumers.io_pool import get_io_pool
+from teamarr.core import Event, EventTable, FillerProgramme, Programme, TeamStats
 from teamarr.services import SportsDataService
 from teamarr.templates.context import GameContext, TeamChannelContext, TemplateContext
 from teamarr.templates.context_builder import ContextBuilder
-from teamarr.templates.resolver import TemplateResolver
+from teamarr.templates.resolver import VARIABLE_PATTERN, TemplateResolver
+from teamarr.utilities.event_status import is_event_final
 from teamarr.utilities.sports import get_sport_duration, get_sport_from_league
 from teamarr.utilities.time_blocks import create_filler_chunks, crosses_midnight
-from teamarr.utilities.tz import now_user, to_user_tz
+from teamarr.utilities.tz import get_user_timezone, now_user
 
 from .types import (
     FillerConfig,
@@ -37,6 +43,36 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+# Variable suffixes whose game contexts a filler context can carry
+_ALL_SUFFIXES = frozenset(("next", "last"))
+
+
+def _template_strings(obj) -> Iterator[str]:
+    """Yield every template string in a (nested) filler config dataclass."""
+    for f in fields(obj):
+        value = getattr(obj, f.name)
+        if isinstance(value, str):
+            yield value
+        elif isinstance(value, list):
+            yield from (v for v in value if isinstance(v, str))
+        elif is_dataclass(value):
+            yield from _template_strings(value)
+
+
+def _referenced_suffixes(config: FillerConfig) -> frozenset[str]:
+    """Which of .next/.last any template in config actually references.
+
+    A filler context only needs the next/last game contexts (and their
+    opponents' stats) for the suffixes its templates use.
+    """
+    found = set()
+    for text in _template_strings(config):
+        for match in VARIABLE_PATTERN.finditer(text):
+            _, _, suffix = match.group(1).lower().partition(".")
+            if suffix in _ALL_SUFFIXES:
+                found.add(suffix)
+    return frozenset(found)
+
 
 class FillerGenerator:
     """Generates filler programmes between events.
@@ -57,11 +93,22 @@ class FillerGenerator:
         )
     """
 
-    def __init__(self, service: SportsDataService):
+    def __init__(
+        self,
+        service: SportsDataService,
+        context_builder: ContextBuilder | None = None,
+    ):
         self._service = service
         self._resolver = TemplateResolver()
-        self._context_builder = ContextBuilder(service)
-        self._options: FillerOptions | None = None  # Set during generate()
+        # Share the EPG generator's builder when given, so opponent stats
+        # fetched for game programmes are reused for filler. Either way the
+        # per-day contexts prefetch their opponents on the shared I/O pool.
+        self._context_builder = context_builder or ContextBuilder(service, io_pool=get_io_pool())
+        # Final status of non-final events by (league, event id), once
+        # refreshed. The same last game backs the postgame and idle filler of
+        # every day until the next game, so it is refreshed once per run
+        # instead of once per filler.
+        self._final_checks: dict[tuple[str, str], bool] = {}
 
     def generate(
         self,
@@ -95,15 +142,15 @@ class FillerGenerator:
         """
         options = options or FillerOptions()
         config = config or FillerConfig()
-        self._options = options  # Store for use in helper methods
 
-        # Sort events by start time
-        sorted_events = sorted(events, key=lambda e: e.start_time)
+        # Sort events by start time (table gives bisect lookups for next/last)
+        table = EventTable.from_events(events)
+        sorted_events = table.events
 
         # Calculate EPG window
         # Key insight from V1: EPG start should be synchronized with earliest event
         # to avoid gaps between event end and filler start
-        now = now_user()
+        now = options.generation_time or now_user()
         epg_start = self._calculate_epg_start(sorted_events, now, options)
         epg_end = now + timedelta(days=options.output_days_ahead)
 
@@ -119,22 +166,47 @@ class FillerGenerator:
             team_abbrev=team_abbrev,
         )
 
-        # Generate fillers day by day
+        # Timezones and each event's user-timezone date are the same for
+        # every day of the window, so they are resolved once here rather
+        # than per day (and per event per day)
+        tz = ZoneInfo(options.epg_timezone)
+        user_tz = get_user_timezone()
+        event_dates = [e.start_time.astimezone(user_tz).date() for e in sorted_events]
+
+        # Every date the day loop touches (the window plus one day either
+        # side, for the previous-day lookup and the last day's end) and the
+        # midnights bounding them, built once up front rather than per day.
+        # Day i of the window is dates[i + 1]; it runs from midnights[i] to
+        # midnights[i + 1].
+        first_date = epg_start.date()
+        num_days = (epg_end.date() - first_date).days + 1
+        dates = [first_date + timedelta(days=i) for i in range(-1, num_days + 1)]
+        midnights = [datetime.combine(d, time.min, tzinfo=tz) for d in dates[1:]]
+
+        # Generate fillers day by day. Consecutive days between the same two
+        # games resolve the same templates against the same context, so the
+        # resolved text is shared across days (see _create_filler_programmes)
         fillers: list[Programme] = []
-        current_date = epg_start.date()
-        end_date = epg_end.date()
+        resolved: dict[tuple, tuple] = {}
+        # Templates that never use {var.next}/{var.last} don't need those
+        # game contexts, nor their opponents' stats
+        suffixes = _referenced_suffixes(config)
 
         logger.debug(
             "[STARTED] Filler generation for %s: %d events, %d days",
             team_name,
             len(sorted_events),
-            (end_date - current_date).days + 1,
+            num_days,
         )
 
-        while current_date <= end_date:
+        for i in range(num_days):
             day_fillers = self._generate_day_fillers(
-                date=current_date,
-                events=sorted_events,
+                date=dates[i + 1],
+                prev_date=dates[i],
+                day_start=midnights[i],
+                day_end=midnights[i + 1],
+                table=table,
+                event_dates=event_dates,
                 team_config=team_config,
                 team_stats=team_stats,
                 channel_id=channel_id,
@@ -142,9 +214,11 @@ class FillerGenerator:
                 options=options,
                 config=config,
                 epg_start=epg_start,
+                tz=tz,
+                resolved=resolved,
+                suffixes=suffixes,
             )
             fillers.extend(day_fillers)
-            current_date += timedelta(days=1)
 
         logger.debug(
             "[COMPLETED] Filler generation for %s: %d programmes",
@@ -157,7 +231,11 @@ class FillerGenerator:
     def _generate_day_fillers(
         self,
         date,  # date object
-        events: list[Event],
+        prev_date: date_type,
+        day_start: datetime,
+        day_end: datetime,
+        table: EventTable,
+        event_dates: list[date_type],
         team_config: TeamChannelContext,
         team_stats: TeamStats | None,
         channel_id: str,
@@ -165,52 +243,57 @@ class FillerGenerator:
         options: FillerOptions,
         config: FillerConfig,
         epg_start: datetime,
+        tz: ZoneInfo,
+        resolved: dict[tuple, tuple] | None = None,
+        suffixes: frozenset[str] = _ALL_SUFFIXES,
     ) -> list[Programme]:
-        """Generate fillers for a single day."""
-        from zoneinfo import ZoneInfo
-
-        tz = ZoneInfo(options.epg_timezone)
-
-        # Day boundaries
-        day_start = datetime.combine(date, datetime.min.time()).replace(tzinfo=tz)
-        day_end = datetime.combine(date + timedelta(days=1), datetime.min.time()).replace(tzinfo=tz)
+        """Generate fillers for a single day.
 
+        day_start and day_end are the midnights (in tz) bounding date.
+        event_dates[i] is the user-timezone date of table.events[i] (so it
+        is sorted, as table.events is).
+        """
         # On first day, start from epg_start instead of midnight
         if date == epg_start.date():
             day_start = epg_start.replace(second=0, microsecond=0)
 
-        # Helper to get event date in user timezone
-        def event_date(e: Event) -> date_type:
-            return to_user_tz(e.start_time).date()
-
-        # Get events for this day
-        day_events = [e for e in events if event_date(e) == date]
+        events = table.events
 
-        # Get previous day's last event (for midnight crossover)
-        prev_day_events = [e for e in events if event_date(e) == date - timedelta(days=1)]
-        prev_day_last_event = prev_day_events[-1] if prev_day_events else None
+        # This day's events, plus the previous day's last event (for midnight
+        # crossover). event_dates is sorted, so both are found by bisection
+        # instead of walking the whole season for every day of the window.
+        prev_lo = bisect_left(event_dates, prev_date)
+        lo = bisect_left(event_dates, date, prev_lo)
+        hi = bisect_right(event_dates, date, lo)
+        day_events = events[lo:hi]
+        prev_day_last_event = events[lo - 1] if lo > prev_lo else None
 
-        # Get next event after this day (for .next context)
-        future_events = [e for e in events if event_date(e) > date]
-        next_future_event = future_events[0] if future_events else None
+        # Get next event after this day (for .next context): the first event
+        # dated after this day in user timezone, which is where the day's
+        # bisected range ends
+        next_future_event = events[hi] if hi < len(events) else None
 
         # Debug logging for idle day .next context
         if not day_events and next_future_event:
             logger.debug(
-                f"Idle day {date}: next_future_event={next_future_event.name} on "
-                f"{event_date(next_future_event)} ({next_future_event.home_team.name} vs "
-                f"{next_future_event.away_team.name})"
+                "Idle day %s: next_future_event=%s on %s (%s vs %s)",
+                date,
+                next_future_event.name,
+                event_dates[hi],
+                next_future_event.home_team.name,
+                next_future_event.away_team.name,
             )
         elif not day_events and not next_future_event:
             logger.debug(
-                f"Idle day {date}: NO next_future_event found. Total events in schedule: {len(events)}"  # noqa: E501
+                "Idle day %s: NO next_future_event found. Total events in schedule: %d",
+                date,
+                len(events),
             )
 
         # Find last completed event relative to THIS DAY (for .last context)
         # Important: use day_start (the EPG date) not epg_start (actual now)
         # This ensures .last refers to the most recent game before the programme being generated
-        past_events = [e for e in events if e.start_time < day_start]
-        last_past_event = past_events[-1] if past_events else None
+        last_past_event = table.last_before(day_start)
 
         fillers: list[Programme] = []
 
@@ -222,6 +305,7 @@ class FillerGenerator:
                     day_end=day_end,
                     day_events=day_events,
                     prev_day_last_event=prev_day_last_event,
+                    next_future_event=next_future_event,
                     last_past_event=last_past_event,
                     team_config=team_config,
                     team_stats=team_stats,
@@ -230,6 +314,8 @@ class FillerGenerator:
                     options=options,
                     config=config,
                     tz=tz,
+                    resolved=resolved,
+                    suffixes=suffixes,
                 )
             )
         else:
@@ -248,6 +334,8 @@ class FillerGenerator:
                     options=options,
                     config=config,
                     tz=tz,
+                    resolved=resolved,
+                    suffixes=suffixes,
                 )
             )
 
@@ -259,6 +347,7 @@ class FillerGenerator:
         day_end: datetime,
         day_events: list[Event],
         prev_day_last_event: Event | None,
+        next_future_event: Event | None,
         last_past_event: Event | None,
         team_config: TeamChannelContext,
         team_stats: TeamStats | None,
@@ -267,14 +356,20 @@ class FillerGenerator:
         options: FillerOptions,
         config: FillerConfig,
         tz,  # ZoneInfo - timezone for midnight crossing detection
+        resolved: dict[tuple, tuple] | None = None,
+        suffixes: frozenset[str] = _ALL_SUFFIXES,
     ) -> list[Programme]:
-        """Generate fillers for a day with games."""
+        """Generate fillers for a day with games.
+
+        next_future_event is the first game after this day (found once per
+        day by _generate_day_fillers), the .next context for postgame.
+        """
         fillers: list[Programme] = []
 
         # Check if previous day's game crosses into today
         skip_pregame_until = day_start
         if prev_day_last_event:
-            prev_game_end = self._estimate_event_end(prev_day_last_event).astimezone(tz)
+            prev_game_end = self._estimate_event_end(prev_day_last_event, options).astimezone(tz)
             if prev_game_end > day_start:
                 skip_pregame_until = prev_game_end
 
@@ -296,6 +391,7 @@ class FillerGenerator:
                     team_stats=team_stats,
                     next_event=first_game,
                     last_event=last_past_event,
+                    suffixes=suffixes,
                 )
 
                 pregame_progs = self._create_filler_programmes(
@@ -304,16 +400,18 @@ class FillerGenerator:
                     filler_type=FillerType.PREGAME,
                     context=context,
                     config=config,
+                    options=options,
                     channel_id=channel_id,
                     logo_url=logo_url,
                     next_event=first_game,
+                    resolved=resolved,
                 )
                 fillers.extend(pregame_progs)
 
         # POSTGAME: From last game end to midnight (or next game)
         if config.postgame_enabled:
             last_game = day_events[-1]
-            postgame_start_utc = self._estimate_event_end(last_game)
+            postgame_start_utc = self._estimate_event_end(last_game, options)
             # Convert to local timezone for consistent time block alignment
             postgame_start = postgame_start_utc.astimezone(tz)
             postgame_end = day_end
@@ -323,19 +421,13 @@ class FillerGenerator:
                 # Game crosses midnight - handled by next day
                 pass
             elif postgame_start < postgame_end:
-                # Build context for postgame
-                # Find next game for .next context
-                next_game = None
-                for event in day_events:
-                    if event.start_time > last_game.start_time:
-                        next_game = event
-                        break
-
+                # Build context for postgame (.next is the first game after today)
                 context = self._build_filler_context(
                     team_config=team_config,
                     team_stats=team_stats,
-                    next_event=next_game,
+                    next_event=next_future_event,
                     last_event=last_game,
+                    suffixes=suffixes,
                 )
 
                 postgame_progs = self._create_filler_programmes(
@@ -344,9 +436,11 @@ class FillerGenerator:
                     filler_type=FillerType.POSTGAME,
                     context=context,
                     config=config,
+                    options=options,
                     channel_id=channel_id,
                     logo_url=logo_url,
                     last_event=last_game,
+                    resolved=resolved,
                 )
                 fillers.extend(postgame_progs)
 
@@ -366,6 +460,8 @@ class FillerGenerator:
         options: FillerOptions,
         config: FillerConfig,
         tz=None,  # ZoneInfo - timezone for time alignment
+        resolved: dict[tuple, tuple] | None = None,
+        suffixes: frozenset[str] = _ALL_SUFFIXES,
     ) -> list[Programme]:
         """Generate fillers for a day with no games."""
         fillers: list[Programme] = []
@@ -373,7 +469,7 @@ class FillerGenerator:
         # Check if previous day's game crosses into today
         filler_start = day_start
         if prev_day_last_event:
-            prev_game_end_utc = self._estimate_event_end(prev_day_last_event)
+            prev_game_end_utc = self._estimate_event_end(prev_day_last_event, options)
             prev_game_end = prev_game_end_utc.astimezone(tz) if tz else prev_game_end_utc
             if prev_game_end > day_start:
                 # Previous game crossed midnight
@@ -385,6 +481,7 @@ class FillerGenerator:
                             team_stats=team_stats,
                             next_event=next_future_event,
                             last_event=prev_day_last_event,
+                            suffixes=suffixes,
                         )
                         postgame_progs = self._create_filler_programmes(
                             start_dt=day_start,
@@ -392,9 +489,11 @@ class FillerGenerator:
                             filler_type=FillerType.POSTGAME,
                             context=context,
                             config=config,
+                            options=options,
                             channel_id=channel_id,
                             logo_url=logo_url,
                             last_event=prev_day_last_event,
+                            resolved=resolved,
                         )
                         fillers.extend(postgame_progs)
                     filler_start = prev_game_end
@@ -412,6 +511,7 @@ class FillerGenerator:
                 team_stats=team_stats,
                 next_event=next_future_event,
                 last_event=last_past_event or prev_day_last_event,
+                suffixes=suffixes,
             )
 
             idle_progs = self._create_filler_programmes(
@@ -420,11 +520,13 @@ class FillerGenerator:
                 filler_type=FillerType.IDLE,
                 context=context,
                 config=config,
+                options=options,
                 channel_id=channel_id,
                 logo_url=logo_url,
                 is_offseason=is_offseason,
                 last_event=last_past_event or prev_day_last_event,
                 next_event=next_future_event,
+                resolved=resolved,
             )
             fillers.extend(idle_progs)
 
@@ -437,13 +539,20 @@ class FillerGenerator:
         filler_type: FillerType,
         context: TemplateContext,
         config: FillerConfig,
+        options: FillerOptions,
         channel_id: str,
         logo_url: str | None,
         is_offseason: bool = False,
         last_event: Event | None = None,
         next_event: Event | None = None,
+        resolved: dict[tuple, tuple] | None = None,
     ) -> list[Programme]:
-        """Create filler programmes aligned to 6-hour time blocks."""
+        """Create filler programmes aligned to 6-hour time blocks.
+
+        resolved, if given, memoizes the resolved text across calls for one
+        team. It is keyed by the template and the context's next/last
+        events, the only parts of the context that vary within a team.
+        """
         # Split into time-block-aligned chunks
         chunks = create_filler_chunks(start_dt, end_dt)
 
@@ -462,48 +571,33 @@ class FillerGenerator:
         # - For pregame: check if next_event is postponed
         # - For postgame/idle: check if last_event is postponed
         prepend_label = False
-        if self._options and self._options.prepend_postponed_label:
+        if options.prepend_postponed_label:
             if filler_type == FillerType.PREGAME and next_event:
                 prepend_label = is_event_postponed(next_event)
             elif filler_type in (FillerType.POSTGAME, FillerType.IDLE) and last_event:
                 prepend_label = is_event_postponed(last_event)
 
+        # Resolve templates once: every chunk shares the same template and
+        # context, so only the start/stop times differ between chunks
+        memo_key = (
+            template.title,
+            template.subtitle,
+            template.description,
+            template.art_url,
+            prepend_label,
+            context.next_game.event.id if context.next_game else None,
+            context.last_game.event.id if context.last_game else None,
+        )
+        cached = resolved.get(memo_key) if resolved is not None else None
+        if cached is None:
+            cached = self._resolve_filler_text(template, context, config, prepend_label)
+            if resolved is not None:
+                resolved[memo_key] = cached
+        title, subtitle, description, icon, filler_categories = cached
+
         programmes: list[Programme] = []
         for chunk_start, chunk_end in chunks:
-            # Resolve templates
-            title = self._resolver.resolve(template.title, context)
-            description = ""
-            if template.description:
-                description = self._resolver.resolve(template.description, context)
-            subtitle = None
-            if template.subtitle:
-                subtitle = self._resolver.resolve(template.subtitle, context)
-
-            # Prepend "Postponed: " label if applicable
-            if prepend_label:
-                title = f"{POSTPONED_LABEL}{title}"
-                if subtitle:
-                    subtitle = f"{POSTPONED_LABEL}{subtitle}"
-                if description:
-                    description = f"{POSTPONED_LABEL}{description}"
-
-            # Resolve art URL if present
-            # Unknown variables stay literal (e.g., {bad_var}) so user can identify issues
-            icon = self._resolver.resolve(template.art_url, context) if template.art_url else None
-
-            # Only include categories if categories_apply_to == "all"
-            # Filler never gets xmltv_flags (new/live/date are for live events only)
-            # Preserve user's original casing for custom categories
-            filler_categories = []
-            if config.categories_apply_to == "all":
-                # Resolve any {sport} variables in categories
-                for cat in config.xmltv_categories:
-                    if "{" in cat:
-                        filler_categories.append(self._resolver.resolve(cat, context))
-                    else:
-                        filler_categories.append(cat)
-
-            programme = Programme(
+            programme = FillerProgramme(
                 channel_id=channel_id,
                 title=title,
                 start=chunk_start,
@@ -512,13 +606,56 @@ class FillerGenerator:
                 subtitle=subtitle,
                 icon=icon,
                 filler_type=filler_type.value,  # 'pregame', 'postgame', or 'idle'
-                categories=filler_categories,
+                # Each programme gets its own list
+                categories=list(filler_categories),
                 # No xmltv_flags for filler - new/live/date are for live events only
-            )
+            ).freeze()
             programmes.append(programme)
 
         return programmes
 
+    def _resolve_filler_text(
+        self,
+        template: FillerTemplate,
+        context: TemplateContext,
+        config: FillerConfig,
+        prepend_label: bool,
+    ) -> tuple[str, str | None, str, str | None, list[str]]:
+        """Resolve a filler template to (title, subtitle, description, icon, categories)."""
+        title = self._resolver.resolve(template.title, context)
+        description = ""
+        if template.description:
+            description = self._resolver.resolve(template.description, context)
+        subtitle = None
+        if template.subtitle:
+            subtitle = self._resolver.resolve(template.subtitle, context)
+
+        # Prepend "Postponed: " label if applicable
+        if prepend_label:
+            title = f"{POSTPONED_LABEL}{title}"
+            if subtitle:
+                subtitle = f"{POSTPONED_LABEL}{subtitle}"
+            if description:
+                description = f"{POSTPONED_LABEL}{description}"
+
+        # Resolve art URL if present
+        # Unknown variables stay literal (e.g., {bad_var}) so user can identify issues
+        icon = self._resolver.resolve(template.art_url, context) if template.art_url else None
+
+        # Only include categories if categories_apply_to == "all"
+        # Filler never gets xmltv_flags (new/live/date are for live events only)
+        # Preserve user's original casing for custom categories
+        filler_categories = []
+        if config.categories_apply_to == "all":
+            # Resolve any {sport} variables in categories
+            for cat in config.xmltv_categories:
+                if "{" in cat:
+                    filler_categories.append(self._resolver.resolve(cat, context))
+                else:
+                    filler_categories.append(cat)
+
+        return title, subtitle, description, icon, filler_categories
+
     def _get_filler_template(
         self,
         filler_type: FillerType,
@@ -602,17 +739,22 @@ class FillerGenerator:
         """Check if event is final, refreshing status from provider if needed.
 
         Fetches fresh status via summary endpoint to get accurate final detection.
+        An event already final is final for good, so it skips the refresh.
         """
         if not event:
             return False
 
-        # Refresh event status from provider for accurate final detection
-        refreshed = self._service.refresh_event_status(event)
-
         # Use unified final status check
-        from teamarr.utilities.event_status import is_event_final
+        if is_event_final(event):
+            return True
 
-        return is_event_final(refreshed)
+        # Refresh event status from provider for accurate final detection
+        cache_key = (event.league, event.id)
+        is_final = self._final_checks.get(cache_key)
+        if is_final is None:
+            refreshed = self._service.refresh_event_status(event)
+            is_final = self._final_checks[cache_key] = is_event_final(refreshed)
+        return is_final
 
     def _build_filler_context(
         self,
@@ -620,12 +762,29 @@ class FillerGenerator:
         team_stats: TeamStats | None,
         next_event: Event | None = None,
         last_event: Event | None = None,
+        suffixes: frozenset[str] = _ALL_SUFFIXES,
     ) -> TemplateContext:
         """Build template context for filler content.
 
         For filler, game_context is None (no current game).
-        .next and .last contexts are populated from next/last events.
+        .next and .last contexts are populated from next/last events, for
+        the suffixes listed in suffixes only.
         """
+        if "next" not in suffixes:
+            next_event = None
+        if "last" not in suffixes:
+            last_event = None
+
+        # Fetch both opponents' stats together on the builder's I/O pool
+        # rather than one after the other
+        self._context_builder.prefetch_team_stats(
+            [
+                (ContextBuilder.opponent_of(e, team_config.team_id).id, team_config.league)
+                for e in (next_event, last_event)
+                if e is not None
+            ]
+        )
+
         next_game = None
         if next_event:
             next_game = self._build_game_context(
@@ -662,11 +821,11 @@ class FillerGenerator:
             league=league,
         )
 
-    def _estimate_event_end(self, event: Event) -> datetime:
+    def _estimate_event_end(self, event: Event, options: FillerOptions) -> datetime:
         """Estimate when an event ends based on sport duration."""
-        durations = self._options.sport_durations if self._options else {}
-        default = self._options.default_duration if self._options else 3.0
-        duration_hours = get_sport_duration(event.sport, durations, default)
+        duration_hours = get_sport_duration(
+            event.sport, options.sport_durations, options.default_duration
+        )
         return event.start_time + timedelta(hours=duration_hours)
 
     def _calculate_epg_start(
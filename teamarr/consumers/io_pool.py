@@ -0,0 +1,30 @@
+"""Process-wide worker pool for provider I/O during EPG generation.
+
+Provider fetches (team schedules, team and opponent stats) run here, while
+template work stays on the caller's worker. Tasks are leaf I/O calls that
+never submit to the pool themselves, so workers of other pools can wait on
+them without deadlocking.
+
+Configuration via environment variables:
+    ESPN_MAX_WORKERS: Pool size (default: 100), for users with DNS
+        throttling (PiHole, AdGuard)
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+IO_WORKERS = int(os.environ.get("ESPN_MAX_WORKERS", 100))
+
+_io_pool: ThreadPoolExecutor | None = None
+_io_pool_lock = threading.Lock()
+
+
+def get_io_pool() -> ThreadPoolExecutor:
+    """Get the shared pool for provider fetches (created on first use)."""
+    global _io_pool
+    if _io_pool is None:
+        with _io_pool_lock:
+            if _io_pool is None:
+                _io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="epg-io")
+    return _io_pool
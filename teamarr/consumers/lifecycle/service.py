@@ -12,6 +12,7 @@ from sqlite3 import Connection
 from typing import Any
 
 from teamarr.consumers.event_epg import POSTPONED_LABEL, is_event_postponed
+from teamarr.consumers.io_pool import get_io_pool
 from teamarr.core import Event
 from teamarr.templates import ContextBuilder, TemplateResolver
 
@@ -150,12 +151,16 @@ class ChannelLifecycleService:
         # Cache exception keywords
         self._exception_keywords: list | None = None
 
+        # Cache event template configs by template ID. A template row holds
+        # a dozen JSON columns; parse them once per run, not once per event.
+        self._event_template_configs: dict[int, Any] = {}
+
         # Pending profile changes for bulk application
         # Structure: {profile_id: {"add": set(channel_ids), "remove": set(channel_ids)}}
         self._pending_profile_changes: dict[int, dict[str, set[int]]] = {}
 
         # Template engine
-        self._context_builder = ContextBuilder(sports_service)
+        self._context_builder = ContextBuilder(sports_service, io_pool=get_io_pool())
         self._resolver = TemplateResolver()
 
         # External channel numbers from Dispatcharr (non-Teamarr channels)
@@ -199,6 +204,7 @@ class ChannelLifecycleService:
         if self._logo_manager:
             self._logo_manager.clear_cache()
         self._exception_keywords = None
+        self._event_template_configs = {}
         self._pending_profile_changes = {}
 
     def _collect_profile_change(
@@ -329,9 +335,13 @@ class ChannelLifecycleService:
         template_id = get_template_for_event(conn, group_id, event_sport, event_league)
 
         if template_id:
+            if template_id in self._event_template_configs:
+                return self._event_template_configs[template_id]
             template = get_template(conn, template_id)
             if template:
-                return template_to_event_config(template)
+                config = template_to_event_config(template)
+                self._event_template_configs[template_id] = config
+                return config
             logger.warning(
                 "[LIFECYCLE] Template %s not found for event %s",
                 template_id,
@@ -851,7 +861,7 @@ class ChannelLifecycleService:
                         "reason": "no_existing_channel_for_add_only",
                     }
                 )
-                logger.debug(f"Skipped '{stream_name}' - add_only mode and no existing channel")
+                logger.debug("Skipped '%s' - add_only mode and no existing channel", stream_name)
                 return result
             else:
                 # add_stream or skip mode with no existing channel: create new
@@ -2730,7 +2740,7 @@ class ChannelLifecycleService:
             result["errors"].append({"error": str(e)})
 
         if result["deleted"]:
-            logger.info(f"Cleaned up {len(result['deleted'])} channel(s) from disabled groups")
+            logger.info("Cleaned up %d channel(s) from disabled groups", len(result["deleted"]))
 
         return result
 
@@ -28,7 +28,7 @@ class StreamCategory(Enum):
     PLACEHOLDER = "placeholder"  # No event info, skip
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassifiedStream:
     """Result of stream classification with extracted components."""
 
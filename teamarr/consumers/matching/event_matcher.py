@@ -26,6 +26,7 @@ from teamarr.consumers.stream_match_cache import StreamMatchCache, event_to_cach
 from teamarr.core.types import Event
 from teamarr.services.sports_data import SportsDataService
 from teamarr.utilities.fuzzy_match import normalize_text
+from teamarr.utilities.tz import local_date
 
 logger = logging.getLogger(__name__)
 
@@ -137,7 +138,7 @@ class EventCardMatcher:
             )
 
         # Filter to events on target date
-        date_events = [e for e in events if e.start_time.astimezone(user_tz).date() == target_date]
+        date_events = [e for e in events if local_date(e.start_ts, user_tz) == target_date]
 
         if not date_events:
             return MatchOutcome.failed(
@@ -172,16 +173,15 @@ class EventCardMatcher:
         # Reconstruct event
         from teamarr.consumers.matching.team_matcher import TeamMatcher
 
-        # Reuse reconstruction logic (bit of a hack but avoids duplication)
-        matcher = TeamMatcher(self._service, self._cache)
-        event = matcher._reconstruct_event(entry.cached_data)
+        # Reuse reconstruction logic (static, so no matcher is built per hit)
+        event = TeamMatcher._reconstruct_event(entry.cached_data)
 
         if not event:
             self._cache.delete(ctx.group_id, ctx.stream_id, ctx.stream_name)
             return None
 
         # Validate date
-        event_date = event.start_time.astimezone(ctx.user_tz).date()
+        event_date = local_date(event.start_ts, ctx.user_tz)
         if event_date != ctx.target_date:
             return None
 
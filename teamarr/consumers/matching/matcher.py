@@ -21,7 +21,10 @@ Usage:
 """
 
 import logging
+import os
+import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from zoneinfo import ZoneInfo
@@ -56,6 +59,15 @@ from teamarr.utilities.event_status import is_event_final
 
 logger = logging.getLogger(__name__)
 
+# Parallel workers for event prefetch API calls
+# Configurable via ESPN_MAX_WORKERS for users with DNS throttling (PiHole, AdGuard)
+MAX_WORKERS = int(os.environ.get("ESPN_MAX_WORKERS", 50))
+
+# Minimum seconds between per-stream progress callbacks (the last stream
+# always reports). Thousands of streams match in a few seconds, far faster
+# than any progress display needs.
+PROGRESS_INTERVAL = 0.25
+
 
 @dataclass
 class MatchedStreamResult:
@@ -122,29 +134,59 @@ class BatchMatchResult:
     # Aggregated stats
     aggregator: ResultAggregator = field(default_factory=ResultAggregator)
 
+    # (len(results), (matched, included, unmatched, excluded)) from _counts()
+    _counts_memo: tuple[int, tuple[int, int, int, int]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def total(self) -> int:
         return len(self.results)
 
+    def _counts(self) -> tuple[int, int, int, int]:
+        """Tally (matched, included, unmatched, excluded) in one pass.
+
+        Results are only ever appended, so the tally is reused until the
+        list grows.
+        """
+        memo = self._counts_memo
+        if memo is not None and memo[0] == len(self.results):
+            return memo[1]
+
+        matched = included = unmatched = excluded = 0
+        for r in self.results:
+            if r.included:
+                included += 1
+            if r.matched:
+                matched += 1
+                if not r.included:
+                    excluded += 1
+            elif not r.is_exception:
+                unmatched += 1
+
+        counts = (matched, included, unmatched, excluded)
+        self._counts_memo = (len(self.results), counts)
+        return counts
+
     @property
     def matched_count(self) -> int:
         """Count of streams that matched to an event (includes excluded)."""
-        return sum(1 for r in self.results if r.matched)
+        return self._counts()[0]
 
     @property
     def included_count(self) -> int:
         """Count of streams that will be included in output (matched AND not excluded)."""
-        return sum(1 for r in self.results if r.included)
+        return self._counts()[1]
 
     @property
     def unmatched_count(self) -> int:
         """Count of streams that failed to match."""
-        return sum(1 for r in self.results if not r.matched and not r.is_exception)
+        return self._counts()[2]
 
     @property
     def excluded_count(self) -> int:
         """Count of streams that matched but were excluded."""
-        return sum(1 for r in self.results if r.matched and not r.included)
+        return self._counts()[3]
 
     @property
     def cache_hit_rate(self) -> float:
@@ -330,6 +372,7 @@ class StreamMatcher:
         )
 
         total_streams = len(streams)
+        last_progress = 0.0
         for idx, stream in enumerate(streams, 1):
             stream_id = stream.get("id", 0)
             stream_name = stream.get("name", "")
@@ -348,9 +391,12 @@ class StreamMatcher:
 
             result.results.append(match_result)
 
-            # Report per-stream progress
+            # Report progress, coalesced to at most one call per PROGRESS_INTERVAL
             if progress_callback:
-                progress_callback(idx, total_streams, stream_name, match_result.matched)
+                now = time.monotonic()
+                if idx == total_streams or now - last_progress >= PROGRESS_INTERVAL:
+                    last_progress = now
+                    progress_callback(idx, total_streams, stream_name, match_result.matched)
 
         logger.info(
             "[COMPLETED] Stream matching: %d/%d matched (%d included), cache_hit_rate=%.1f%%",
@@ -390,14 +436,17 @@ class StreamMatcher:
         self._prefetched_events = {}
         total_events = 0
         shared_hits = 0
-        service_calls = 0
 
         total_leagues = len(self._search_leagues)
-        num_dates = MATCH_WINDOW_DAYS + self._days_ahead + 1
-        total_leagues * num_dates
 
-        for league_idx, league in enumerate(self._search_leagues):
-            league_events: list[Event] = []
+        # Pass 1: resolve each league/date from shared_events, or plan a fetch.
+        # Per league, each date slot holds either events or an index into fetches.
+        league_slots: list[tuple[str, list[list[Event] | int]]] = []
+        fetches: list[tuple[str, date, bool]] = []  # (league, fetch_date, cache_only)
+        planned: dict[str, int] = {}  # shared_key -> index into fetches
+
+        for league in self._search_leagues:
+            slots: list[list[Event] | int] = []
             is_tsdb = self._service.get_provider_name(league) == "tsdb"
             is_group_league = league in self._include_leagues
 
@@ -431,20 +480,50 @@ class StreamMatcher:
                     # Don't use if: empty + was_cache_only + we need this league
                     # (empty from cache miss shouldn't block groups that need API data)
                     if shared_events or not was_cache_only or not is_group_league:
-                        league_events.extend(shared_events)
+                        slots.append(shared_events)
                         shared_hits += 1
                         continue
                     # Fall through to fetch fresh if empty cache-only result
                     # and this group actually needs the league
 
-                events = self._service.get_events(league, fetch_date, cache_only=cache_only)
-                service_calls += 1
-                league_events.extend(events)
-
-                # Store result in shared cache for subsequent matchers
-                # Include was_cache_only flag so later groups can decide whether to re-fetch
-                if self._shared_events is not None:
-                    self._shared_events[shared_key] = (events, cache_only)
+                if shared_key not in planned:
+                    planned[shared_key] = len(fetches)
+                    fetches.append((league, fetch_date, cache_only))
+                slots.append(planned[shared_key])
+
+            league_slots.append((league, slots))
+
+        # Pass 2: run the fetches. API fetches are network-bound, so they are
+        # all submitted to a pool up front; cache-only lookups are in-memory
+        # and run inline while those are in flight.
+        results: list[list[Event]] = [[] for _ in fetches]
+        api_indices = [i for i, (_, _, cache_only) in enumerate(fetches) if not cache_only]
+        if status_callback and api_indices:
+            status_callback(f"Fetching events: {len(api_indices)} league-days from API")
+
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(api_indices)))) as pool:
+            futures = {
+                i: pool.submit(self._service.get_events, fetches[i][0], fetches[i][1])
+                for i in api_indices
+            }
+            for i, (league, fetch_date, cache_only) in enumerate(fetches):
+                if cache_only:
+                    results[i] = self._service.get_events(league, fetch_date, cache_only=True)
+            for i, future in futures.items():
+                results[i] = future.result()
+
+        # Store results in shared cache for subsequent matchers
+        # Include was_cache_only flag so later groups can decide whether to re-fetch
+        if self._shared_events is not None:
+            for (league, fetch_date, cache_only), events in zip(fetches, results, strict=True):
+                self._shared_events[f"{league}:{fetch_date.isoformat()}"] = (events, cache_only)
+        service_calls = len(fetches)
+
+        # Pass 3: assemble per-league event lists in league/date order
+        for league_idx, (league, slots) in enumerate(league_slots):
+            league_events: list[Event] = []
+            for slot in slots:
+                league_events.extend(results[slot] if isinstance(slot, int) else slot)
 
             if league_events:
                 self._prefetched_events[league] = league_events
@@ -452,16 +531,20 @@ class StreamMatcher:
 
             # Report progress periodically (every 20 leagues or at end)
             if status_callback and (league_idx % 20 == 0 or league_idx == total_leagues - 1):
-                int((league_idx + 1) / total_leagues * 100)
                 status_callback(
                     f"Prefetching events: {league_idx + 1}/{total_leagues} leagues "
                     f"({total_events} events, {shared_hits} reused)"
                 )
 
         logger.debug(
-            f"Prefetched {total_events} events from {len(self._prefetched_events)} leagues "
-            f"(window: -{MATCH_WINDOW_DAYS} to +{self._days_ahead} days, "
-            f"shared_hits={shared_hits}, service_calls={service_calls})"
+            "Prefetched %d events from %d leagues "
+            "(window: -%d to +%d days, shared_hits=%d, service_calls=%d)",
+            total_events,
+            len(self._prefetched_events),
+            MATCH_WINDOW_DAYS,
+            self._days_ahead,
+            shared_hits,
+            service_calls,
         )
 
     def _match_single(
@@ -20,7 +20,7 @@ from teamarr.utilities.constants import BROADCAST_NETWORKS, CITY_TRANSLATIONS, P
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedStream:
     """Result of stream normalization with extracted metadata."""
 
@@ -159,7 +159,7 @@ class ExcludedReason(Enum):
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchOutcome:
     """Unified result object for stream matching.
 
@@ -7,7 +7,10 @@ Supports two modes:
 """
 
 import logging
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta
 from typing import Any
@@ -33,9 +36,37 @@ from teamarr.core.types import Event, Team
 from teamarr.services.sports_data import SportsDataService
 from teamarr.utilities.constants import TEAM_ALIASES
 from teamarr.utilities.fuzzy_match import get_matcher, normalize_text
+from teamarr.utilities.tz import local_date, parse_iso_datetime
 
 logger = logging.getLogger(__name__)
 
+# Concurrent day fetches across all window lookups (only API days are
+# submitted). Streams are matched in parallel, so their days share one
+# bounded pool rather than each starting its own; capped by ESPN_MAX_WORKERS
+# for users with DNS throttling (PiHole, AdGuard).
+WINDOW_FETCH_WORKERS = min(8, int(os.environ.get("ESPN_MAX_WORKERS", 50)))
+
+# Shared window fetch pool, created on first use (see _get_window_pool)
+_window_pool: ThreadPoolExecutor | None = None
+_window_pool_lock = threading.Lock()
+
+
+def _get_window_pool() -> ThreadPoolExecutor:
+    """Get (creating on first use) the pool for window day fetches.
+
+    Its tasks are single get_events calls that never submit to the pool
+    themselves, so matcher workers can wait on them without deadlocking.
+    """
+    global _window_pool
+    if _window_pool is None:
+        with _window_pool_lock:
+            if _window_pool is None:
+                _window_pool = ThreadPoolExecutor(
+                    max_workers=WINDOW_FETCH_WORKERS, thread_name_prefix="match-window"
+                )
+    return _window_pool
+
+
 # Type alias for user-defined aliases: (alias_text, league) -> team_name
 UserAliasCache = dict[tuple[str, str], str]
 
@@ -69,8 +100,7 @@ class MatchContext:
 
         Final/completed status is NOT checked here - lifecycle handles exclusions.
         """
-        event_start = event.start_time.astimezone(self.user_tz)
-        event_date = event_start.date()
+        event_date = local_date(event.start_ts, self.user_tz)
 
         earliest_date = self.target_date - timedelta(days=MATCH_WINDOW_DAYS)
 
@@ -190,13 +220,7 @@ class TeamMatcher:
         # - Today + future: fetch from API (ESPN)
         # - Past: always use cache
         # - TSDB leagues: always cache-only
-        is_tsdb = self._service.get_provider_name(league) == "tsdb"
-        events = []
-        for offset in range(-MATCH_WINDOW_DAYS, self._days_ahead + 1):
-            fetch_date = target_date + timedelta(days=offset)
-            # Today and future: fetch from API; Past/TSDB: cache only
-            cache_only = is_tsdb or offset < 0
-            events.extend(self._service.get_events(league, fetch_date, cache_only=cache_only))
+        events = self._fetch_window_events(league, target_date)
 
         if not events:
             return MatchOutcome.failed(
@@ -321,14 +345,8 @@ class TeamMatcher:
         else:
             # Fallback: fetch events per-stream (slower, used when no prefetch)
             for league in leagues_to_search:
-                is_tsdb = self._service.get_provider_name(league) == "tsdb"
-                for offset in range(-MATCH_WINDOW_DAYS, self._days_ahead + 1):
-                    fetch_date = target_date + timedelta(days=offset)
-                    # Today and future: fetch from API; Past/TSDB: cache only
-                    cache_only = is_tsdb or offset < 0
-                    events = self._service.get_events(league, fetch_date, cache_only=cache_only)
-                    for event in events:
-                        all_events.append((league, event))
+                for event in self._fetch_window_events(league, target_date):
+                    all_events.append((league, event))
 
         if not all_events:
             return MatchOutcome.failed(
@@ -360,6 +378,38 @@ class TeamMatcher:
     # PRIVATE METHODS
     # =========================================================================
 
+    def _fetch_window_events(self, league: str, target_date: date) -> list[Event]:
+        """Fetch a league's events from MATCH_WINDOW_DAYS back to days_ahead.
+
+        Today and future days come from the API (except for TSDB leagues) and
+        are fetched concurrently on the shared window pool; past days and
+        TSDB are cache-only lookups, run inline while those are in flight.
+        Events are returned in date order.
+        """
+        is_tsdb = self._service.get_provider_name(league) == "tsdb"
+        fetch_dates = [
+            target_date + timedelta(days=offset)
+            for offset in range(-MATCH_WINDOW_DAYS, self._days_ahead + 1)
+        ]
+        # Today and future: fetch from API; Past/TSDB: cache only
+        api_dates = [] if is_tsdb else [d for d in fetch_dates if d >= target_date]
+
+        by_date: dict[date, list[Event]] = {}
+        futures = {}
+        if api_dates:
+            pool = _get_window_pool()
+            futures = {d: pool.submit(self._service.get_events, league, d) for d in api_dates}
+        for fetch_date in fetch_dates:
+            if fetch_date not in futures:
+                by_date[fetch_date] = self._service.get_events(league, fetch_date, cache_only=True)
+        for fetch_date, future in futures.items():
+            by_date[fetch_date] = future.result()
+
+        events: list[Event] = []
+        for fetch_date in fetch_dates:
+            events.extend(by_date[fetch_date])
+        return events
+
     def _check_cache(self, ctx: MatchContext) -> MatchOutcome | None:
         """Check cache for existing match.
 
@@ -404,7 +454,7 @@ class TeamMatcher:
         # V1 Parity: Cached events from yesterday should be re-matched to get fresh status.
         # The cached event has OLD status from when it was cached, which may have
         # changed to "final". Re-matching ensures we get current status from ESPN.
-        event_date = event.start_time.astimezone(ctx.user_tz).date()
+        event_date = local_date(event.start_ts, ctx.user_tz)
         if event_date < ctx.target_date:
             # Event is from a previous day - invalidate cache to get fresh status
             logger.debug(
@@ -475,14 +525,14 @@ class TeamMatcher:
             if not ctx.is_event_in_search_window(event):
                 continue
 
-            event_date = event.start_time.astimezone(ctx.user_tz).date()
+            event_date = local_date(event.start_ts, ctx.user_tz)
 
             # Check for date mismatch from stream (if extracted)
             # Use stream_tz if available - the date in the stream name is in the provider's timezone
             if ctx.classified.normalized.extracted_date:
                 # Get event date in the stream's timezone (or user_tz as fallback)
                 compare_tz = ctx.stream_tz or ctx.user_tz
-                event_date_in_stream_tz = event.start_time.astimezone(compare_tz).date()
+                event_date_in_stream_tz = local_date(event.start_ts, compare_tz)
                 if ctx.classified.normalized.extracted_date != event_date_in_stream_tz:
                     continue
 
@@ -515,13 +565,11 @@ class TeamMatcher:
                 time_distance = 999999
                 if ctx.classified.normalized.extracted_time:
                     time_tz = ctx.stream_tz or ctx.user_tz
-                    ref_date = event.start_time.astimezone(time_tz).date()
+                    ref_date = local_date(event.start_ts, time_tz)
                     stream_dt = datetime.combine(
                         ref_date, ctx.classified.normalized.extracted_time, tzinfo=time_tz
                     )
-                    time_distance = abs(
-                        int((event.start_time.astimezone(time_tz) - stream_dt).total_seconds())
-                    )
+                    time_distance = abs(int((event.start_time - stream_dt).total_seconds()))
 
                 # Ranking: score > time proximity > future over past > date proximity
                 is_better = False
@@ -628,14 +676,14 @@ class TeamMatcher:
             if not ctx.is_event_in_search_window(event):
                 continue
 
-            event_date = event.start_time.astimezone(ctx.user_tz).date()
+            event_date = local_date(event.start_ts, ctx.user_tz)
 
             # Check for date mismatch from stream (if extracted)
             # Use stream_tz if available - the date in the stream name is in the provider's timezone
             if ctx.classified.normalized.extracted_date:
                 # Get event date in the stream's timezone (or user_tz as fallback)
                 compare_tz = ctx.stream_tz or ctx.user_tz
-                event_date_in_stream_tz = event.start_time.astimezone(compare_tz).date()
+                event_date_in_stream_tz = local_date(event.start_ts, compare_tz)
                 if ctx.classified.normalized.extracted_date != event_date_in_stream_tz:
                     continue
 
@@ -668,13 +716,11 @@ class TeamMatcher:
                 time_distance = 999999
                 if ctx.classified.normalized.extracted_time:
                     time_tz = ctx.stream_tz or ctx.user_tz
-                    ref_date = event.start_time.astimezone(time_tz).date()
+                    ref_date = local_date(event.start_ts, time_tz)
                     stream_dt = datetime.combine(
                         ref_date, ctx.classified.normalized.extracted_time, tzinfo=time_tz
                     )
-                    time_distance = abs(
-                        int((event.start_time.astimezone(time_tz) - stream_dt).total_seconds())
-                    )
+                    time_distance = abs(int((event.start_time - stream_dt).total_seconds()))
 
                 # Ranking: score > time proximity > future over past > date proximity
                 is_better = False
@@ -1052,9 +1098,7 @@ class TeamMatcher:
         """
         reverse: dict[str, list[tuple[str, str]]] = {}
         for (alias, league), canonical in self._user_aliases.items():
-            if alias not in reverse:
-                reverse[alias] = []
-            reverse[alias].append((canonical, league))
+            reverse.setdefault(alias, []).append((canonical, league))
 
         if reverse:
             logger.debug(
@@ -1126,9 +1170,10 @@ class TeamMatcher:
             return None
 
         # Collect candidate leagues from aliases (only those that are enabled)
+        enabled = {lg.lower() for lg in enabled_leagues}
         candidate_leagues: set[str] = set()
         for _canonical, league in team1_aliases + team2_aliases:
-            if league and league.lower() in [lg.lower() for lg in enabled_leagues]:
+            if league and league.lower() in enabled:
                 candidate_leagues.add(league.lower())
 
         logger.debug(
@@ -1221,10 +1266,10 @@ class TeamMatcher:
             return events[0] if events else None
 
         # Combine stream time with event date
-        ref_date = events[0].start_time.astimezone(user_tz).date()
+        ref_date = local_date(events[0].start_ts, user_tz)
         stream_dt = datetime.combine(ref_date, stream_time, tzinfo=user_tz)
 
-        return min(events, key=lambda e: abs(e.start_time.astimezone(user_tz) - stream_dt))
+        return min(events, key=lambda e: abs(e.start_time - stream_dt))
 
     def _cache_result(self, ctx: MatchContext, result: MatchOutcome) -> None:
         """Cache a successful match."""
@@ -1247,13 +1292,14 @@ class TeamMatcher:
             match_method=match_method_value,
         )
 
-    def _reconstruct_event(self, cached_data: dict[str, Any]) -> Event | None:
+    @staticmethod
+    def _reconstruct_event(cached_data: dict[str, Any]) -> Event | None:
         """Reconstruct Event from cached dict."""
         try:
             # Handle datetime parsing
             start_time = cached_data.get("start_time")
             if isinstance(start_time, str):
-                start_time = datetime.fromisoformat(start_time)
+                start_time = parse_iso_datetime(start_time)
 
             # Reconstruct teams (use `or {}` to handle explicit None values)
             home_data = cached_data.get("home_team") or {}
@@ -1296,11 +1342,11 @@ class TeamMatcher:
             # Handle broadcast/broadcasts field compatibility
             broadcast_val = cached_data.get("broadcasts") or cached_data.get("broadcast")
             broadcasts = (
-                broadcast_val
+                tuple(broadcast_val)
                 if isinstance(broadcast_val, list)
-                else [broadcast_val]
+                else (broadcast_val,)
                 if broadcast_val
-                else []
+                else ()
             )
 
             # Reconstruct Venue from dict if present
@@ -1325,14 +1371,14 @@ class TeamMatcher:
             segment_times = {}
             for seg_name, seg_time in segment_times_data.items():
                 if isinstance(seg_time, str):
-                    segment_times[seg_name] = datetime.fromisoformat(seg_time)
+                    segment_times[seg_name] = parse_iso_datetime(seg_time)
                 elif seg_time is not None:
                     segment_times[seg_name] = seg_time
 
             # Parse main_card_start if present
             main_card_start = cached_data.get("main_card_start")
             if isinstance(main_card_start, str):
-                main_card_start = datetime.fromisoformat(main_card_start)
+                main_card_start = parse_iso_datetime(main_card_start)
 
             return Event(
                 id=cached_data.get("id", ""),
@@ -11,6 +11,7 @@ from datetime import date, datetime
 
 from teamarr.consumers.event_epg import EventEPGGenerator, EventEPGOptions
 from teamarr.consumers.team_epg import TeamEPGGenerator, TeamEPGOptions
+from teamarr.consumers.team_processor import get_team_pool
 from teamarr.core import Programme, TemplateConfig
 from teamarr.services import SportsDataService
 from teamarr.utilities.xmltv import programmes_to_xmltv
@@ -74,13 +75,11 @@ class Orchestrator:
             base_options.output_days_ahead,
         )
 
-        all_programmes: list[Programme] = []
-
-        for config in team_configs:
+        def generate_team(config: TeamChannelConfig) -> list[Programme]:
             # Build per-team options with template from config
             team_options = self._build_team_options(config, base_options)
 
-            programmes = self._team_generator.generate(
+            return self._team_generator.generate(
                 team_id=config.team_id,
                 league=config.league,
                 channel_id=config.channel_id,
@@ -89,7 +88,16 @@ class Orchestrator:
                 logo_url=config.logo_url,
                 options=team_options,
             )
-            all_programmes.extend(programmes)
+
+        all_programmes: list[Programme] = []
+
+        # Teams are I/O bound (schedule, stats, scoreboard fetches): submit all
+        # of them before reading any result, then collect in config order so
+        # the XMLTV output stays deterministic.
+        executor = get_team_pool()
+        futures = [executor.submit(generate_team, config) for config in team_configs]
+        for future in futures:
+            all_programmes.extend(future.result())
 
         channels = [
             {
@@ -26,7 +26,7 @@ import json
 import logging
 import sqlite3
 from collections.abc import Callable
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime
 from typing import Any
 
@@ -34,6 +34,9 @@ from teamarr.core import Event
 
 logger = logging.getLogger(__name__)
 
+# Event fields stored in cached_event_data (start_ts is derived on reconstruction)
+_EVENT_CACHE_FIELDS = tuple(f.name for f in fields(Event) if f.init)
+
 
 def compute_fingerprint(group_id: int, stream_id: int, stream_name: str) -> str:
     """Compute SHA256 fingerprint for cache lookup.
@@ -644,13 +647,30 @@ def event_to_cache_data(event: Event) -> dict[str, Any]:
     Dynamic fields (scores, status) should be refreshed on each run
     via the single event endpoint.
 
+    Every stream matched to the same event caches the same data, so the
+    dict is built once and kept on the event. Callers must not mutate it.
+
     Args:
         event: Event to convert
 
     Returns:
         Dict suitable for JSON serialization
     """
-    return asdict(event)
+    if event._cache_data is not None:
+        return event._cache_data
+
+    # Shallow field copy - the dict is serialized straight away, so the
+    # recursive deep copy dataclasses.asdict() makes is wasted work
+    data = {name: getattr(event, name) for name in _EVENT_CACHE_FIELDS}
+    data["start_time"] = event.start_iso
+    # NamedTuple fields are stored as dicts
+    data["home_team"] = event.home_team._asdict()
+    data["away_team"] = event.away_team._asdict()
+    data["status"] = event.status._asdict()
+    data["venue"] = event.venue._asdict() if event.venue else None
+    data["bouts"] = [asdict(bout) for bout in event.bouts]
+    event._cache_data = data
+    return data
 
 
 def _json_serializer(obj: Any) -> Any:
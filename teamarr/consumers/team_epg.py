@@ -8,19 +8,21 @@ Data flow:
 """
 
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import sys
 from dataclasses import dataclass, field
-from datetime import timedelta
+from datetime import datetime, time, timedelta
+from operator import attrgetter
 from typing import Any
 
 from teamarr.consumers.event_epg import prepend_postponed_label
-from teamarr.core import Event, Programme, TemplateConfig
+from teamarr.consumers.io_pool import get_io_pool
+from teamarr.core import Event, EventTable, Programme, TemplateConfig
 from teamarr.services import SportsDataService
 from teamarr.templates.context_builder import ContextBuilder
 from teamarr.templates.resolver import TemplateResolver
 from teamarr.utilities.event_status import is_event_final
 from teamarr.utilities.sports import get_effective_duration
-from teamarr.utilities.tz import now_user, to_user_tz
+from teamarr.utilities.tz import get_user_timezone, now_user
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +66,10 @@ class TeamEPGOptions:
     # for events with status.state == "postponed"
     prepend_postponed_label: bool = True
 
+    # Reference "now" for the output window. Batch runs set one value for
+    # every team so they all share a window; None means now_user() per call.
+    generation_time: datetime | None = None
+
     # Backwards compatibility
     @property
     def days_ahead(self) -> int:
@@ -79,7 +85,8 @@ class TeamEPGGenerator:
 
     def __init__(self, service: SportsDataService):
         self._service = service
-        self._context_builder = ContextBuilder(service)
+        # Stats fetches run on the shared I/O pool, like schedule fetches
+        self._context_builder = ContextBuilder(service, io_pool=get_io_pool())
         self._resolver = TemplateResolver()
         self._filler_generator = None  # Lazy loaded
 
@@ -172,6 +179,9 @@ class TeamEPGGenerator:
             List of Programme entries for XMLTV
         """
         options = options or TeamEPGOptions()
+        # Providers intern team ids, so interning ours lets the per-event
+        # home/away comparisons succeed on identity
+        team_id = sys.intern(str(team_id))
 
         logger.debug(
             "[STARTED] Team EPG: team=%s league=%s days=%d",
@@ -211,7 +221,9 @@ class TeamEPGGenerator:
                 f"{effective_schedule_days} days for accurate 'next game' info"
             )
 
-        # Fetch team schedule from all leagues (parallel for multi-league teams)
+        # Fetch team schedule from all leagues and team stats concurrently:
+        # they are independent provider calls, so one team costs one
+        # round-trip of latency instead of one per call
         all_events: list[Event] = []
         seen_event_ids: set = set()
 
@@ -222,72 +234,83 @@ class TeamEPGGenerator:
                 days_ahead=effective_schedule_days,
             )
 
-        # Single league: fetch directly (no thread overhead)
-        # Multi-league: fetch in parallel (e.g., soccer teams in 6+ competitions)
-        if len(leagues_to_fetch) == 1:
-            events = fetch_league(leagues_to_fetch[0])
-            all_events.extend(events)
-            seen_event_ids.update(e.id for e in events)
-        else:
-            with ThreadPoolExecutor(max_workers=len(leagues_to_fetch)) as executor:
-                futures = {executor.submit(fetch_league, lg): lg for lg in leagues_to_fetch}
-                for future in as_completed(futures):
-                    events = future.result()
-                    # Dedupe by event ID across leagues
-                    for event in events:
-                        if event.id not in seen_event_ids:
-                            seen_event_ids.add(event.id)
-                            all_events.append(event)
-
-        # Fetch team stats once for all events
-        team_stats = self._service.get_team_stats(team_id, league)
+        io_pool = get_io_pool()
+        # Through the context builder's stats cache: it lives for the whole
+        # batch and is locked per key, so a team that is also another team's
+        # opponent has its stats fetched once per run
+        stats_future = io_pool.submit(self._context_builder.get_team_stats, team_id, league)
+        schedule_futures = [io_pool.submit(fetch_league, lg) for lg in leagues_to_fetch]
+        for future in schedule_futures:
+            # Dedupe by event ID across leagues (e.g., soccer teams in 6+ competitions)
+            for event in future.result():
+                if event.id not in seen_event_ids:
+                    seen_event_ids.add(event.id)
+                    all_events.append(event)
+
+        # Team stats are shared by all events
+        team_stats = stats_future.result()
 
         # Sort events by time to determine next/last relationships
-        sorted_events = sorted(all_events, key=lambda e: e.start_time)
+        table = EventTable.from_events(all_events)
+        sorted_events = table.events
 
         # Calculate output window
-        now = now_user()
+        now = options.generation_time or now_user()
         today = now.date()
         # EPG start: lookback_hours before now (for recently finished games)
         output_start_time = now - timedelta(hours=options.lookback_hours)
         # EPG end: output_days_ahead from today
         output_cutoff_date = today + timedelta(days=options.output_days_ahead)
 
+        # Window bounds as Unix timestamps, so the window is found by bisecting
+        # the table's start_ts column. The end is midnight (user timezone)
+        # after the cutoff date, i.e. the first instant whose user-tz date is
+        # past output_cutoff_date.
+        output_start_ts = output_start_time.timestamp()
+        output_end_ts = datetime.combine(
+            output_cutoff_date + timedelta(days=1), time.min, tzinfo=get_user_timezone()
+        ).timestamp()
+
+        # V1 Parity: Use template custom duration if set
+        template_dict = (
+            {
+                "game_duration_mode": options.template.game_duration_mode,
+                "game_duration_override": options.template.game_duration_override,
+            }
+            if options.template
+            else None
+        )
+
         programmes = []
         included_events = []  # Track events that generated programmes (for filler)
 
-        for i, event in enumerate(sorted_events):
-            # Determine next/last events for suffix resolution
-            # (uses full schedule for accurate .next vars)
-            next_event = sorted_events[i + 1] if i + 1 < len(sorted_events) else None
-            last_event = sorted_events[i - 1] if i > 0 else None
+        # Events are sorted, so the output window is one contiguous index range
+        window = table.window(output_start_ts, output_end_ts)
 
-            # Build template context (always build for .next/.last vars)
-            context = self._context_builder.build_for_event(
-                event=event,
-                team_id=team_id,
-                league=league,
-                team_stats=team_stats,
-                next_event=next_event,
-                last_event=last_event,
-            )
+        # Opponent stats for the window's events and their neighbours (the
+        # .next/.last games of programmes and fillers) are fetched up front
+        # on the I/O pool, so the template loop below is CPU-only
+        neighbours = sorted_events[max(window.start - 1, 0) : window.stop + 1]
+        self._context_builder.prefetch_team_stats(
+            (ContextBuilder.opponent_of(e, team_id).id, league) for e in neighbours
+        )
+
+        # Durations depend only on sport for a given team/template, so each
+        # is resolved once rather than per event (and again per programme)
+        durations: dict[str, float] = {}
+
+        for i in window:
+            event = sorted_events[i]
 
             # Calculate when this event's programme would end
-            # V1 Parity: Use template custom duration if set
-            template_dict = (
-                {
-                    "game_duration_mode": options.template.game_duration_mode,
-                    "game_duration_override": options.template.game_duration_override,
-                }
-                if options.template
-                else None
-            )
-            duration = get_effective_duration(
-                event.sport,
-                options.sport_durations,
-                options.default_duration_hours,
-                template=template_dict,
-            )
+            duration = durations.get(event.sport)
+            if duration is None:
+                duration = durations[event.sport] = get_effective_duration(
+                    event.sport,
+                    options.sport_durations,
+                    options.default_duration_hours,
+                    template=template_dict,
+                )
             event_end = event.start_time + timedelta(hours=duration)
 
             # Skip completed (final) events - matching V1 logic:
@@ -303,17 +326,20 @@ class TeamEPGGenerator:
                     continue
                 # else: Today's final with include_final_events=True - include it
 
-            # Skip events before the lookback window
-            # Use event start time (in user timezone) for comparison
-            event_start_user = to_user_tz(event.start_time)
-            if event_start_user < output_start_time:
-                continue
+            # Determine next/last events for suffix resolution
+            # (uses full schedule for accurate .next vars)
+            next_event = sorted_events[i + 1] if i + 1 < len(sorted_events) else None
+            last_event = sorted_events[i - 1] if i > 0 else None
 
-            # Skip events beyond the output window
-            # Compare dates in user timezone to match filler generation behavior
-            event_date = event_start_user.date()
-            if event_date > output_cutoff_date:
-                continue
+            # Build template context only for events that will get a programme
+            context = self._context_builder.build_for_event(
+                event=event,
+                team_id=team_id,
+                league=league,
+                team_stats=team_stats,
+                next_event=next_event,
+                last_event=last_event,
+            )
 
             # Generate programme with template resolution
             programme = self._event_to_programme(
@@ -322,6 +348,7 @@ class TeamEPGGenerator:
                 channel_id=channel_id,
                 logo_url=logo_url,
                 options=options,
+                stop=event_end,
             )
             if programme:
                 programmes.append(programme)
@@ -347,7 +374,7 @@ class TeamEPGGenerator:
             programmes.extend(filler_programmes)
 
         # Sort all programmes by start time
-        programmes.sort(key=lambda p: p.start)
+        programmes.sort(key=attrgetter("start"))
 
         logger.debug(
             "[COMPLETED] Team EPG: team=%s events=%d programmes=%d filler=%s",
@@ -366,25 +393,14 @@ class TeamEPGGenerator:
         channel_id: str,
         logo_url: str | None,
         options: TeamEPGOptions,
+        stop: datetime,
     ) -> Programme | None:
-        """Convert an Event to a Programme with template resolution."""
+        """Convert an Event to a Programme with template resolution.
+
+        stop is the programme end, already computed by the caller from the
+        effective game duration.
+        """
         start = event.start_time - timedelta(minutes=options.pregame_minutes)
-        # V1 Parity: Use template custom duration if set
-        template_dict = (
-            {
-                "game_duration_mode": options.template.game_duration_mode,
-                "game_duration_override": options.template.game_duration_override,
-            }
-            if options.template
-            else None
-        )
-        duration = get_effective_duration(
-            event.sport,
-            options.sport_durations,
-            options.default_duration_hours,
-            template=template_dict,
-        )
-        stop = event.start_time + timedelta(hours=duration)
 
         # Resolve templates
         title = self._resolver.resolve(options.template.title_format, context)
@@ -440,7 +456,7 @@ class TeamEPGGenerator:
             categories=resolved_categories,
             xmltv_flags=options.template.xmltv_flags,
             xmltv_video=options.template.xmltv_video,
-        )
+        ).freeze()
 
     def _generate_fillers(
         self,
@@ -463,7 +479,7 @@ class TeamEPGGenerator:
 
         # Initialize filler generator if not already done
         if self._filler_generator is None:
-            self._filler_generator = FillerGenerator(self._service)
+            self._filler_generator = FillerGenerator(self._service, self._context_builder)
 
         # Build filler options from EPG options
         filler_options = FillerOptions(
@@ -474,6 +490,7 @@ class TeamEPGGenerator:
             sport_durations=options.sport_durations,
             default_duration=options.default_duration_hours,
             prepend_postponed_label=options.prepend_postponed_label,
+            generation_time=options.generation_time,
         )
 
         # Load filler config from database if template_id is set
@@ -12,24 +12,56 @@ This is the main entry point for team-based EPG generation from the scheduler.
 import logging
 import os
 import threading
+import time
+from collections import Counter
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from sqlite3 import Connection
 from typing import Any
 
+from teamarr.consumers.io_pool import IO_WORKERS
 from teamarr.consumers.team_epg import TeamEPGGenerator, TeamEPGOptions
 from teamarr.core import Programme
 from teamarr.services import SportsDataService, create_default_service
+from teamarr.utilities.tz import now_user
 from teamarr.utilities.xmltv import programmes_to_xmltv
 
-# Number of parallel workers for team processing
-# Configurable via ESPN_MAX_WORKERS for users with DNS throttling (PiHole, AdGuard)
-MAX_WORKERS = int(os.environ.get("ESPN_MAX_WORKERS", 100))
+# Number of parallel workers for team processing. Provider I/O runs on the
+# shared I/O pool (consumers.io_pool, sized by ESPN_MAX_WORKERS, for users
+# with DNS throttling), so team workers are mostly CPU (templates, filler) and
+# only need a small multiple of the core count.
+# Configurable via EPG_TEAM_WORKERS.
+MAX_WORKERS = int(os.environ.get("EPG_TEAM_WORKERS", max(8, 4 * (os.cpu_count() or 1))))
+
+# Minimum seconds between parallel-batch progress callbacks (the last team
+# always reports)
+PROGRESS_INTERVAL = 0.25
 
 logger = logging.getLogger(__name__)
 
+# Process-wide worker pool for per-team generation, created on first use
+_team_pool: ThreadPoolExecutor | None = None
+_team_pool_lock = threading.Lock()
+
+
+def get_team_pool() -> ThreadPoolExecutor:
+    """Get the shared worker pool for team EPG generation.
+
+    Kept for the life of the process so each generation reuses idle
+    threads instead of starting (and joining) up to MAX_WORKERS new ones.
+    """
+    global _team_pool
+    if _team_pool is None:
+        with _team_pool_lock:
+            if _team_pool is None:
+                _team_pool = ThreadPoolExecutor(
+                    max_workers=MAX_WORKERS, thread_name_prefix="epg-team"
+                )
+    return _team_pool
+
 
 @dataclass
 class TeamConfig:
@@ -138,6 +170,23 @@ class BatchTeamResult:
         }
 
 
+@dataclass
+class _BatchConfig:
+    """Settings and template configs loaded once for a batch of teams.
+
+    Teams share a handful of templates, so loading each template once per
+    batch (instead of per team, inside the worker threads) turns O(teams)
+    database round-trips into O(1).
+    """
+
+    settings: Any  # AllSettings
+    sport_durations: dict
+    # template_id -> (programme config, filler config)
+    templates: dict[int, tuple[Any, Any]]
+    # "Now" for the whole batch, so every team sees the same output window
+    generation_time: datetime
+
+
 class TeamProcessor:
     """Processes teams - generates EPG for team-based channels.
 
@@ -210,6 +259,9 @@ class TeamProcessor:
 
         with self._db_factory() as conn:
             teams = self._get_active_teams(conn)
+            batch = self._load_batch_config(
+                conn, {t.template_id for t in teams if t.template_id is not None}
+            )
 
         if not teams:
             batch_result.completed_at = datetime.now()
@@ -226,76 +278,92 @@ class TeamProcessor:
 
         # Process ESPN teams in parallel
         if espn_teams:
-            num_workers = min(MAX_WORKERS, len(espn_teams))
             logger.info(
-                "[TEAM_BATCH] ESPN: %d teams, %d workers",
+                "[TEAM_BATCH] ESPN: %d teams, %d team workers, %d I/O workers",
                 len(espn_teams),
-                num_workers,
+                MAX_WORKERS,
+                IO_WORKERS,
             )
 
             # Track in-progress teams for accurate progress display
             in_progress: set[str] = set()
             in_progress_lock = threading.Lock()
+            last_progress = 0.0
+
+            def claim_progress(force: bool = False) -> bool:
+                """Claim the next progress report, at most one per PROGRESS_INTERVAL.
+
+                Shared by the start reports (worker threads) and the
+                completion reports (this thread).
+                """
+                nonlocal last_progress
+                now = time.monotonic()
+                with in_progress_lock:
+                    if not force and now - last_progress < PROGRESS_INTERVAL:
+                        return False
+                    last_progress = now
+                    return True
 
             def process_with_tracking(team: TeamConfig) -> TeamProcessingResult:
                 """Wrapper to track in-progress state."""
                 with in_progress_lock:
                     in_progress.add(team.team_name)
-                    # Report which team is now being processed
-                    if progress_callback:
-                        progress_callback(
-                            processed_count,
-                            total_teams,
-                            f"Processing {team.team_name}...",
-                        )
+                # Report which team is now being processed, coalesced
+                if progress_callback and claim_progress():
+                    progress_callback(
+                        processed_count,
+                        total_teams,
+                        f"Processing {team.team_name}...",
+                    )
                 try:
-                    return self._process_team_parallel(team)
+                    return self._process_team_parallel(team, batch)
                 finally:
                     with in_progress_lock:
                         in_progress.discard(team.team_name)
 
-            with ThreadPoolExecutor(max_workers=num_workers) as executor:
-                future_to_team = {
-                    executor.submit(process_with_tracking, team): team for team in espn_teams
-                }
+            executor = get_team_pool()
+            future_to_team = {
+                executor.submit(process_with_tracking, team): team for team in espn_teams
+            }
+
+            for future in as_completed(future_to_team):
+                team = future_to_team[future]
+                processed_count += 1
+                try:
+                    result = future.result()
+                    batch_result.results.append(result)
 
-                for future in as_completed(future_to_team):
-                    team = future_to_team[future]
-                    processed_count += 1
-                    try:
-                        result = future.result()
-                        batch_result.results.append(result)
-
-                        if result.programmes_generated > 0:
-                            channels.append(
-                                {
-                                    "id": team.channel_id,
-                                    "name": team.team_name,
-                                    "icon": team.channel_logo_url or team.team_logo_url,
-                                }
-                            )
-                    except Exception as e:
-                        logger.exception("[TEAM_ERROR] %s: %s", team.team_name, e)
-                        error_result = TeamProcessingResult(
-                            team_id=team.id,
-                            team_name=team.team_name,
-                            channel_id=team.channel_id,
+                    if result.programmes_generated > 0:
+                        channels.append(
+                            {
+                                "id": team.channel_id,
+                                "name": team.team_name,
+                                "icon": team.channel_logo_url or team.team_logo_url,
+                            }
                         )
-                        error_result.errors.append(str(e))
-                        error_result.completed_at = datetime.now()
-                        batch_result.results.append(error_result)
-
-                    # Report progress with remaining in-progress teams
-                    if progress_callback:
-                        with in_progress_lock:
-                            still_processing = list(in_progress)
-                        if still_processing:
-                            msg = f"Finished {team.team_name}, now processing: {', '.join(still_processing[:3])}"  # noqa: E501
-                            if len(still_processing) > 3:
-                                msg += f" (+{len(still_processing) - 3} more)"
-                        else:
-                            msg = f"Finished {team.team_name}"
-                        progress_callback(processed_count, total_teams, msg)
+                except Exception as e:
+                    logger.exception("[TEAM_ERROR] %s: %s", team.team_name, e)
+                    error_result = TeamProcessingResult(
+                        team_id=team.id,
+                        team_name=team.team_name,
+                        channel_id=team.channel_id,
+                    )
+                    error_result.errors.append(str(e))
+                    error_result.completed_at = datetime.now()
+                    batch_result.results.append(error_result)
+
+                # Report progress with remaining in-progress teams, coalesced
+                # to at most one call per PROGRESS_INTERVAL
+                if progress_callback and claim_progress(force=processed_count == len(espn_teams)):
+                    with in_progress_lock:
+                        still_processing = list(in_progress)
+                    if still_processing:
+                        msg = f"Finished {team.team_name}, now processing: {', '.join(still_processing[:3])}"  # noqa: E501
+                        if len(still_processing) > 3:
+                            msg += f" (+{len(still_processing) - 3} more)"
+                    else:
+                        msg = f"Finished {team.team_name}"
+                    progress_callback(processed_count, total_teams, msg)
 
             logger.debug("[TEAM_BATCH] ESPN parallel processing complete")
 
@@ -332,7 +400,7 @@ class TeamProcessor:
             for team in sorted_tsdb_teams:
                 processed_count += 1
                 try:
-                    result = self._process_team_parallel(team)
+                    result = self._process_team_parallel(team, batch)
                     batch_result.results.append(result)
 
                     if result.programmes_generated > 0:
@@ -365,15 +433,18 @@ class TeamProcessor:
         logger.info("[TEAM_BATCH] Completed: %d teams", len(teams))
         return batch_result
 
-    def _process_team_parallel(self, team: TeamConfig) -> TeamProcessingResult:
+    def _process_team_parallel(
+        self, team: TeamConfig, batch: _BatchConfig | None = None
+    ) -> TeamProcessingResult:
         """Process a single team with its own DB connection (for parallel execution)."""
         with self._db_factory() as conn:
-            return self._process_team_internal(conn, team)
+            return self._process_team_internal(conn, team, batch)
 
     def _process_team_internal(
         self,
         conn: Connection,
         team: TeamConfig,
+        batch: _BatchConfig | None = None,
     ) -> TeamProcessingResult:
         """Internal processing for a single team."""
         result = TeamProcessingResult(
@@ -391,7 +462,7 @@ class TeamProcessor:
 
         try:
             # Build options
-            options = self._build_options(conn, team)
+            options = self._build_options(conn, team, batch)
 
             # Generate programmes using TeamEPGGenerator
             programmes = self._epg_generator.generate_auto_discover(
@@ -406,18 +477,20 @@ class TeamProcessor:
                 sport=team.sport,
             )
 
-            # Count programme types by filler_type field (set during creation)
+            # Count programme types by filler_type field (set during creation);
+            # Counter tallies them in one C-level pass
+            filler_counts = Counter(map(attrgetter("filler_type"), programmes))
             result.programmes_generated = len(programmes)
-            for prog in programmes:
-                if prog.filler_type == "pregame":
-                    result.programmes_pregame += 1
-                elif prog.filler_type == "postgame":
-                    result.programmes_postgame += 1
-                elif prog.filler_type == "idle":
-                    result.programmes_idle += 1
-                else:
-                    # filler_type is None = actual event programme
-                    result.programmes_events += 1
+            result.programmes_pregame = filler_counts["pregame"]
+            result.programmes_postgame = filler_counts["postgame"]
+            result.programmes_idle = filler_counts["idle"]
+            # Everything else (filler_type None) is an actual event programme
+            result.programmes_events = (
+                result.programmes_generated
+                - result.programmes_pregame
+                - result.programmes_postgame
+                - result.programmes_idle
+            )
 
             # Generate XMLTV for this team
             if programmes:
@@ -442,15 +515,11 @@ class TeamProcessor:
         result.completed_at = datetime.now()
         return result
 
-    def _build_options(self, conn: Connection, team: TeamConfig) -> TeamEPGOptions:
-        """Build TeamEPGOptions from database settings.
-
-        Pre-loads the template and filler config here to avoid DB access
-        in the EPG generator, which is critical for thread-safety during
-        parallel processing.
-        """
+    def _load_batch_config(self, conn: Connection, template_ids: set[int]) -> _BatchConfig:
+        """Load global settings and the given templates' configs in one pass."""
         from teamarr.database.settings import get_all_settings
         from teamarr.database.templates import (
+            get_all_templates,
             get_template,
             template_to_filler_config,
             template_to_programme_config,
@@ -459,17 +528,52 @@ class TeamProcessor:
         # Load global settings
         all_settings = get_all_settings(conn)
 
-        # Sport durations - dynamically loaded from DurationSettings dataclass
-        sport_durations = asdict(all_settings.durations)
+        # One template: direct lookup. Several: a single query for all templates.
+        if len(template_ids) == 1:
+            template = get_template(conn, next(iter(template_ids)))
+            templates = [template] if template else []
+        elif template_ids:
+            templates = [t for t in get_all_templates(conn) if t.id in template_ids]
+        else:
+            templates = []
+
+        return _BatchConfig(
+            settings=all_settings,
+            # Sport durations - dynamically loaded from DurationSettings dataclass
+            sport_durations=asdict(all_settings.durations),
+            templates={
+                t.id: (template_to_programme_config(t), template_to_filler_config(t))
+                for t in templates
+            },
+            generation_time=now_user(),
+        )
+
+    def _build_options(
+        self,
+        conn: Connection,
+        team: TeamConfig,
+        batch: _BatchConfig | None = None,
+    ) -> TeamEPGOptions:
+        """Build TeamEPGOptions from database settings.
+
+        Pre-loads the template and filler config here to avoid DB access
+        in the EPG generator, which is critical for thread-safety during
+        parallel processing. Batch runs pass the configs loaded once for
+        all teams; a single-team run loads its own.
+        """
+        if batch is None:
+            batch = self._load_batch_config(
+                conn, {team.template_id} if team.template_id is not None else set()
+            )
+        all_settings = batch.settings
 
-        # Pre-load template and filler config (avoids DB access in parallel threads)
+        # Pre-loaded template and filler config (no DB access in parallel threads)
         template_config = None
         filler_config = None
         if team.template_id:
-            template = get_template(conn, team.template_id)
-            if template:
-                template_config = template_to_programme_config(template)
-                filler_config = template_to_filler_config(template)
+            configs = batch.templates.get(team.template_id)
+            if configs:
+                template_config, filler_config = configs
                 logger.debug("[TEMPLATE] Loaded %d for %s", team.template_id, team.team_name)
             else:
                 logger.warning(
@@ -485,7 +589,7 @@ class TeamProcessor:
             output_days_ahead=all_settings.epg.epg_output_days_ahead,
             lookback_hours=all_settings.epg.epg_lookback_hours,
             default_duration_hours=all_settings.durations.default,
-            sport_durations=sport_durations,
+            sport_durations=batch.sport_durations,
             epg_timezone=all_settings.epg.epg_timezone,
             midnight_crossover_mode=all_settings.epg.midnight_crossover_mode,
             template_id=team.template_id,
@@ -493,6 +597,7 @@ class TeamProcessor:
             filler_config=filler_config,  # Pre-loaded filler config
             filler_enabled=True,
             include_final_events=all_settings.epg.include_final_events,
+            generation_time=batch.generation_time,
         )
 
     def _get_team(self, conn: Connection, team_id: int) -> TeamConfig | None:
@@ -585,13 +690,16 @@ class TeamProcessor:
     ) -> list[Programme]:
         """Regenerate all programmes for combined XMLTV."""
         all_programmes: list[Programme] = []
+        batch = self._load_batch_config(
+            conn, {t.template_id for t in teams if t.template_id is not None}
+        )
 
         for team in teams:
             # Skip teams without a template
             if team.template_id is None:
                 continue
 
-            options = self._build_options(conn, team)
+            options = self._build_options(conn, team, batch)
 
             programmes = self._epg_generator.generate_auto_discover(
                 team_id=team.provider_team_id,
@@ -16,7 +16,7 @@ Timezone disambiguation uses three-tier priority:
 import logging
 import re
 from dataclasses import dataclass
-from datetime import datetime, time, timedelta
+from datetime import UTC, datetime, time, timedelta
 from zoneinfo import ZoneInfo
 
 from teamarr.consumers.matching.classifier import (
@@ -303,7 +303,7 @@ def determine_segment_from_time(
 
     # Convert stream time to UTC for comparison
     stream_dt_local = datetime.combine(event_date, stream_time, tzinfo=effective_tz)
-    stream_dt_utc = stream_dt_local.astimezone(ZoneInfo("UTC"))
+    stream_dt_utc = stream_dt_local.astimezone(UTC)
 
     # Find closest segment
     best_segment = None
@@ -411,7 +411,7 @@ def disambiguate_prelims_by_time(
     # ESPN segment times are in UTC
     event_date = early_prelims_dt.date()
     stream_dt_local = datetime.combine(event_date, stream_time, tzinfo=effective_tz)
-    stream_dt_utc = stream_dt_local.astimezone(ZoneInfo("UTC"))
+    stream_dt_utc = stream_dt_local.astimezone(UTC)
 
     # Calculate time differences in seconds
     def datetime_distance(dt1: datetime, dt2: datetime) -> int:
@@ -605,13 +605,7 @@ def expand_ufc_segments(
         # Validate against ESPN's segment data - ensures segment exists
         segment = canonicalize_segment(segment, event)
 
-        event_id = event.id
-        if event_id not in ufc_by_segment:
-            ufc_by_segment[event_id] = {}
-        if segment not in ufc_by_segment[event_id]:
-            ufc_by_segment[event_id][segment] = []
-
-        ufc_by_segment[event_id][segment].append(match)
+        ufc_by_segment.setdefault(event.id, {}).setdefault(segment, []).append(match)
 
     # Create segment entries for each UFC event
     for event_id, segments in ufc_by_segment.items():
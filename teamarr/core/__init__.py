@@ -1,21 +1,58 @@
-"""Core types and interfaces."""
-
-from teamarr.core.interfaces import LeagueMapping, LeagueMappingSource, SportsProvider
-from teamarr.core.types import (
-    Bout,
-    Event,
-    EventStatus,
-    Programme,
-    Team,
-    TeamStats,
-    TemplateConfig,
-    Venue,
-)
+"""Core types and interfaces.
+
+Exports are resolved lazily (PEP 562): importing teamarr.core does not
+import the submodules until an attribute is first accessed, so callers
+that need one type do not pay for the rest.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from teamarr.core.event_table import EventTable
+    from teamarr.core.interfaces import LeagueMapping, LeagueMappingSource, SportsProvider
+    from teamarr.core.types import (
+        Bout,
+        Event,
+        EventState,
+        EventStatus,
+        FillerProgramme,
+        Programme,
+        Team,
+        TeamStats,
+        TemplateConfig,
+        Venue,
+        XmltvFlags,
+        XmltvVideo,
+    )
+
+# Exported name -> defining module
+_LAZY: dict[str, str] = {
+    "Bout": "teamarr.core.types",
+    "Event": "teamarr.core.types",
+    "EventState": "teamarr.core.types",
+    "EventStatus": "teamarr.core.types",
+    "EventTable": "teamarr.core.event_table",
+    "FillerProgramme": "teamarr.core.types",
+    "LeagueMapping": "teamarr.core.interfaces",
+    "LeagueMappingSource": "teamarr.core.interfaces",
+    "Programme": "teamarr.core.types",
+    "SportsProvider": "teamarr.core.interfaces",
+    "Team": "teamarr.core.types",
+    "TeamStats": "teamarr.core.types",
+    "TemplateConfig": "teamarr.core.types",
+    "Venue": "teamarr.core.types",
+    "XmltvFlags": "teamarr.core.types",
+    "XmltvVideo": "teamarr.core.types",
+}
 
 __all__ = [
     "Bout",
     "Event",
+    "EventState",
     "EventStatus",
+    "EventTable",
+    "FillerProgramme",
     "LeagueMapping",
     "LeagueMappingSource",
     "Programme",
@@ -24,4 +61,19 @@ __all__ = [
     "TeamStats",
     "TemplateConfig",
     "Venue",
+    "XmltvFlags",
+    "XmltvVideo",
 ]
+
+
+def __getattr__(name: str):
+    module_path = _LAZY.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,91 @@
+"""Structure-of-arrays view over a team schedule.
+
+Filler and EPG generation repeatedly ask the same questions of a sorted
+event list ("next game after X", "last game before Y", "what is live").
+Scanning a list of Event objects for each question walks every event and
+chases several attribute pointers per event. EventTable stores the handful
+of hot fields in parallel arrays once, so those lookups become a bisect
+over a flat array of timestamps.
+
+The Event objects themselves are kept alongside (same index) so results
+are returned as regular events.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from operator import attrgetter
+
+from teamarr.core.types import Event, EventState
+
+# Sentinel for a missing score in the int score columns
+NO_SCORE = -1
+
+
+@dataclass(slots=True)
+class EventTable:
+    """Parallel arrays over events sorted by start time.
+
+    Index i of every column describes events[i].
+    """
+
+    events: list[Event]
+    ids: list[str]
+    start_ts: array  # 'q' - Event.start_ts
+    home_score: array  # 'i' - NO_SCORE when unknown
+    away_score: array  # 'i' - NO_SCORE when unknown
+    state_code: array  # 'b' - EventState
+
+    @classmethod
+    def from_events(cls, events: Iterable[Event]) -> "EventTable":
+        """Build a table from events (sorted by start time, stable)."""
+        ordered = sorted(events, key=attrgetter("start_ts"))
+        return cls(
+            events=ordered,
+            ids=[e.id for e in ordered],
+            start_ts=array("q", [e.start_ts for e in ordered]),
+            home_score=array(
+                "i", [NO_SCORE if e.home_score is None else e.home_score for e in ordered]
+            ),
+            away_score=array(
+                "i", [NO_SCORE if e.away_score is None else e.away_score for e in ordered]
+            ),
+            state_code=array("b", [e.status.code for e in ordered]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def to_events(self, mask: Iterable[bool]) -> list[Event]:
+        """Return the events whose mask entry is truthy."""
+        return [e for e, keep in zip(self.events, mask, strict=False) if keep]
+
+    def first_at_or_after(self, moment: datetime) -> Event | None:
+        """First event starting at or after moment."""
+        i = bisect_left(self.start_ts, moment.timestamp())
+        return self.events[i] if i < len(self.events) else None
+
+    def first_after(self, moment: datetime) -> Event | None:
+        """First event starting strictly after moment."""
+        i = bisect_right(self.start_ts, moment.timestamp())
+        return self.events[i] if i < len(self.events) else None
+
+    def last_before(self, moment: datetime) -> Event | None:
+        """Last event starting strictly before moment."""
+        i = bisect_left(self.start_ts, moment.timestamp())
+        return self.events[i - 1] if i > 0 else None
+
+    def last_at_or_before(self, moment: datetime) -> Event | None:
+        """Last event starting at or before moment."""
+        i = bisect_right(self.start_ts, moment.timestamp())
+        return self.events[i - 1] if i > 0 else None
+
+    def window(self, start_ts: float, end_ts: float) -> range:
+        """Indexes of events with start_ts <= Event.start_ts < end_ts."""
+        return range(bisect_left(self.start_ts, start_ts), bisect_left(self.start_ts, end_ts))
+
+    def with_state(self, state: EventState) -> list[Event]:
+        """Events in the given state (e.g. EventState.LIVE)."""
+        return self.to_events(code == state for code in self.state_code)
@@ -6,6 +6,7 @@ proper layer isolation.
 """
 
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
 
 
@@ -119,3 +120,6 @@ class FillerOptions:
     # When True, prepends "Postponed: " to filler title, subtitle, and description
     # if the relevant event (next for pregame, last for postgame) is postponed
     prepend_postponed_label: bool = True
+
+    # Reference "now" for the EPG window (None = current time, user timezone)
+    generation_time: datetime | None = None
@@ -1,15 +1,32 @@
 """Core data types for Teamarr v2.
 
-All data structures are dataclasses with attribute access.
+All data structures are dataclasses or named tuples with attribute access.
+Dataclasses are slotted (no per-instance __dict__) since the EPG pipeline
+builds thousands of events and programmes per generation.
 Provider-scoped IDs: every entity carries its `id` and `provider`.
+
+The small identity records built for every event (Venue, Team, EventStatus)
+are `NamedTuple`s: C-level construction and attribute access, hashable for
+free. Use `._replace(...)` (not `dataclasses.replace`) to derive a copy, and
+`._asdict()` to serialize.
+
+TeamStats uses `fast_frozen_dataclass`: immutable by convention rather than
+`frozen=True`, which routes every field assignment in `__init__` through
+`object.__setattr__`. Treat it as read-only.
 """
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import IntEnum
+from functools import partial
+from typing import ClassVar, NamedTuple, TypedDict
+
+# Slotted, comparable dataclass without the frozen __init__ penalty.
+# Instances must not be mutated after construction.
+fast_frozen_dataclass = partial(dataclass, slots=True, eq=True)
 
 
-@dataclass(frozen=True)
-class Venue:
+class Venue(NamedTuple):
     """Event location."""
 
     name: str
@@ -18,8 +35,7 @@ class Venue:
     country: str | None = None
 
 
-@dataclass(frozen=True)
-class Team:
+class Team(NamedTuple):
     """Team identity."""
 
     id: str
@@ -35,8 +51,48 @@ class Team:
     record_summary: str | None = None
 
 
-@dataclass(frozen=True)
-class EventStatus:
+class EventState(IntEnum):
+    """Normalized event state code.
+
+    Integer counterpart of EventStatus.state for hot-path branching and
+    array storage. Build with EventState.from_str() (or EventStatus.code).
+    """
+
+    SCHEDULED = 0
+    LIVE = 1
+    FINAL = 2
+    POSTPONED = 3
+    CANCELLED = 4
+    DELAYED = 5
+
+    @classmethod
+    def from_str(cls, state: str | None) -> "EventState":
+        """Map a provider state string to a code (unknown -> SCHEDULED)."""
+        if not state:
+            return cls.SCHEDULED
+        code = _EVENT_STATE_BY_NAME.get(state)
+        if code is None:
+            code = _EVENT_STATE_BY_NAME.get(state.lower(), cls.SCHEDULED)
+        return code
+
+
+# Provider state strings -> EventState. Includes raw ESPN states ("pre", "in",
+# "post") and "completed", which is_event_final() also treats as final.
+_EVENT_STATE_BY_NAME: dict[str, EventState] = {
+    "scheduled": EventState.SCHEDULED,
+    "pre": EventState.SCHEDULED,
+    "live": EventState.LIVE,
+    "in": EventState.LIVE,
+    "final": EventState.FINAL,
+    "post": EventState.FINAL,
+    "completed": EventState.FINAL,
+    "postponed": EventState.POSTPONED,
+    "cancelled": EventState.CANCELLED,
+    "delayed": EventState.DELAYED,
+}
+
+
+class EventStatus(NamedTuple):
     """Current state of an event."""
 
     state: str  # "scheduled" | "live" | "final" | "postponed" | "cancelled"
@@ -44,8 +100,13 @@ class EventStatus:
     period: int | None = None
     clock: str | None = None
 
+    @property
+    def code(self) -> EventState:
+        """State as an EventState code."""
+        return EventState.from_str(self.state)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Bout:
     """A single bout/fight on a combat sports card.
 
@@ -59,7 +120,7 @@ class Bout:
     order: int  # Position on card (0 = opener, higher = later)
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """A single sporting event (game/match)."""
 
@@ -77,7 +138,8 @@ class Event:
     home_score: int | None = None
     away_score: int | None = None
     venue: Venue | None = None
-    broadcasts: list[str] = field(default_factory=list)
+    # Network names, interned at ingestion (heavily repeated: "ESPN", "FOX")
+    broadcasts: tuple[str, ...] = ()
     season_year: int | None = None
     season_type: str | None = None
 
@@ -89,11 +151,12 @@ class Event:
 
     # MMA-specific: exact segment times from ESPN bout-level data
     # Keys: "early_prelims", "prelims", "main_card"
-    # Values: datetime of segment start
-    segment_times: dict[str, datetime] = field(default_factory=dict)
+    # Values: datetime of segment start (None for non-MMA events)
+    segment_times: dict[str, datetime] | None = None
 
     # MMA-specific: all bouts on the card (ordered by position)
-    bouts: list["Bout"] = field(default_factory=list)
+    # Empty-tuple default shares one constant - no per-event allocation
+    bouts: tuple["Bout", ...] = ()
 
     # MMA-specific: fight result data (headline bout)
     # Method: 'ko', 'tko', 'submission', 'decision_unanimous', 'decision_split', 'decision_majority'
@@ -105,28 +168,52 @@ class Event:
     fighter1_scores: list[int] | None = None  # home_team/fighter1 scores
     fighter2_scores: list[int] | None = None  # away_team/fighter2 scores
 
+    # Unix timestamp (seconds) of start_time, derived at construction.
+    # Use for sorting and time comparisons - int compares are much cheaper
+    # than aware-datetime compares. start_time must not be reassigned.
+    start_ts: int = field(init=False, repr=False, compare=False)
+    # ISO-8601 start_time, formatted on first use by start_iso
+    _start_iso: str | None = field(default=None, init=False, repr=False, compare=False)
+    # Stream match cache payload, built once by event_to_cache_data
+    _cache_data: dict | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.start_ts = int(self.start_time.timestamp()) if self.start_time else 0
+
+    @property
+    def start_iso(self) -> str:
+        """start_time.isoformat(), computed once per event.
 
-@dataclass(frozen=True)
+        The same event is serialized repeatedly (provider cache, every
+        stream it matches, API responses), so the string is kept.
+        """
+        if self._start_iso is None:
+            self._start_iso = self.start_time.isoformat()
+        return self._start_iso
+
+
+@fast_frozen_dataclass
 class TeamStats:
     """Team statistics for template variables.
 
-    Record fields store formatted strings like "10-2" or "8-3-1".
-    Numeric fields store parsed values for calculations.
+    The overall record and streak are stored parsed (wins/losses/ties,
+    signed streak_count) and formatted on demand by the `record` and
+    `streak` properties. Home/away splits are provider strings.
     """
 
     # Overall record
-    record: str  # "10-2" or "8-3-1" (W-L or W-L-T)
     wins: int = 0
     losses: int = 0
     ties: int = 0
+    # Record displays as W-D-L (soccer "10-3-2") rather than W-L[-T]
+    uses_draws: bool = False
 
     # Home/away splits
     home_record: str | None = None
     away_record: str | None = None
 
-    # Streak info
-    streak: str | None = None  # "W3" or "L2" format
-    streak_count: int = 0  # positive = wins, negative = losses
+    # Streak: positive = wins, negative = losses
+    streak_count: int = 0
 
     # Rankings and standings
     rank: int | None = None  # College sports ranking (1-25, None if unranked)
@@ -142,8 +229,42 @@ class TeamStats:
     ppg: float | None = None  # Points per game
     papg: float | None = None  # Points allowed per game
 
+    @property
+    def record(self) -> str:
+        """Overall record: "10-2", "8-3-1" (W-L-T) or "10-3-2" (W-D-L)."""
+        if self.uses_draws:
+            return f"{self.wins}-{self.ties}-{self.losses}"
+        if self.ties:
+            return f"{self.wins}-{self.losses}-{self.ties}"
+        return f"{self.wins}-{self.losses}"
+
+    @property
+    def streak(self) -> str:
+        """Current streak: "W3", "L2", or "" when there is none."""
+        if self.streak_count > 0:
+            return f"W{self.streak_count}"
+        if self.streak_count < 0:
+            return f"L{-self.streak_count}"
+        return ""
+
+
+class XmltvFlags(TypedDict, total=False):
+    """XMLTV programme flags configured on a template."""
+
+    new: bool
+    live: bool
+    date: bool
+
+
+class XmltvVideo(TypedDict, total=False):
+    """XMLTV <video> element settings configured on a template."""
+
+    enabled: bool
+    quality: str  # "HDTV" | "SDTV"
+    aspect: str  # "16:9" | "4:3"
 
-@dataclass
+
+@dataclass(slots=True)
 class Programme:
     """An XMLTV programme entry."""
 
@@ -155,17 +276,66 @@ class Programme:
     subtitle: str | None = None
     icon: str | None = None
     episode_num: str | None = None
-    # Filler type: 'pregame', 'postgame', 'idle', or None for actual events
-    filler_type: str | None = None
+    # Filler type: None for actual events (FillerProgramme stores the real value)
+    filler_type: ClassVar[str | None] = None
     # Categories for XMLTV output (e.g., ["Sports", "Football", "NFL"])
     categories: list[str] = field(default_factory=list)
-    # XMLTV flags: new, live, date
-    xmltv_flags: dict = field(default_factory=dict)
+    # XMLTV flags: new, live, date (None for filler - no per-instance empty dict)
+    xmltv_flags: XmltvFlags | None = None
     # XMLTV video: enabled, quality (HDTV/SDTV), aspect (16:9/4:3)
-    xmltv_video: dict = field(default_factory=dict)
+    xmltv_video: XmltvVideo | None = None
+
+    def freeze(self) -> "Programme":
+        """Make this programme read-only once it is fully built.
+
+        Swaps the instance's class to a frozen subclass with the same slot
+        layout, so construction and reads keep mutable-dataclass speed and
+        only writes raise. Build a new programme rather than copying a
+        frozen one (dataclasses.replace/copy go through __setattr__).
+        """
+        frozen_cls = _FROZEN_PROGRAMME_CLASSES.get(type(self))
+        if frozen_cls is not None:
+            self.__class__ = frozen_cls
+        return self
+
+
+@dataclass(slots=True)
+class FillerProgramme(Programme):
+    """A filler programme (pregame, postgame, idle) between events.
+
+    Only filler carries a filler_type slot; event programmes read the
+    class-level None from Programme.
+    """
+
+    # Filler type: 'pregame', 'postgame', 'idle'
+    filler_type: str = field(kw_only=True)
+
+
+class _FrozenProgrammeMixin:
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"Programme is frozen; cannot set {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Programme is frozen; cannot delete {name!r}")
+
+
+class _FrozenProgramme(_FrozenProgrammeMixin, Programme):
+    __slots__ = ()
+
+
+class _FrozenFillerProgramme(_FrozenProgrammeMixin, FillerProgramme):
+    __slots__ = ()
+
+
+_FROZEN_PROGRAMME_CLASSES: dict[type, type] = {
+    Programme: _FrozenProgramme,
+    FillerProgramme: _FrozenFillerProgramme,
+}
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplateConfig:
     """Template configuration for EPG generation.
 
@@ -185,7 +355,7 @@ class TemplateConfig:
     game_duration_override: float | None = None
 
     # XMLTV metadata (no hardcoded defaults - schema.sql provides them)
-    xmltv_flags: dict = field(default_factory=dict)
-    xmltv_video: dict = field(default_factory=dict)
+    xmltv_flags: XmltvFlags = field(default_factory=dict)
+    xmltv_video: XmltvVideo = field(default_factory=dict)
     xmltv_categories: list[str] = field(default_factory=list)
     categories_apply_to: str = "events"  # 'all' or 'events'
@@ -18,6 +18,7 @@ Features:
 """
 
 import logging
+from operator import itemgetter
 from sqlite3 import Connection
 
 logger = logging.getLogger(__name__)
@@ -593,7 +594,7 @@ def _get_next_available_range_start(conn: Connection) -> int | None:
         used_ranges.append((start, end))
 
     # Sort by start
-    used_ranges.sort(key=lambda x: x[0])
+    used_ranges.sort(key=itemgetter(0))
 
     # Find highest used channel
     highest_used = range_start - 1
@@ -803,6 +804,7 @@ def get_all_auto_channels_globally_sorted(conn: Connection) -> list[dict]:
 
     # Import here to avoid circular import
     from teamarr.database.sort_priorities import get_all_sort_priorities
+    from teamarr.utilities.tz import parse_iso_datetime
 
     # 1. Get sort priorities (normalize to lowercase for case-insensitive matching)
     priorities = get_all_sort_priorities(conn)
@@ -870,7 +872,7 @@ def get_all_auto_channels_globally_sorted(conn: Connection) -> list[dict]:
             try:
                 # Handle various formats
                 if "T" in str(event_date_str):
-                    event_date = datetime.fromisoformat(str(event_date_str).replace("Z", "+00:00"))
+                    event_date = parse_iso_datetime(str(event_date_str))
                 else:
                     event_date = datetime.strptime(str(event_date_str), "%Y-%m-%d %H:%M:%S")
                 # Strip timezone info for consistent comparison
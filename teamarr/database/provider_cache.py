@@ -2,71 +2,94 @@
 
 Used by SportsDataService to serialize Event, Team, TeamStats to/from
 JSON for storage in PersistentTTLCache (SQLite-backed).
+
+Deserialization interns the low-cardinality string fields (provider,
+league, sport, state, season type, abbreviation) so events loaded from
+cache share one string object per distinct value.
 """
 
-from datetime import datetime
+import sys
+from collections.abc import Iterable
 
 from teamarr.core import Event, EventStatus, Team, TeamStats, Venue
+from teamarr.utilities.tz import parse_iso_datetime
+
+
+def _intern(value: str | None) -> str | None:
+    """Intern an optional string."""
+    return sys.intern(value) if value else value
+
+
+# Team fields stored in the cache: all but record_summary, which is not
+# cached. Team is a NamedTuple and these are its leading positions, so a
+# single zip over the tuple builds the dict.
+_TEAM_DICT_FIELDS = Team._fields[: Team._fields.index("record_summary")]
+
+
+def events_to_dicts(events: Iterable[Event]) -> list[dict]:
+    """Serialize a batch of events, converting each distinct team once.
+
+    A team schedule repeats the same team in every event, so the batch
+    shares one dict per distinct Team (the dicts are never mutated).
+    """
+    team_dicts: dict[Team, dict] = {}
+    return [event_to_dict(e, team_dicts) for e in events]
 
 
-def event_to_dict(event: Event) -> dict:
-    """Serialize Event to dict for JSON storage."""
+def event_to_dict(event: Event, team_dicts: dict[Team, dict] | None = None) -> dict:
+    """Serialize Event to dict for JSON storage.
+
+    team_dicts, when given, memoizes team serialization across calls.
+    """
     # Serialize segment_times (datetime values to ISO strings)
+    segment_times = event.segment_times
     segment_times_dict = None
-    if event.segment_times:
-        segment_times_dict = {seg: dt.isoformat() for seg, dt in event.segment_times.items()}
+    if segment_times:
+        segment_times_dict = {seg: dt.isoformat() for seg, dt in segment_times.items()}
 
+    venue = event.venue
+    main_card_start = event.main_card_start
     return {
         "id": event.id,
         "provider": event.provider,
         "name": event.name,
         "short_name": event.short_name,
-        "start_time": event.start_time.isoformat(),
-        "home_team": team_to_dict(event.home_team),
-        "away_team": team_to_dict(event.away_team),
-        "status": {
-            "state": event.status.state,
-            "detail": event.status.detail,
-            "period": event.status.period,
-            "clock": event.status.clock,
-        },
+        "start_time": event.start_iso,
+        "home_team": _team_dict(event.home_team, team_dicts),
+        "away_team": _team_dict(event.away_team, team_dicts),
+        "status": event.status._asdict(),
         "league": event.league,
         "sport": event.sport,
         "home_score": event.home_score,
         "away_score": event.away_score,
-        "venue": venue_to_dict(event.venue) if event.venue else None,
-        "broadcasts": event.broadcasts,
+        "venue": venue._asdict() if venue else None,
+        "broadcasts": list(event.broadcasts),
         "season_year": event.season_year,
         "season_type": event.season_type,
         # UFC-specific fields
         "segment_times": segment_times_dict,
-        "main_card_start": event.main_card_start.isoformat() if event.main_card_start else None,
+        "main_card_start": main_card_start.isoformat() if main_card_start else None,
     }
 
 
 def team_to_dict(team: Team) -> dict:
     """Serialize Team to dict."""
-    return {
-        "id": team.id,
-        "provider": team.provider,
-        "name": team.name,
-        "short_name": team.short_name,
-        "abbreviation": team.abbreviation,
-        "league": team.league,
-        "sport": team.sport,
-        "logo_url": team.logo_url,
-        "color": team.color,
-    }
+    return dict(zip(_TEAM_DICT_FIELDS, team, strict=False))
+
+
+def _team_dict(team: Team, team_dicts: dict[Team, dict] | None) -> dict:
+    """team_to_dict, memoized in team_dicts when given."""
+    if team_dicts is None:
+        return team_to_dict(team)
+    data = team_dicts.get(team)
+    if data is None:
+        data = team_dicts[team] = team_to_dict(team)
+    return data
 
 
 def venue_to_dict(venue: Venue) -> dict:
     """Serialize Venue to dict."""
-    return {
-        "name": venue.name,
-        "city": venue.city,
-        "state": venue.state,
-        "country": venue.country,
-    }
+    return venue._asdict()
 
 
 def dict_to_event(data: dict) -> Event:
@@ -75,36 +98,37 @@ def dict_to_event(data: dict) -> Event:
     segment_times = None
     if data.get("segment_times"):
         segment_times = {
-            seg: datetime.fromisoformat(dt_str) for seg, dt_str in data["segment_times"].items()
+            seg: parse_iso_datetime(dt_str) for seg, dt_str in data["segment_times"].items()
         }
 
     # Deserialize main_card_start
     main_card_start = None
     if data.get("main_card_start"):
-        main_card_start = datetime.fromisoformat(data["main_card_start"])
+        main_card_start = parse_iso_datetime(data["main_card_start"])
 
+    status = data["status"]
     return Event(
         id=data["id"],
-        provider=data["provider"],
+        provider=sys.intern(data["provider"]),
         name=data["name"],
         short_name=data["short_name"],
-        start_time=datetime.fromisoformat(data["start_time"]),
+        start_time=parse_iso_datetime(data["start_time"]),
         home_team=dict_to_team(data["home_team"]),
         away_team=dict_to_team(data["away_team"]),
         status=EventStatus(
-            state=data["status"]["state"],
-            detail=data["status"].get("detail"),
-            period=data["status"].get("period"),
-            clock=data["status"].get("clock"),
+            state=_intern(status["state"]),
+            detail=status.get("detail"),
+            period=status.get("period"),
+            clock=status.get("clock"),
         ),
-        league=data["league"],
-        sport=data["sport"],
+        league=sys.intern(data["league"]),
+        sport=sys.intern(data["sport"]),
         home_score=data.get("home_score"),
         away_score=data.get("away_score"),
         venue=dict_to_venue(data["venue"]) if data.get("venue") else None,
-        broadcasts=data.get("broadcasts", []),
+        broadcasts=tuple(sys.intern(b) for b in data.get("broadcasts") or ()),
         season_year=data.get("season_year"),
-        season_type=data.get("season_type"),
+        season_type=_intern(data.get("season_type")),
         # UFC-specific fields
         segment_times=segment_times,
         main_card_start=main_card_start,
@@ -114,13 +138,13 @@ def dict_to_event(data: dict) -> Event:
 def dict_to_team(data: dict) -> Team:
     """Deserialize dict to Team."""
     return Team(
-        id=data["id"],
-        provider=data["provider"],
+        id=sys.intern(data["id"]),
+        provider=sys.intern(data["provider"]),
         name=data["name"],
         short_name=data["short_name"],
-        abbreviation=data["abbreviation"],
-        league=data["league"],
-        sport=data["sport"],
+        abbreviation=sys.intern(data["abbreviation"]),
+        league=sys.intern(data["league"]),
+        sport=sys.intern(data["sport"]),
         logo_url=data.get("logo_url"),
         color=data.get("color"),
     )
@@ -143,6 +167,7 @@ def stats_to_dict(stats: TeamStats) -> dict:
         "wins": stats.wins,
         "losses": stats.losses,
         "ties": stats.ties,
+        "uses_draws": stats.uses_draws,
         "home_record": stats.home_record,
         "away_record": stats.away_record,
         "streak": stats.streak,
@@ -160,14 +185,17 @@ def stats_to_dict(stats: TeamStats) -> dict:
 
 def dict_to_stats(data: dict) -> TeamStats:
     """Deserialize dict to TeamStats."""
+    # Entries cached before uses_draws existed: infer W-D-L from the record
+    uses_draws = data.get("uses_draws")
+    if uses_draws is None:
+        uses_draws = data["record"].count("-") == 2
     return TeamStats(
-        record=data["record"],
         wins=data.get("wins", 0),
         losses=data.get("losses", 0),
         ties=data.get("ties", 0),
+        uses_draws=uses_draws,
         home_record=data.get("home_record"),
         away_record=data.get("away_record"),
-        streak=data.get("streak"),
         streak_count=data.get("streak_count", 0),
         rank=data.get("rank"),
         playoff_seed=data.get("playoff_seed"),
@@ -308,9 +308,7 @@ def auto_populate_sort_priorities(conn: Connection) -> int:
     for row in active_leagues:
         sport = row["sport"]
         league = row["league_code"]
-        if sport not in sports_leagues:
-            sports_leagues[sport] = []
-        sports_leagues[sport].append(league)
+        sports_leagues.setdefault(sport, []).append(league)
 
     added = 0
     current_priority = max_priority + 1
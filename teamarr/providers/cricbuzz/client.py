@@ -20,6 +20,7 @@ import re
 import threading
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import itemgetter
 
 import httpx
 
@@ -463,7 +464,7 @@ class CricbuzzClient:
 
         teams_map: dict[int, dict] = {}
         for match in matches:
-            for team_key in ["team1", "team2"]:
+            for team_key in ("team1", "team2"):
                 team = match.get(team_key, {})
                 team_id = team.get("teamId")
                 if team_id and team_id not in teams_map:
@@ -563,8 +564,8 @@ class CricbuzzClient:
             if start_date <= match_dt <= end_date:
                 team_games.append(match)
 
-        # Sort by date
-        team_games.sort(key=lambda m: m.get("startDate", 0))
+        # Sort by date (every kept match has a startDate)
+        team_games.sort(key=itemgetter("startDate"))
         return team_games
 
     def health_check(self) -> dict:
@@ -12,6 +12,7 @@ Layer Separation:
 
 import logging
 from datetime import UTC, date, datetime
+from operator import attrgetter
 
 from teamarr.core import (
     Event,
@@ -26,6 +27,25 @@ from teamarr.providers.cricbuzz.client import CricbuzzClient
 
 logger = logging.getLogger(__name__)
 
+# Cricbuzz state (lowercased) -> EventStatus.state
+_CRICBUZZ_STATE_MAP = {
+    "complete": "final",
+    "finished": "final",
+    "live": "live",
+    "inprogress": "live",
+    "innings break": "live",
+    "preview": "scheduled",
+    "upcoming": "scheduled",
+    "delay": "delayed",
+    "delayed": "delayed",
+    "rain": "delayed",
+    "rain delay": "delayed",
+    "abandon": "cancelled",
+    "abandoned": "cancelled",
+    "no result": "cancelled",
+    "postponed": "postponed",
+}
+
 
 class CricbuzzProvider(SportsProvider):
     """Cricbuzz implementation of SportsProvider.
@@ -97,7 +117,7 @@ class CricbuzzProvider(SportsProvider):
                 events.append(event)
 
         # Sort by start time
-        events.sort(key=lambda e: e.start_time)
+        events.sort(key=attrgetter("start_ts"))
         return events
 
     def get_team(self, team_id: str, league: str) -> Team | None:
@@ -273,7 +293,7 @@ class CricbuzzProvider(SportsProvider):
                 league=league,
                 sport="Cricket",
                 venue=venue,
-                broadcasts=[],  # Cricbuzz doesn't provide broadcast info
+                broadcasts=(),  # Cricbuzz doesn't provide broadcast info
             )
 
         except Exception as e:
@@ -321,20 +341,13 @@ class CricbuzzProvider(SportsProvider):
         status_text = data.get("status", "")
 
         # Map Cricbuzz states to our EventStatus
-        if state in ("complete", "finished"):
-            return EventStatus(state="final", detail=status_text)
-        elif state in ("live", "inprogress", "innings break"):
-            return EventStatus(state="live", detail=status_text)
-        elif state in ("preview", "upcoming"):
+        mapped = _CRICBUZZ_STATE_MAP.get(state)
+        if mapped == "scheduled":
             return EventStatus(state="scheduled", detail=None)
-        elif state in ("delay", "delayed"):
-            return EventStatus(state="delayed", detail=status_text)
-        elif state in ("rain", "rain delay"):
-            return EventStatus(state="delayed", detail=status_text or "Rain delay")
-        elif state in ("abandon", "abandoned", "no result"):
-            return EventStatus(state="cancelled", detail=status_text)
-        elif state in ("postponed"):
-            return EventStatus(state="postponed", detail=status_text)
+        if mapped is not None:
+            if not status_text and state.startswith("rain"):
+                status_text = "Rain delay"
+            return EventStatus(state=mapped, detail=status_text)
 
         # Default to scheduled
         return EventStatus(state="scheduled", detail=status_text if status_text else None)
@@ -141,7 +141,7 @@ class CricketHybridProvider(SportsProvider):
         # Look up TSDB logo from cache (preferred source)
         tsdb_logo = self._get_team_logo(team.name, league)
         if tsdb_logo:
-            return dataclasses.replace(team, logo_url=tsdb_logo)
+            return team._replace(logo_url=tsdb_logo)
 
         # Fall back to existing logo (from Cricbuzz) if TSDB not found
         return team
@@ -125,7 +125,20 @@ class ESPNClient:
         transient failures and DNS throttling. Handles 429 rate limits
         with longer backoff and Retry-After header support.
         """
+        return self._request_with_status(url, params)[0]
+
+    def _request_with_status(
+        self, url: str, params: dict | None = None
+    ) -> tuple[dict | None, int | None]:
+        """Make HTTP request with retry logic, reporting how it failed.
+
+        Returns:
+            (data, status) - status is the HTTP status of the final error
+            response when ESPN answered with one, else None (success, or a
+            timeout / connection / pool failure that never got a response)
+        """
         rate_limit_retries = 0
+        status = None
 
         for attempt in range(self._retry_count + RATE_LIMIT_MAX_RETRIES):
             try:
@@ -141,7 +154,7 @@ class ESPNClient:
                             RATE_LIMIT_MAX_RETRIES,
                             url,
                         )
-                        return None
+                        return None, 429
 
                     # Respect Retry-After header if present
                     retry_after = response.headers.get("Retry-After")
@@ -168,15 +181,16 @@ class ESPNClient:
 
                 response.raise_for_status()
                 logger.debug("[FETCH] %s", url.split("/sports/")[-1] if "/sports/" in url else url)
-                return response.json()
+                return response.json(), None
 
             except httpx.HTTPStatusError as e:
-                logger.warning("[ESPN] HTTP %d for %s", e.response.status_code, url)
+                status = e.response.status_code
+                logger.warning("[ESPN] HTTP %d for %s", status, url)
                 if attempt < self._retry_count - 1:
                     delay = self._calculate_delay(attempt)
                     time.sleep(delay)
                     continue
-                return None
+                return None, status
             except (httpx.RequestError, RuntimeError, OSError) as e:
                 # RuntimeError: "Cannot send a request, as the client has been closed"
                 # OSError: "Bad file descriptor" from stale connections
@@ -188,9 +202,9 @@ class ESPNClient:
                     delay = self._calculate_delay(attempt)
                     time.sleep(delay)
                     continue
-                return None
+                return None, None
 
-        return None
+        return None, status
 
     def _reset_client(self) -> None:
         """Reset the HTTP client to clear stale connections."""
@@ -252,6 +266,20 @@ class ESPNClient:
         Returns:
             Raw ESPN response or None on error
         """
+        return self.get_scoreboard_with_status(league, date_str, sport_league)[0]
+
+    def get_scoreboard_with_status(
+        self,
+        league: str,
+        date_str: str,
+        sport_league: tuple[str, str] | None = None,
+    ) -> tuple[dict | None, int | None]:
+        """Fetch scoreboard like get_scoreboard, with the error status.
+
+        Returns:
+            (raw ESPN response or None, HTTP status of the final error
+            response or None) - see _request_with_status
+        """
         sport, espn_league = self.get_sport_league(league, sport_league)
         url = f"{ESPN_BASE_URL}/{sport}/{espn_league}/scoreboard"
         params = {"dates": date_str}
@@ -259,7 +287,7 @@ class ESPNClient:
         if league in COLLEGE_SCOREBOARD_GROUPS:
             params["groups"] = COLLEGE_SCOREBOARD_GROUPS[league]
 
-        return self._request(url, params)
+        return self._request_with_status(url, params)
 
     def get_league_info(
         self,
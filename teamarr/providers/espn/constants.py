@@ -17,5 +17,13 @@ STATUS_MAP = {
     "STATUS_DELAYED": "scheduled",
 }
 
+# Fallback for status names missing from STATUS_MAP (e.g. STATUS_FIRST_HALF,
+# STATUS_FINAL_PEN), keyed by ESPN's coarse status.type.state
+STATE_MAP = {
+    "pre": "scheduled",
+    "in": "live",
+    "post": "final",
+}
+
 # Sports that are tournament-based (no home/away teams)
 TOURNAMENT_SPORTS = {"tennis", "golf", "racing"}
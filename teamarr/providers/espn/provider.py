@@ -1,11 +1,19 @@
 """ESPN sports data provider.
 
 Fetches data from ESPN API and normalizes into our dataclass format.
-Pure fetch + normalize - no caching (caching is in service layer).
+Pure fetch + normalize - caching is in service layer, apart from a
+short-lived per-(league, date) scoreboard index shared by team scans.
 """
 
 import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, date, datetime, timedelta
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 
 from teamarr.core import (
     Event,
@@ -18,18 +26,92 @@ from teamarr.core import (
 )
 from teamarr.core.sports import normalize_sport
 from teamarr.providers.espn.client import ESPN_TEAM_ID_CORRECTIONS, ESPNClient
-from teamarr.providers.espn.constants import STATUS_MAP, TOURNAMENT_SPORTS
+from teamarr.providers.espn.constants import STATE_MAP, STATUS_MAP, TOURNAMENT_SPORTS
 from teamarr.providers.espn.tournament import TournamentParserMixin
 from teamarr.providers.espn.ufc import UFCParserMixin
+from teamarr.utilities.cache import TTLCache, make_cache_key
 from teamarr.utilities.tz import to_user_tz
 
 logger = logging.getLogger(__name__)
 
+# How long a scoreboard team index is reused. Long enough to share one
+# scoreboard fetch across every team of a league in a generation run,
+# short enough that live scores lag by at most a minute.
+SCOREBOARD_INDEX_TTL = 60
+
+# Concurrent scoreboard fetches across all team scans (only uncached days are
+# fetched). Team scans run on the team EPG generator's I/O pool, so their days
+# share one bounded pool here rather than each starting its own; capped by
+# ESPN_MAX_WORKERS for users with DNS throttling (PiHole, AdGuard).
+SCOREBOARD_SCAN_WORKERS = min(10, int(os.environ.get("ESPN_MAX_WORKERS", 100)))
+
+# After this many consecutive scoreboard fetches for one league that ESPN
+# answered with an HTTP error, team scans stop retrying that league's failed
+# days for SCOREBOARD_DOWN_TTL seconds instead of every remaining team
+# retrying them. Timeouts and connection/pool failures are not counted, and
+# days nobody has fetched yet are still fetched.
+SCOREBOARD_DOWN_AFTER = 3
+SCOREBOARD_DOWN_TTL = 300
+
+# Shared scoreboard scan pool, created on first use (see _get_scan_pool)
+_scan_pool: ThreadPoolExecutor | None = None
+_scan_pool_lock = threading.Lock()
+
+# Shared fallback for absent nested objects in ESPN payloads, so a miss
+# does not allocate a fresh dict. Read-only by convention - never mutate.
+_EMPTY: dict = {}
+
+
+@lru_cache(maxsize=4096)
+def _parse_espn_datetime(date_str: str) -> datetime | None:
+    """Parse an ESPN ISO date string ("2025-01-05T18:00Z") to a datetime.
+
+    Memoized: kickoff strings repeat across a slate, and a past schedule
+    event's date is parsed by the filter and again by _parse_event.
+    datetimes are immutable, so sharing the parsed value is safe.
+    fromisoformat accepts the trailing "Z" since Python 3.11.
+    """
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        return None
+
+
+def _get_scan_pool() -> ThreadPoolExecutor:
+    """Get (creating on first use) the pool for scoreboard scan fetches.
+
+    Kept apart from the callers' pools: scans are submitted from I/O pool
+    workers, and a scan task never submits further work, so waiting on it
+    from those workers cannot starve it.
+    """
+    global _scan_pool
+    if _scan_pool is None:
+        with _scan_pool_lock:
+            if _scan_pool is None:
+                _scan_pool = ThreadPoolExecutor(
+                    max_workers=SCOREBOARD_SCAN_WORKERS, thread_name_prefix="espn-scoreboard"
+                )
+    return _scan_pool
+
+
+def _scoreboard_index_key(league: str, date_str: str) -> str:
+    return make_cache_key("espn", "scoreboard_index", league, date_str)
+
+
+# ESPN season type number -> our season type
+_SEASON_TYPES = {
+    1: "preseason",
+    2: "regular",
+    3: "postseason",
+    4: "offseason",
+}
+
 
 class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
     """ESPN implementation of SportsProvider.
 
-    Pure fetch + normalize layer. No caching - that's handled by SportsDataService.
+    Pure fetch + normalize layer. Caching is handled by SportsDataService
+    (the scoreboard team index is the one short-lived exception).
     """
 
     def __init__(
@@ -39,6 +121,20 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
     ):
         self._client = client or ESPNClient()
         self._league_mapping_source = league_mapping_source
+        # (league, date) -> {team_id: [Event, ...]}, see _scoreboard_team_index
+        self._scoreboard_index = TTLCache(default_ttl_seconds=SCOREBOARD_INDEX_TTL)
+        # In-flight index builds, one lock per (league, date) key, so team
+        # workers that miss the same cold key wait for one fetch instead of
+        # each fetching the scoreboard. _scoreboard_locks_lock only guards
+        # the dict.
+        self._scoreboard_locks: dict[str, threading.Lock] = {}
+        self._scoreboard_locks_lock = threading.Lock()
+        # league -> consecutive HTTP-error scoreboard fetches, the leagues
+        # currently marked down (guarded by _scoreboard_locks_lock), and the
+        # index keys whose fetch got an HTTP error
+        self._scoreboard_failures: dict[str, int] = {}
+        self._scoreboard_down = TTLCache(default_ttl_seconds=SCOREBOARD_DOWN_TTL)
+        self._scoreboard_failed_days = TTLCache(default_ttl_seconds=SCOREBOARD_DOWN_TTL)
 
     @property
     def name(self) -> str:
@@ -153,25 +249,18 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
             team_id = corrected_id
 
         sport_league = self._get_sport_league_from_db(league)
-        events = []
-        date.today()
-        seen_ids: set[str] = set()
 
-        # 1. Get past games from schedule endpoint (all past games in one call)
+        # Past games from schedule endpoint (all past games in one call), then
+        # future games from scoreboard scanning (reliable for playoffs).
+        # One dedupe pass over both; the first occurrence of an id wins.
         past_events = self._get_past_games_from_schedule(team_id, league, sport_league)
-        for event in past_events:
-            if event.id not in seen_ids:
-                seen_ids.add(event.id)
-                events.append(event)
-
-        # 2. Get future games from scoreboard scanning (reliable for playoffs)
         future_events = self._scan_scoreboard_for_team(team_id, league, days_ahead, sport_league)
-        for event in future_events:
-            if event.id not in seen_ids:
-                seen_ids.add(event.id)
-                events.append(event)
+        events_by_id: dict[str, Event] = {}
+        for event in chain(past_events, future_events):
+            events_by_id.setdefault(event.id, event)
+        events = list(events_by_id.values())
 
-        events.sort(key=lambda e: e.start_time)
+        events.sort(key=attrgetter("start_ts"))
         return events
 
     def _get_past_games_from_schedule(
@@ -242,34 +331,150 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
         """
         events = []
         today = date.today()
+        # Scoreboard index keys are str ids
+        team_id = str(team_id)
+        date_strs = [
+            (today + timedelta(days=day_offset)).strftime("%Y%m%d")
+            for day_offset in range(days_ahead)
+        ]
 
-        for day_offset in range(days_ahead):
-            target_date = today + timedelta(days=day_offset)
-            date_str = target_date.strftime("%Y%m%d")
-
-            data = self._client.get_scoreboard(league, date_str, sport_league)
-            if not data:
-                continue
-
-            for event_data in data.get("events", []):
-                if self._team_in_event(team_id, event_data):
-                    event = self._parse_event(event_data, league)
-                    if event:
-                        events.append(event)
+        for index in self._scoreboard_team_indexes(league, date_strs, sport_league):
+            events.extend(index.get(team_id, ()))
 
         return events
 
-    def _team_in_event(self, team_id: str, event_data: dict) -> bool:
-        """Check if a team is playing in this event."""
-        competitions = event_data.get("competitions", [])
-        if not competitions:
-            return False
+    def _scoreboard_team_indexes(
+        self,
+        league: str,
+        date_strs: list[str],
+        sport_league: tuple[str, str] | None = None,
+    ) -> list[dict[str, list[Event]]]:
+        """Scoreboard team indexes for several dates, in date order.
 
-        for competitor in competitions[0].get("competitors", []):
-            comp_team = competitor.get("team", {})
-            if str(comp_team.get("id")) == str(team_id):
-                return True
-        return False
+        Cached days are read inline; the days still to fetch are requested
+        concurrently on the shared scan pool, so a cold scan costs a few
+        round-trips instead of one per day while the number of scoreboard
+        requests in flight stays bounded however many teams scan at once.
+        """
+        indexes = [
+            self._scoreboard_index.get(_scoreboard_index_key(league, date_str))
+            for date_str in date_strs
+        ]
+        missing = [i for i, index in enumerate(indexes) if index is None]
+        if len(missing) < 2:
+            for i in missing:
+                indexes[i] = self._scoreboard_team_index(league, date_strs[i], sport_league)
+            return indexes
+
+        pool = _get_scan_pool()
+        futures = [
+            pool.submit(self._scoreboard_team_index, league, date_strs[i], sport_league)
+            for i in missing
+        ]
+        for i, future in zip(missing, futures, strict=True):
+            indexes[i] = future.result()
+        return indexes
+
+    def _scoreboard_team_index(
+        self,
+        league: str,
+        date_str: str,
+        sport_league: tuple[str, str] | None = None,
+    ) -> dict[str, list[Event]]:
+        """Map team id -> parsed scoreboard events for one league and date.
+
+        Every team of a league scans the same scoreboards, so the index is
+        built (and each event parsed) once per (league, date) and reused for SCOREBOARD_INDEX_TTL
+        seconds instead of refetching and rescanning the scoreboard per team.
+        Concurrent misses on one key are coalesced into a single fetch.
+        While the league's scoreboard is marked down, days that already got
+        an HTTP error return an empty index without fetching again.
+        """
+        cache_key = _scoreboard_index_key(league, date_str)
+        # Fast path: no lock for a cached index
+        index = self._scoreboard_index.get(cache_key)
+        if index is not None:
+            return index
+        if self._scoreboard_down.get(league) and self._scoreboard_failed_days.get(cache_key):
+            return {}
+
+        with self._scoreboard_locks_lock:
+            lock = self._scoreboard_locks.get(cache_key)
+            if lock is None:
+                lock = self._scoreboard_locks[cache_key] = threading.Lock()
+
+        with lock:
+            # Re-check: another worker may have built it while we waited
+            index = self._scoreboard_index.get(cache_key)
+            if index is None:
+                index = self._build_scoreboard_team_index(cache_key, league, date_str, sport_league)
+            # Done with the key; later misses (e.g. after TTL) get a new lock
+            with self._scoreboard_locks_lock:
+                if self._scoreboard_locks.get(cache_key) is lock:
+                    del self._scoreboard_locks[cache_key]
+        return index
+
+    def _build_scoreboard_team_index(
+        self,
+        cache_key: str,
+        league: str,
+        date_str: str,
+        sport_league: tuple[str, str] | None,
+    ) -> dict[str, list[Event]]:
+        """Fetch one scoreboard and index its parsed events by team id.
+
+        Each event is parsed once here and shared by both of its teams,
+        rather than re-parsed from the raw dict by every team scan.
+        """
+        index: dict[str, list[Event]] = {}
+        data, status = self._client.get_scoreboard_with_status(league, date_str, sport_league)
+        for event_data in (data or _EMPTY).get("events", ()):
+            competitions = event_data.get("competitions")
+            if not competitions:
+                continue
+            event = self._parse_event(event_data, league)
+            if event is None:
+                continue
+            for competitor in competitions[0].get("competitors", ()):
+                comp_team_id = str((competitor.get("team") or _EMPTY).get("id"))
+                bucket = index.setdefault(comp_team_id, [])
+                # A team listed twice in one event still gets the event once
+                if not bucket or bucket[-1] is not event:
+                    bucket.append(event)
+
+        # Failed fetches are not cached, so the next team retries - until
+        # the league has had SCOREBOARD_DOWN_AFTER HTTP errors in a row.
+        # Timeouts and pool exhaustion say nothing about the endpoint, so
+        # they are retried without counting.
+        if data:
+            self._scoreboard_index.set(cache_key, index)
+            self._record_scoreboard_result(league, cache_key, ok=True)
+        elif status is not None:
+            self._record_scoreboard_result(league, cache_key, ok=False)
+        return index
+
+    def _record_scoreboard_result(self, league: str, cache_key: str, ok: bool) -> None:
+        """Track consecutive scoreboard HTTP errors and mark a failing league down."""
+        with self._scoreboard_locks_lock:
+            if ok:
+                self._scoreboard_failures.pop(league, None)
+                self._scoreboard_failed_days.delete(cache_key)
+                self._scoreboard_down.delete(league)
+                return
+            self._scoreboard_failed_days.set(cache_key, True)
+            failures = self._scoreboard_failures.get(league, 0) + 1
+            if failures < SCOREBOARD_DOWN_AFTER:
+                self._scoreboard_failures[league] = failures
+                return
+            self._scoreboard_failures.pop(league, None)
+            self._scoreboard_down.set(league, True)
+        logger.warning(
+            "[ESPN] %d scoreboard fetches for %s failed in a row; "
+            "not retrying its failed days for %ds",
+            failures,
+            league,
+            SCOREBOARD_DOWN_TTL,
+        )
 
     def get_team(self, team_id: str, league: str) -> Team | None:
         # Combat sports don't have teams endpoint - skip to avoid 404 spam
@@ -408,12 +613,12 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
             if not event_id:
                 return None
 
-            competitions = data.get("competitions", [])
+            competitions = data.get("competitions")
             if not competitions:
                 return None
 
             competition = competitions[0]
-            competitors = competition.get("competitors", [])
+            competitors = competition.get("competitors") or ()
             if len(competitors) < 2:
                 return None
 
@@ -428,8 +633,10 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
             if not home_data or not away_data:
                 return None
 
-            # Get sport from ESPN's own league mapping
-            sport = self._get_sport(league)
+            # Get sport from ESPN's own league mapping. Interned: league/sport
+            # repeat on every event and team
+            league = sys.intern(league)
+            sport = sys.intern(self._get_sport(league))
 
             home_team = self._parse_team(home_data, league, sport)
             away_team = self._parse_team(away_data, league, sport)
@@ -439,17 +646,17 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
             if not start_time:
                 return None
 
-            status = self._parse_status(competition.get("status", {}))
+            status = self._parse_status(competition.get("status") or _EMPTY)
             venue = self._parse_venue(competition.get("venue"))
-            broadcasts = self._parse_broadcasts(competition.get("broadcasts", []))
-            odds_data = self._parse_odds(competition.get("odds", []))
+            broadcasts = self._parse_broadcasts(competition.get("broadcasts") or ())
+            odds_data = self._parse_odds(competition.get("odds") or ())
 
             home_score = self._parse_score(home_data.get("score"))
             away_score = self._parse_score(away_data.get("score"))
 
             # Parse season type from ESPN data
             # ESPN uses: 1=preseason, 2=regular, 3=postseason/playoffs
-            season_data = data.get("season", {})
+            season_data = data.get("season") or _EMPTY
             season_type_num = season_data.get("type")
             season_type = self._parse_season_type(season_type_num)
             season_year = season_data.get("year")
@@ -479,13 +686,14 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
 
     def _parse_team(self, competitor: dict, league: str, sport: str) -> Team:
         """Parse competitor data into Team."""
-        team_data = competitor.get("team", {})
+        team_data = competitor.get("team") or _EMPTY
         return Team(
-            id=team_data.get("id", competitor.get("id", "")),
+            # Canonical interned str: team ids are compared on every event
+            id=sys.intern(str(team_data.get("id", competitor.get("id", "")))),
             provider=self.name,
             name=team_data.get("displayName", ""),
             short_name=team_data.get("shortDisplayName", ""),
-            abbreviation=team_data.get("abbreviation", ""),
+            abbreviation=sys.intern(team_data.get("abbreviation", "")),
             league=league,
             sport=sport,
             logo_url=self._extract_logo(team_data),
@@ -494,9 +702,9 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
 
     def _parse_status(self, status_data: dict) -> EventStatus:
         """Parse status data into EventStatus."""
-        type_data = status_data.get("type", {})
+        type_data = status_data.get("type") or _EMPTY
         espn_status = type_data.get("name", "STATUS_SCHEDULED")
-        state = STATUS_MAP.get(espn_status, "scheduled")
+        state = STATUS_MAP.get(espn_status) or STATE_MAP.get(type_data.get("state"), "scheduled")
 
         return EventStatus(
             state=state,
@@ -510,7 +718,7 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
         if not venue_data:
             return None
 
-        address = venue_data.get("address", {})
+        address = venue_data.get("address") or _EMPTY
         return Venue(
             name=venue_data.get("fullName", ""),
             city=address.get("city"),
@@ -518,7 +726,7 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
             country=address.get("country"),
         )
 
-    def _parse_broadcasts(self, broadcasts_data: list) -> list[str]:
+    def _parse_broadcasts(self, broadcasts_data: list) -> tuple[str, ...]:
         """Extract broadcast network names.
 
         Handles two formats:
@@ -528,7 +736,7 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
         networks = []
         for broadcast in broadcasts_data:
             # Scoreboard format: names array
-            names = broadcast.get("names", [])
+            names = broadcast.get("names")
             if names:
                 networks.extend(names)
             # Summary format: media.shortName
@@ -536,18 +744,13 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
                 short_name = broadcast["media"].get("shortName")
                 if short_name:
                     networks.append(short_name)
-        return networks
+        return tuple(sys.intern(n) for n in networks)
 
     def _parse_datetime(self, date_str: str) -> datetime | None:
         """Parse ESPN date string to UTC datetime."""
         if not date_str:
             return None
-        try:
-            if date_str.endswith("Z"):
-                return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            return datetime.fromisoformat(date_str)
-        except ValueError:
-            return None
+        return _parse_espn_datetime(date_str)
 
     def _parse_score(self, score) -> int | None:
         """Parse score to int. Handles string or dict format."""
@@ -576,13 +779,7 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
         """
         if type_num is None:
             return None
-        season_map = {
-            1: "preseason",
-            2: "regular",
-            3: "postseason",
-            4: "offseason",
-        }
-        return season_map.get(type_num)
+        return _SEASON_TYPES.get(type_num)
 
     def _parse_odds(self, odds_list: list) -> dict | None:
         """Parse ESPN odds data into structured dict.
@@ -609,7 +806,7 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
             # Take first provider (highest priority)
             odds = odds_list[0]
 
-            provider_data = odds.get("provider", {})
+            provider_data = odds.get("provider") or _EMPTY
             provider_name = provider_data.get("name", "")
 
             # Get spread and over/under
@@ -622,8 +819,8 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
             away_ml = None
 
             # Pickcenter format: homeTeamOdds.moneyLine (int)
-            home_team_odds = odds.get("homeTeamOdds", {})
-            away_team_odds = odds.get("awayTeamOdds", {})
+            home_team_odds = odds.get("homeTeamOdds") or _EMPTY
+            away_team_odds = odds.get("awayTeamOdds") or _EMPTY
             if home_team_odds.get("moneyLine") is not None:
                 home_ml = int(home_team_odds["moneyLine"])
             if away_team_odds.get("moneyLine") is not None:
@@ -634,13 +831,13 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
                 moneyline = odds.get("moneyline", {})
                 if moneyline:
                     if home_ml is None:
-                        home_close = moneyline.get("home", {}).get("close", {})
+                        home_close = (moneyline.get("home") or _EMPTY).get("close") or _EMPTY
                         try:
                             home_ml = int(home_close.get("odds", "").replace("+", ""))
                         except (ValueError, AttributeError):
                             pass
                     if away_ml is None:
-                        away_close = moneyline.get("away", {}).get("close", {})
+                        away_close = (moneyline.get("away") or _EMPTY).get("close") or _EMPTY
                         try:
                             away_ml = int(away_close.get("odds", "").replace("+", ""))
                         except (ValueError, AttributeError):
@@ -790,22 +987,20 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
         if not away_record:
             away_record = self._build_record_from_stats(stats, "away", record_str)
 
-        # Parse streak
+        # Parse streak (signed: positive = wins, negative = losses)
         streak_count = int(stats.get("streak", 0))
-        streak_str = self._format_streak(streak_count)
 
         # Get conference/division
         groups = team_data.get("groups", {})
         conference, conference_abbrev, division = self._parse_groups(groups)
 
         return TeamStats(
-            record=record_str,
             wins=wins,
             losses=losses,
             ties=ties,
+            uses_draws=len(record_str.split("-")) == 3,
             home_record=home_record,
             away_record=away_record,
-            streak=streak_str,
             streak_count=streak_count,
             rank=team_data.get("rank") if team_data.get("rank", 99) <= 25 else None,
             playoff_seed=int(stats.get("playoffSeed", 0)) or None,
@@ -847,14 +1042,6 @@ class ESPNProvider(UFCParserMixin, TournamentParserMixin, SportsProvider):
             return f"{wins}-{losses}-{ties}"
         return f"{wins}-{losses}"
 
-    def _format_streak(self, streak_count: int) -> str:
-        """Format streak count to 'W3' or 'L2' format."""
-        if streak_count > 0:
-            return f"W{streak_count}"
-        elif streak_count < 0:
-            return f"L{abs(streak_count)}"
-        return ""
-
     def _parse_groups(self, groups: dict) -> tuple[str | None, str | None, str | None]:
         """Parse conference/division from groups structure.
 
@@ -5,7 +5,7 @@ traditional home/away matchups.
 """
 
 import logging
-from datetime import date, datetime
+from datetime import date
 
 from teamarr.core import Event, EventStatus, Team, Venue
 
@@ -18,6 +18,7 @@ class TournamentParserMixin:
     Requires:
         - self._client: ESPNClient instance
         - self.name: Provider name ('espn')
+        - self._parse_datetime(date_str): Parse datetime from string
     """
 
     def _get_tournament_events(self, league: str, target_date: date, sport: str) -> list[Event]:
@@ -54,7 +55,9 @@ class TournamentParserMixin:
             if not date_str:
                 return None
 
-            start_time = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+            start_time = self._parse_datetime(date_str)
+            if not start_time:
+                return None
 
             event_name = data.get("name", "")
             short_name = data.get("shortName", event_name)
@@ -110,7 +113,7 @@ class TournamentParserMixin:
                 league=league,
                 sport=sport,
                 venue=venue,
-                broadcasts=[],
+                broadcasts=(),
             )
 
         except Exception as e:
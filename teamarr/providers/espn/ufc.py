@@ -10,6 +10,13 @@ from teamarr.core import Bout, Event, EventStatus, Team
 
 logger = logging.getLogger(__name__)
 
+# ESPN status.type.state -> EventStatus.state
+_UFC_STATE_MAP = {
+    "pre": "scheduled",
+    "in": "live",
+    "post": "final",
+}
+
 
 class UFCParserMixin:
     """Mixin providing UFC-specific parsing methods.
@@ -180,7 +187,7 @@ class UFCParserMixin:
                 sport="mma",  # Lowercase code; display name from sports table
                 main_card_start=main_card_start,
                 segment_times=segment_times,
-                bouts=bouts,
+                bouts=tuple(bouts),
                 fight_result_method=fight_result_method,
                 finish_round=finish_round,
                 finish_time=finish_time,
@@ -203,7 +210,7 @@ class UFCParserMixin:
             # Prefer full size, fallback to any available
             logo_url = headshots.get("full", {}).get("href")
             if not logo_url:
-                for size in ["xlarge", "large", "medium"]:
+                for size in ("xlarge", "large", "medium"):
                     if size in headshots:
                         logo_url = headshots[size].get("href")
                         break
@@ -237,15 +244,10 @@ class UFCParserMixin:
 
     def _parse_ufc_status(self, status_data: dict) -> EventStatus:
         """Parse UFC event status."""
-        state_map = {
-            "pre": "scheduled",
-            "in": "live",
-            "post": "final",
-        }
         # State is nested inside type object
         status_type = status_data.get("type", {})
         state = status_type.get("state", "pre")
-        mapped_state = state_map.get(state, "scheduled")
+        mapped_state = _UFC_STATE_MAP.get(state, "scheduled")
 
         # Extract round (period) and time for finished fights
         period = status_data.get("period")
@@ -269,29 +269,54 @@ class HockeyTechClient:
         """
         from datetime import timedelta
 
-        schedule = self.get_schedule(league)
         today = date.today()
         start_date = today - timedelta(days=self.DAYS_BACK)
         end_date = today + timedelta(days=days_ahead)
 
         team_games = []
-        for game in schedule:
-            # Check if team is home or away
-            if game.get("home_team") == team_id or game.get("visiting_team") == team_id:
-                # Check date is within range (includes past games)
-                game_date_str = game.get("date_played")
-                if game_date_str:
-                    try:
-                        game_date = date.fromisoformat(game_date_str)
-                        if start_date <= game_date <= end_date:
-                            team_games.append(game)
-                    except ValueError:
-                        continue
-
-        # Sort by date
-        team_games.sort(key=lambda g: g.get("date_played", ""))
+        # Only this team's games (home or away), from the per-league index
+        for game in self._get_schedule_team_index(league).get(team_id, ()):
+            # Check date is within range (includes past games)
+            game_date_str = game.get("date_played")
+            if game_date_str:
+                try:
+                    game_date = date.fromisoformat(game_date_str)
+                    if start_date <= game_date <= end_date:
+                        team_games.append(game)
+                except ValueError:
+                    continue
+
+        # Already in date order: the index keeps each team's games sorted
         return team_games
 
+    def _get_schedule_team_index(self, league: str) -> dict[str, list[dict]]:
+        """Map team id -> that team's games from the full season schedule.
+
+        Every team of a league filters the same season schedule, so it is
+        indexed once and cached alongside it instead of scanned per team.
+        Each team's games are sorted by date here, once, so filtering them
+        keeps them in order without a sort per call.
+        """
+        cache_key = make_cache_key("hockeytech", "schedule_index", league)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        schedule = self.get_schedule(league)
+        index: dict[str, list[dict]] = {}
+        for game in schedule:
+            home = game.get("home_team")
+            visiting = game.get("visiting_team")
+            index.setdefault(home, []).append(game)
+            if visiting != home:
+                index.setdefault(visiting, []).append(game)
+        for games in index.values():
+            games.sort(key=lambda g: g.get("date_played") or "")
+
+        if schedule:
+            self._cache.set(cache_key, index, CACHE_TTL_SCHEDULE)
+        return index
+
     def get_teams(self, league: str) -> list[dict]:
         """Get all teams in a league.
 
@@ -326,6 +351,23 @@ class HockeyTechClient:
 
         return teams
 
+    def get_team_index(self, league: str) -> dict[str, dict]:
+        """Map team id (as str) -> team dict for a league.
+
+        Built once per cached teams list, so team lookups are a dict hit
+        instead of a scan that stringifies every team's id.
+        """
+        cache_key = make_cache_key("hockeytech", "team_index", league)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        teams = self.get_teams(league)
+        index = {str(team.get("id")): team for team in reversed(teams)}
+        if teams:
+            self._cache.set(cache_key, index, CACHE_TTL_TEAMS)
+        return index
+
     def get_scorebar(self, league: str) -> list[dict]:
         """Get live scorebar data.
 
@@ -362,8 +404,9 @@ class HockeyTechClient:
             Game dict or None if not found
         """
         schedule = self.get_schedule(league)
+        game_id = str(game_id)
         for game in schedule:
-            if str(game.get("game_id")) == str(game_id):
+            if str(game.get("game_id")) == game_id:
                 return game
         return None
 
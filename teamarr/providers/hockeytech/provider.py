@@ -6,7 +6,9 @@ Used for CHL leagues (OHL, WHL, QMJHL) plus AHL, PWHL, USHL.
 
 import logging
 import re
+import sys
 from datetime import UTC, date, datetime
+from operator import attrgetter
 
 from teamarr.core import (
     Event,
@@ -21,6 +23,22 @@ from teamarr.providers.hockeytech.client import HockeyTechClient
 
 logger = logging.getLogger(__name__)
 
+# game_status patterns (compiled once, used for every game)
+_LIVE_PERIOD_RE = re.compile(r"(1st|2nd|3rd|ot|so|\d+:\d+)")
+_SCHEDULED_TIME_RE = re.compile(r"\d{1,2}:\d{2}\s*(am|pm|AM|PM)")
+
+# Exact game_status values (lowercased) -> EventStatus.state. Other "Final..."
+# variants (e.g. "Final 2OT") are caught by a prefix check.
+_STATUS_STATES = {
+    "final": "final",
+    "final ot": "final",
+    "final so": "final",
+    "ppd": "postponed",
+    "postponed": "postponed",
+    "cancelled": "cancelled",
+    "canceled": "cancelled",
+}
+
 
 class HockeyTechProvider(SportsProvider):
     """HockeyTech implementation of SportsProvider.
@@ -75,16 +93,15 @@ class HockeyTechProvider(SportsProvider):
             if event:
                 events.append(event)
         # Sort by start time
-        events.sort(key=lambda e: e.start_time)
+        events.sort(key=attrgetter("start_ts"))
         return events
 
     def get_team(self, team_id: str, league: str) -> Team | None:
         """Get team details."""
-        teams = self._client.get_teams(league)
-        for team_data in teams:
-            if str(team_data.get("id")) == str(team_id):
-                return self._parse_team(team_data, league)
-        return None
+        team_data = self._client.get_team_index(league).get(str(team_id))
+        if team_data is None:
+            return None
+        return self._parse_team(team_data, league)
 
     def get_event(self, event_id: str, league: str) -> Event | None:
         """Get a specific event by ID."""
@@ -207,7 +224,7 @@ class HockeyTechProvider(SportsProvider):
             logo_url = f"https://assets.leaguestat.com/{client_code}/logos/{team_id}.png"
 
         return Team(
-            id=str(team_id) if team_id else "",
+            id=sys.intern(str(team_id)) if team_id else "",
             provider=self.name,
             name=name,
             short_name=nickname or name,
@@ -295,26 +312,21 @@ class HockeyTechProvider(SportsProvider):
 
         status_lower = status_str.lower()
 
-        # Final states
-        if status_lower.startswith("final"):
-            return EventStatus(state="final", detail=status_str)
-
-        # Postponed
-        if status_lower in ("ppd", "postponed"):
+        # Final, postponed and cancelled states
+        state = _STATUS_STATES.get(status_lower)
+        if state is None and status_lower.startswith("final"):
+            state = "final"
+        if state == "postponed":
             return EventStatus(state="postponed", detail="Postponed")
-
-        # Cancelled
-        if status_lower in ("cancelled", "canceled"):
-            return EventStatus(state="cancelled", detail=status_str)
+        if state is not None:
+            return EventStatus(state=state, detail=status_str)
 
         # Live game - check for period indicators
-        period_pattern = r"(1st|2nd|3rd|ot|so|\d+:\d+)"
-        if re.search(period_pattern, status_lower):
+        if _LIVE_PERIOD_RE.search(status_lower):
             return EventStatus(state="live", detail=status_str)
 
         # Time pattern (scheduled) - e.g., "7:00 PM EST"
-        time_pattern = r"\d{1,2}:\d{2}\s*(am|pm|AM|PM)"
-        if re.search(time_pattern, status_str):
+        if _SCHEDULED_TIME_RE.search(status_str):
             return EventStatus(state="scheduled", detail=None)
 
         # Default to scheduled
@@ -344,13 +356,13 @@ class HockeyTechProvider(SportsProvider):
             country=None,
         )
 
-    def _parse_broadcasts(self, game: dict) -> list[str]:
+    def _parse_broadcasts(self, game: dict) -> tuple[str, ...]:
         """Parse broadcast info from HockeyTech data."""
         broadcasts = []
         broadcasters = game.get("broadcasters", {})
 
         # Handle different broadcaster types
-        for key in ["home", "away", "national"]:
+        for key in ("home", "away", "national"):
             bc = broadcasters.get(key, [])
             if isinstance(bc, list):
                 for b in bc:
@@ -361,7 +373,7 @@ class HockeyTechProvider(SportsProvider):
                     elif isinstance(b, str) and b not in broadcasts:
                         broadcasts.append(b)
 
-        return broadcasts
+        return tuple(sys.intern(b) for b in broadcasts)
 
     def _parse_score(self, score) -> int | None:
         """Parse score value."""
@@ -25,6 +25,7 @@ Dependencies are injected via constructor:
 This client has NO direct database access - all config is injected.
 """
 
+import itertools
 import logging
 import threading
 import time
@@ -112,6 +113,30 @@ class RateLimitStats:
         }
 
 
+class _RequestCounter:
+    """Request counter whose increments take no lock.
+
+    itertools.count.__next__ is a single C call, so concurrent increments
+    are safe without a mutex. Reading also consumes a value; readers track
+    those (under a lock only readers take) and subtract them.
+    """
+
+    def __init__(self) -> None:
+        self._counter = itertools.count()
+        self._reads = 0
+        self._read_lock = threading.Lock()
+
+    def increment(self) -> None:
+        next(self._counter)
+
+    @property
+    def value(self) -> int:
+        with self._read_lock:
+            count = next(self._counter) - self._reads
+            self._reads += 1
+            return count
+
+
 class RateLimiter:
     """Sliding window rate limiter with statistics tracking.
 
@@ -134,15 +159,20 @@ class RateLimiter:
         self._requests: deque[float] = deque()
         self._lock = threading.Lock()
         self._stats = RateLimitStats()
+        # Counted outside _lock: premium keys would otherwise take the lock
+        # on every request just to add one
+        self._request_count = _RequestCounter()
 
     @property
     def stats(self) -> RateLimitStats:
         """Get current rate limit statistics."""
+        self._stats.total_requests = self._request_count.value
         return self._stats
 
     def reset_stats(self) -> None:
         """Reset statistics (e.g., at start of new EPG generation)."""
         self._stats = RateLimitStats()
+        self._request_count = _RequestCounter()
 
     def record_reactive_wait(self, wait_seconds: float, attempt: int, max_attempts: int) -> None:
         """Record a reactive wait (429 response from API)."""
@@ -158,14 +188,13 @@ class RateLimiter:
         Premium API keys skip rate limiting entirely.
         Free API keys wait 30 seconds when limit is reached.
         """
+        self._request_count.increment()
+
         # Premium keys bypass rate limiting
         if self._is_premium:
-            with self._lock:
-                self._stats.total_requests += 1
             return
 
         with self._lock:
-            self._stats.total_requests += 1
             now = time.time()
 
             # Remove expired timestamps
@@ -5,8 +5,10 @@ Used as fallback for leagues not supported by ESPN.
 """
 
 import logging
+import sys
 from collections.abc import Callable
 from datetime import UTC, date, datetime, timedelta
+from operator import attrgetter
 
 from teamarr.core import (
     Event,
@@ -21,6 +23,24 @@ from teamarr.providers.tsdb.client import TSDBClient
 
 logger = logging.getLogger(__name__)
 
+# TSDB strStatus (lowercased) -> EventStatus.state
+_TSDB_STATUS_MAP = {
+    "ft": "final",
+    "aet": "final",
+    "finished": "final",
+    "match finished": "final",
+    "live": "live",
+    "1h": "live",
+    "2h": "live",
+    "ht": "live",
+    "et": "live",
+    "ns": "scheduled",
+    "not started": "scheduled",
+    "": "scheduled",
+    "cancelled": "cancelled",
+    "canceled": "cancelled",
+}
+
 # Type alias for team name resolver callback
 # Takes (team_id, league) -> team_name or None
 TeamNameResolver = Callable[[str, str], str | None]
@@ -153,17 +173,10 @@ class TSDBProvider(SportsProvider):
         today = date.today()
         seen_ids: set[str] = set()
 
-        # 1. Scan past days for .last variable resolution
-        for i in range(self.DAYS_BACK, 0, -1):
-            target_date = today - timedelta(days=i)
-            team_events = self._get_events_for_team(league, target_date, team_name)
-            for event in team_events:
-                if event.id not in seen_ids:
-                    seen_ids.add(event.id)
-                    events.append(event)
-
-        # 2. Scan future days (including today)
-        for i in range(days_ahead):
+        # One pass from DAYS_BACK days ago (for .last variable resolution)
+        # through the future days (including today). Sequential: TSDB is
+        # rate limited.
+        for i in range(-self.DAYS_BACK, days_ahead):
             target_date = today + timedelta(days=i)
             team_events = self._get_events_for_team(league, target_date, team_name)
             for event in team_events:
@@ -172,7 +185,7 @@ class TSDBProvider(SportsProvider):
                     events.append(event)
 
         # Sort by start time
-        events.sort(key=lambda e: e.start_time)
+        events.sort(key=attrgetter("start_ts"))
         return events
 
     def _get_events_for_team(
@@ -225,8 +238,10 @@ class TSDBProvider(SportsProvider):
         """
         if not self._team_name_resolver:
             logger.warning(
-                f"No team_name_resolver configured for TSDB provider. "
-                f"Cannot resolve team {team_id} in league {league}."
+                "No team_name_resolver configured for TSDB provider. "
+                "Cannot resolve team %s in league %s.",
+                team_id,
+                league,
             )
             return None
 
@@ -237,8 +252,10 @@ class TSDBProvider(SportsProvider):
 
         # Team not in seeded cache - this shouldn't happen in normal operation
         logger.debug(
-            f"TSDB team {team_id} not found in seeded cache for league {league}. "
-            "Run cache refresh or check tsdb_seed.json."
+            "TSDB team %s not found in seeded cache for league %s. "
+            "Run cache refresh or check tsdb_seed.json.",
+            team_id,
+            league,
         )
         return None
 
@@ -262,8 +279,10 @@ class TSDBProvider(SportsProvider):
         # Validate - free tier bug returns wrong team
         if str(team_data.get("idTeam")) != str(team_id):
             logger.warning(
-                f"TSDB lookupteam.php bug: requested {team_id}, "
-                f"got {team_data.get('idTeam')} ({team_data.get('strTeam')})"
+                "TSDB lookupteam.php bug: requested %s, got %s (%s)",
+                team_id,
+                team_data.get("idTeam"),
+                team_data.get("strTeam"),
             )
             return None
 
@@ -393,7 +412,7 @@ class TSDBProvider(SportsProvider):
             else:
                 # Standard team sport
                 home_team = Team(
-                    id=str(data.get("idHomeTeam", "")),
+                    id=sys.intern(str(data.get("idHomeTeam", ""))),
                     provider=self.name,
                     name=home_name or "",
                     short_name=home_name or "",
@@ -405,7 +424,7 @@ class TSDBProvider(SportsProvider):
                 )
 
                 away_team = Team(
-                    id=str(data.get("idAwayTeam", "")),
+                    id=sys.intern(str(data.get("idAwayTeam", ""))),
                     provider=self.name,
                     name=away_name or "",
                     short_name=away_name or "",
@@ -446,7 +465,7 @@ class TSDBProvider(SportsProvider):
                 home_score=home_score,
                 away_score=away_score,
                 venue=venue,
-                broadcasts=[],  # TSDB doesn't provide broadcast info
+                broadcasts=(),  # TSDB doesn't provide broadcast info
             )
 
         except Exception as e:
@@ -531,8 +550,7 @@ class TSDBProvider(SportsProvider):
         if timestamp_str:
             try:
                 # TSDB timestamps are ISO format, may or may not have Z suffix
-                if timestamp_str.endswith("Z"):
-                    return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+                # (fromisoformat reads "Z" as UTC since Python 3.11)
                 dt = datetime.fromisoformat(timestamp_str)
                 # Assume UTC if no timezone
                 if dt.tzinfo is None:
@@ -568,16 +586,11 @@ class TSDBProvider(SportsProvider):
             return EventStatus(state="postponed", detail="Postponed")
 
         # TSDB uses different status values
-        status_lower = status_str.lower() if status_str else ""
-
-        if status_lower in ("ft", "aet", "finished", "match finished"):
-            return EventStatus(state="final", detail=status_str)
-        elif status_lower in ("live", "1h", "2h", "ht", "et"):
-            return EventStatus(state="live", detail=status_str)
-        elif status_lower in ("ns", "not started", ""):
+        state = _TSDB_STATUS_MAP.get(status_str.lower() if status_str else "")
+        if state == "scheduled":
             return EventStatus(state="scheduled", detail=None)
-        elif status_lower in ("cancelled", "canceled"):
-            return EventStatus(state="cancelled", detail=status_str)
+        if state is not None:
+            return EventStatus(state=state, detail=status_str)
 
         # Default to scheduled
         return EventStatus(state="scheduled", detail=status_str if status_str else None)
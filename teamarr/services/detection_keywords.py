@@ -105,9 +105,7 @@ class DetectionKeywordService:
             user_by_type: dict[str, list[str]] = {}
             for kw in user_keywords:
                 event_type = kw["target_value"] or "EVENT_CARD"  # Default to EVENT_CARD
-                if event_type not in user_by_type:
-                    user_by_type[event_type] = []
-                user_by_type[event_type].append(kw["keyword"].lower())
+                user_by_type.setdefault(event_type, []).append(kw["keyword"].lower())
 
             # Merge: user keywords first (by priority), then built-in not in user list
             for event_type, user_kw_list in user_by_type.items():
@@ -98,9 +98,7 @@ class LeagueMappingService:
                 self._mappings[key] = mapping
 
                 # Also index by provider for get_leagues_for_provider
-                if row["provider"] not in self._provider_leagues:
-                    self._provider_leagues[row["provider"]] = []
-                self._provider_leagues[row["provider"]].append(mapping)
+                self._provider_leagues.setdefault(row["provider"], []).append(mapping)
 
                 league_code_lower = row["league_code"].lower()
 
@@ -186,12 +184,14 @@ class LeagueMappingService:
         key = league_code.lower()
 
         # Try league_alias (already includes display_name fallback from load)
-        if key in self._league_aliases:
-            return self._league_aliases[key]
+        alias = self._league_aliases.get(key)
+        if alias is not None:
+            return alias
 
         # Fallback to league_cache name
-        if key in self._league_cache_names:
-            return self._league_cache_names[key]
+        cache_name = self._league_cache_names.get(key)
+        if cache_name is not None:
+            return cache_name
 
         # Final fallback
         return league_code.upper()
@@ -230,12 +230,14 @@ class LeagueMappingService:
         key = league_code.lower()
 
         # Try display_name from leagues table
-        if key in self._league_display_names:
-            return self._league_display_names[key]
+        display_name = self._league_display_names.get(key)
+        if display_name is not None:
+            return display_name
 
         # Fallback to league_name from league_cache
-        if key in self._league_cache_names:
-            return self._league_cache_names[key]
+        cache_name = self._league_cache_names.get(key)
+        if cache_name is not None:
+            return cache_name
 
         # Final fallback to league_code uppercase
         return league_code.upper()
@@ -258,8 +260,9 @@ class LeagueMappingService:
         key = league_code.lower()
 
         # Try curated gracenote_category
-        if key in self._gracenote_categories:
-            return self._gracenote_categories[key]
+        category = self._gracenote_categories.get(key)
+        if category is not None:
+            return category
 
         # Auto-generate from display_name + sport (with proper sport display name)
         display_name = self.get_league_display_name(league_code)
@@ -290,8 +293,9 @@ class LeagueMappingService:
         key = sport_code.lower()
 
         # Look up in cached sports table
-        if key in self._sport_display_names:
-            return self._sport_display_names[key]
+        display_name = self._sport_display_names.get(key)
+        if display_name is not None:
+            return display_name
 
         # Fallback to title case
         return sport_code.title()
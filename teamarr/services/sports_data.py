@@ -10,9 +10,13 @@ Uses PersistentTTLCache for all caching:
 - Call flush_cache() after EPG generation for immediate persistence
 """
 
+import dataclasses
 import logging
 import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date
+from typing import Any, TypeVar
 
 from teamarr.core import Event, SportsProvider, Team, TeamStats
 from teamarr.database.provider_cache import (
@@ -20,6 +24,7 @@ from teamarr.database.provider_cache import (
     dict_to_stats,
     dict_to_team,
     event_to_dict,
+    events_to_dicts,
     stats_to_dict,
     team_to_dict,
 )
@@ -37,6 +42,15 @@ from teamarr.utilities.event_status import is_event_final
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Cap on memoized decoded payloads per service (cleared wholesale when hit)
+_DECODED_MEMO_MAX_SIZE = 5000
+
+# Leagues pre-warmed concurrently from TSDB. The client's rate limiter still
+# paces requests; this only lets their round-trips overlap.
+_PREWARM_MAX_WORKERS = 8
+
 # Singleton cache instance - shared across all SportsDataService instances
 # This ensures one in-memory cache with background persistence
 _shared_cache: PersistentTTLCache | None = None
@@ -116,6 +130,64 @@ class SportsDataService:
     def __init__(self, providers: list[SportsProvider] | None = None):
         self._providers: list[SportsProvider] = providers or []
         self._cache = _get_shared_cache()
+        # cache_key -> (cached payload, decoded value). The cache hands back
+        # the same payload object until the entry is replaced or expires, so
+        # a payload is deserialized once rather than on every hit.
+        self._decoded: dict[str, tuple[Any, Any]] = {}
+        # cache_key -> Future for a provider fetch in progress. The lock only
+        # guards this dict and is never held across the network call.
+        self._inflight: dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _decode(self, cache_key: str, cached: Any, decode: Callable[[Any], T]) -> T:
+        """Deserialize a cache payload, reusing the result for the same payload."""
+        memo = self._decoded.get(cache_key)
+        if memo is not None and memo[0] is cached:
+            return memo[1]
+        value = decode(cached)
+        self._remember(cache_key, cached, value)
+        return value
+
+    def _remember(self, cache_key: str, payload: Any, value: Any) -> None:
+        """Record the decoded form of a payload just read from or written to the cache."""
+        if len(self._decoded) >= _DECODED_MEMO_MAX_SIZE:
+            self._decoded.clear()
+        self._decoded[cache_key] = (payload, value)
+
+    def _fetch_once(self, cache_key: str, fetch: Callable[[], T]) -> tuple[T, bool]:
+        """Run fetch for a cache miss, sharing one in-flight call per key.
+
+        The first caller for a key runs fetch; concurrent callers for the
+        same key wait for its result instead of repeating the request.
+        Callers for other keys are never blocked.
+
+        Returns:
+            (result, True if this caller ran fetch)
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            owner = future is None
+            if owner:
+                future = self._inflight[cache_key] = Future()
+
+        if not owner:
+            return future.result(), False
+
+        try:
+            result = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, True
+        finally:
+            with self._inflight_lock:
+                del self._inflight[cache_key]
+
+    @staticmethod
+    def _decode_events(cached: list[dict]) -> list[Event]:
+        return [dict_to_event(e) for e in cached]
 
     def add_provider(self, provider: SportsProvider) -> None:
         """Register a provider."""
@@ -131,7 +203,10 @@ class SportsDataService:
                        Use for older dates where we don't want to fetch.
 
         Returns:
-            List of events (may be empty if cache_only and not cached)
+            List of events (may be empty if cache_only and not cached).
+            The list is the caller's own, but the Event objects in it are
+            shared with other callers and the decode memo: never mutate
+            them (use dataclasses.replace for a modified copy).
         """
         cache_key = make_cache_key("events", league, target_date.isoformat())
 
@@ -140,7 +215,8 @@ class SportsDataService:
         if cached is not None:
             logger.debug("[CACHE_HIT] %s", cache_key)
             try:
-                return [dict_to_event(e) for e in cached]
+                # Copy: callers may sort or extend the list they get back
+                return list(self._decode(cache_key, cached, self._decode_events))
             except (KeyError, TypeError) as e:
                 logger.warning("[CACHE_ERROR] Deserialization failed: %s", e)
 
@@ -148,19 +224,27 @@ class SportsDataService:
         if cache_only:
             return []
 
-        # Iterate through providers
-        for provider in self._providers:
-            if provider.supports_league(league):
-                events = provider.get_events(league, target_date)
-                # Check if all events are final (for past dates, enables 30-day cache)
-                # Empty list counts as "all final" (no games = nothing to update)
-                all_final = len(events) == 0 or all(is_event_final(e) for e in events)
-                ttl = get_events_cache_ttl(target_date, all_events_final=all_final)
-                # Cache ALL results including empty lists to avoid repeated API calls
-                # for leagues with no events on a given day
-                self._cache.set(cache_key, [event_to_dict(e) for e in events], ttl)
-                return events
-        return []
+        def fetch() -> list[Event]:
+            # Iterate through providers
+            for provider in self._providers:
+                if provider.supports_league(league):
+                    events = provider.get_events(league, target_date)
+                    # Check if all events are final (for past dates, enables 30-day cache)
+                    # Empty list counts as "all final" (no games = nothing to update)
+                    all_final = len(events) == 0 or all(is_event_final(e) for e in events)
+                    ttl = get_events_cache_ttl(target_date, all_events_final=all_final)
+                    # Cache ALL results including empty lists to avoid repeated API calls
+                    # for leagues with no events on a given day
+                    serialized = events_to_dicts(events)
+                    self._cache.set(cache_key, serialized, ttl)
+                    self._remember(cache_key, serialized, list(events))
+                    return events
+            return []
+
+        # Parallel league/date scans often miss on the same scoreboard at once
+        events, fetched = self._fetch_once(cache_key, fetch)
+        # Waiters share the fetcher's list; give them their own copy
+        return events if fetched else list(events)
 
     def get_team_schedule(
         self,
@@ -176,7 +260,7 @@ class SportsDataService:
         if cached is not None:
             logger.debug("[CACHE_HIT] %s", cache_key)
             try:
-                return [dict_to_event(e) for e in cached]
+                return list(self._decode(cache_key, cached, self._decode_events))
             except (KeyError, TypeError) as e:
                 logger.warning("[CACHE_ERROR] Deserialization failed: %s", e)
 
@@ -186,8 +270,9 @@ class SportsDataService:
                 events = provider.get_team_schedule(team_id, league, days_ahead)
                 if events:
                     # Serialize to dict before caching
-                    serialized = [event_to_dict(e) for e in events]
+                    serialized = events_to_dicts(events)
                     self._cache.set(cache_key, serialized, CACHE_TTL_SCHEDULE)
+                    self._remember(cache_key, serialized, list(events))
                     return events
         return []
 
@@ -200,7 +285,7 @@ class SportsDataService:
         if cached is not None:
             logger.debug("[CACHE_HIT] %s", cache_key)
             try:
-                return dict_to_team(cached)
+                return self._decode(cache_key, cached, dict_to_team)
             except (KeyError, TypeError) as e:
                 logger.warning("[CACHE_ERROR] Deserialization failed: %s", e)
 
@@ -210,7 +295,9 @@ class SportsDataService:
                 team = provider.get_team(team_id, league)
                 if team:
                     # Serialize to dict before caching
-                    self._cache.set(cache_key, team_to_dict(team), CACHE_TTL_TEAM_INFO)
+                    serialized = team_to_dict(team)
+                    self._cache.set(cache_key, serialized, CACHE_TTL_TEAM_INFO)
+                    self._remember(cache_key, serialized, team)
                     return team
         return None
 
@@ -218,6 +305,8 @@ class SportsDataService:
         """Get a specific event by ID.
 
         Uses shorter TTL (30min) since this is called for fresh scores/odds.
+        The returned Event is shared with other callers and the decode memo:
+        never mutate it (use dataclasses.replace for a modified copy).
         """
         # Guard against empty event_id which would cause malformed API requests
         if not event_id:
@@ -233,7 +322,7 @@ class SportsDataService:
         if cached is not None:
             logger.debug("[CACHE_HIT] %s", cache_key)
             try:
-                return dict_to_event(cached)
+                return self._decode(cache_key, cached, dict_to_event)
             except (KeyError, TypeError) as e:
                 logger.warning("[CACHE_ERROR] Deserialization failed: %s", e)
 
@@ -242,7 +331,9 @@ class SportsDataService:
                 event = provider.get_event(event_id, league)
                 if event:
                     # Serialize to dict before caching
-                    self._cache.set(cache_key, event_to_dict(event), CACHE_TTL_SINGLE_EVENT)
+                    serialized = event_to_dict(event)
+                    self._cache.set(cache_key, serialized, CACHE_TTL_SINGLE_EVENT)
+                    self._remember(cache_key, serialized, event)
                     return event
         return None
 
@@ -274,11 +365,16 @@ class SportsDataService:
                 event.status.state if event.status else "N/A",
                 fresh_event.status.state if fresh_event.status else "N/A",
             )
-            # Preserve segment_times from original (summary endpoint doesn't have them)
+            # Preserve segment_times from original (summary endpoint doesn't
+            # have them). fresh_event is the memoized cache value, so the
+            # merged event is a copy rather than an in-place update.
+            preserved = {}
             if event.segment_times and not fresh_event.segment_times:
-                fresh_event.segment_times = event.segment_times
+                preserved["segment_times"] = event.segment_times
             if event.main_card_start and not fresh_event.main_card_start:
-                fresh_event.main_card_start = event.main_card_start
+                preserved["main_card_start"] = event.main_card_start
+            if preserved:
+                return dataclasses.replace(fresh_event, **preserved)
             return fresh_event
 
         # Return original if refresh fails
@@ -294,7 +390,7 @@ class SportsDataService:
         if cached is not None:
             logger.debug("[CACHE_HIT] %s", cache_key)
             try:
-                return dict_to_stats(cached)
+                return self._decode(cache_key, cached, dict_to_stats)
             except (KeyError, TypeError) as e:
                 logger.warning("[CACHE_ERROR] Deserialization failed: %s", e)
 
@@ -327,6 +423,7 @@ class SportsDataService:
     def clear_cache(self) -> None:
         """Clear all cached data."""
         self._cache.clear()
+        self._decoded.clear()
 
     def flush_cache(self) -> int:
         """Flush dirty cache entries to SQLite.
@@ -436,11 +533,10 @@ class SportsDataService:
             total_calls,
         )
 
-        for league in unique_leagues:
-            if not tsdb_provider.supports_league(league):
-                continue
-
-            # Pre-warm events cache for each day
+        def prewarm_league(league: str) -> None:
+            # Pre-warm events cache for each day, in order: a day missing
+            # from eventsday.php falls back to league-wide endpoints that the
+            # league's later days then read from cache
             # Team names come from seeded database cache (no API needed)
             for i in range(days_ahead):
                 target_date = today + timedelta(days=i)
@@ -448,3 +544,11 @@ class SportsDataService:
                 tsdb_provider.get_events(league, target_date)
 
             logger.debug("[PREWARM] TSDB league %s: %d days", league, days_ahead)
+
+        # Leagues are independent, so they are pre-warmed concurrently rather
+        # than one round-trip after another
+        supported = [lg for lg in unique_leagues if tsdb_provider.supports_league(lg)]
+        if not supported:
+            return
+        with ThreadPoolExecutor(max_workers=min(_PREWARM_MAX_WORKERS, len(supported))) as executor:
+            list(executor.map(prewarm_league, supported))
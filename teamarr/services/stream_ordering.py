@@ -48,7 +48,7 @@ class StreamOrderingService:
         """
         self.rules = sorted(rules, key=lambda r: r.priority)
         self.conn = conn
-        self._compiled_regex: dict[str, re.Pattern] = {}
+        self._compiled_regex: dict[str, re.Pattern | None] = {}
         self._group_name_cache: dict[int, str] = {}
 
     def compute_priority(
@@ -188,13 +188,18 @@ class StreamOrderingService:
 
     def _get_compiled_regex(self, pattern: str) -> re.Pattern | None:
         """Get or compile a regex pattern (with caching)."""
-        if pattern not in self._compiled_regex:
-            try:
-                self._compiled_regex[pattern] = re.compile(pattern, re.IGNORECASE)
-            except re.error as e:
-                logger.warning("[STREAM_ORDER] Invalid regex pattern '%s': %s", pattern, e)
-                self._compiled_regex[pattern] = None  # type: ignore
-        return self._compiled_regex.get(pattern)
+        try:
+            # One lookup on the hit path; invalid patterns are cached as None
+            return self._compiled_regex[pattern]
+        except KeyError:
+            pass
+        try:
+            compiled = re.compile(pattern, re.IGNORECASE)
+        except re.error as e:
+            logger.warning("[STREAM_ORDER] Invalid regex pattern '%s': %s", pattern, e)
+            compiled = None
+        self._compiled_regex[pattern] = compiled
+        return compiled
 
     def _get_group_name(self, group_id: int) -> str | None:
         """Look up group name from database (with caching)."""
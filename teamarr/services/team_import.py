@@ -98,9 +98,7 @@ def bulk_import_teams(conn: Connection, teams: list[ImportTeam]) -> ImportResult
         leagues = _parse_leagues(row["leagues"])
 
         existing_full[full_key] = (row["id"], leagues)
-        if sport_key not in existing_sport:
-            existing_sport[sport_key] = []
-        existing_sport[sport_key].append((row["id"], row["primary_league"], leagues))
+        existing_sport.setdefault(sport_key, []).append((row["id"], row["primary_league"], leagues))
 
     # Pre-load all leagues from team_cache for soccer teams (avoids N+1 queries)
     soccer_teams = [t for t in teams if t.sport.lower() == "soccer"]
@@ -119,9 +117,7 @@ def bulk_import_teams(conn: Connection, teams: list[ImportTeam]) -> ImportResult
             )
             for row in cursor.fetchall():
                 cache_key = (row["provider"], row["provider_team_id"], row["sport"])
-                if cache_key not in team_cache_leagues:
-                    team_cache_leagues[cache_key] = []
-                team_cache_leagues[cache_key].append(row["league"])
+                team_cache_leagues.setdefault(cache_key, []).append(row["league"])
 
     for team in teams:
         is_soccer = team.sport.lower() == "soccer"
@@ -204,9 +200,9 @@ def bulk_import_teams(conn: Connection, teams: list[ImportTeam]) -> ImportResult
                 )
                 new_id = cursor.lastrowid
                 existing_full[full_key] = (new_id, [team.league])
-                if sport_key not in existing_sport:
-                    existing_sport[sport_key] = []
-                existing_sport[sport_key].append((new_id, team.league, [team.league]))
+                existing_sport.setdefault(sport_key, []).append(
+                    (new_id, team.league, [team.league])
+                )
                 imported += 1
 
     logger.info(
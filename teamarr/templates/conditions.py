@@ -112,12 +112,9 @@ class ConditionEvaluator:
         if not value or not ctx.team_stats:
             return False
         try:
-            streak = ctx.team_stats.streak
-            if not streak or not streak.startswith("W"):
-                return False
-            streak_count = int(streak[1:])
-            return streak_count >= int(value)
-        except (ValueError, IndexError):
+            streak_count = ctx.team_stats.streak_count
+            return streak_count > 0 and streak_count >= int(value)
+        except ValueError:
             return False
 
     def _eval_loss_streak(
@@ -127,12 +124,9 @@ class ConditionEvaluator:
         if not value or not ctx.team_stats:
             return False
         try:
-            streak = ctx.team_stats.streak
-            if not streak or not streak.startswith("L"):
-                return False
-            streak_count = int(streak[1:])
-            return streak_count >= int(value)
-        except (ValueError, IndexError):
+            streak_count = ctx.team_stats.streak_count
+            return streak_count < 0 and -streak_count >= int(value)
+        except ValueError:
             return False
 
     # Note: home/away streak conditions removed - can't reliably get venue-specific streak data from providers  # noqa: E501
@@ -358,9 +352,7 @@ class ConditionalDescriptionSelector:
 
             # Default descriptions always match
             if opt.is_default:
-                if opt.priority not in priority_groups:
-                    priority_groups[opt.priority] = []
-                priority_groups[opt.priority].append(opt.template)
+                priority_groups.setdefault(opt.priority, []).append(opt.template)
                 continue
 
             # Conditionals need to be evaluated
@@ -368,9 +360,7 @@ class ConditionalDescriptionSelector:
                 continue
 
             if self._evaluator.evaluate(opt.condition, opt.condition_value, ctx, game_ctx):
-                if opt.priority not in priority_groups:
-                    priority_groups[opt.priority] = []
-                priority_groups[opt.priority].append(opt.template)
+                priority_groups.setdefault(opt.priority, []).append(opt.template)
 
         if not priority_groups:
             logger.debug("[CONDITION] No matching conditions found")
@@ -9,19 +9,40 @@ from dataclasses import dataclass, field
 from teamarr.core import Event, Team, TeamStats
 
 
-@dataclass
+@dataclass(slots=True)
 class Odds:
-    """Betting odds for a game (available when betting lines are released, typically same-day)."""
+    """Betting odds for a game (available when betting lines are released, typically same-day).
+
+    Pure numeric/short-string container read on every odds variable - slotted
+    like the core numeric types (TeamStats).
+    """
 
     provider: str = ""  # "ESPN BET", "DraftKings", etc.
-    spread: float = 0.0  # Point spread (absolute value)
-    over_under: float = 0.0  # Total points line
+    spread_quarter: int = 0  # Point spread (absolute value) in quarter points
+    over_under_quarter: int = 0  # Total points line in quarter points
     details: str = ""  # Full odds description
     team_moneyline: int = 0  # Our team's moneyline
     opponent_moneyline: int = 0  # Opponent's moneyline
 
+    @property
+    def spread(self) -> float:
+        return self.spread_quarter / 4
+
+    @property
+    def over_under(self) -> float:
+        return self.over_under_quarter / 4
+
+
+def to_quarter_points(value: float | None) -> int:
+    """Convert a betting line (e.g. 47.5) to integer quarter points (190).
+
+    Most lines move in 0.5-point steps, but quarter lines (Asian handicaps,
+    2.25 totals) are common in soccer, so quarters keep both exact as ints.
+    """
+    return round(value * 4) if value else 0
+
 
-@dataclass
+@dataclass(slots=True)
 class GameContext:
     """Context for a single game (current, next, or last).
 
@@ -46,7 +67,7 @@ class GameContext:
     card_segment: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamChannelContext:
     """Team channel configuration from database."""
 
@@ -64,7 +85,7 @@ class TeamChannelContext:
     soccer_primary_league_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplateContext:
     """Complete context for template resolution.
 
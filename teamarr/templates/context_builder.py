@@ -5,14 +5,18 @@ This is the bridge between the data layer and the template engine.
 """
 
 import logging
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Executor
 
-from teamarr.core import Event, TeamStats
+from teamarr.core import Event, EventTable, Team, TeamStats
 from teamarr.services.sports_data import SportsDataService
 from teamarr.templates.context import (
     GameContext,
     Odds,
     TeamChannelContext,
     TemplateContext,
+    to_quarter_points,
 )
 from teamarr.utilities.sports import get_sport_from_league
 
@@ -32,10 +36,30 @@ class ContextBuilder:
         # Use context with TemplateResolver
     """
 
-    def __init__(self, sports_service: SportsDataService):
+    def __init__(self, sports_service: SportsDataService, io_pool: Executor | None = None):
+        """Initialize the builder.
+
+        Args:
+            sports_service: Service used to fetch team stats
+            io_pool: Shared executor for concurrent stats fetches. Without
+                one, stats are fetched inline, one at a time.
+        """
         self._service = sports_service
-        # Cache for team stats to avoid redundant API calls
+        self._io_pool = io_pool
+        # Cache for team stats to avoid redundant API calls. One builder
+        # lives for one generation and may be shared by worker threads
+        # (and by the filler generator), so each opponent is fetched once.
         self._stats_cache: dict[tuple[str, str], TeamStats | None] = {}
+        # One lock per key, so fetches for different teams run concurrently;
+        # _key_locks_lock only guards creation of the per-key locks
+        self._key_locks: dict[tuple[str, str], threading.Lock] = {}
+        self._key_locks_lock = threading.Lock()
+        # Built GameContexts by (event id, team id, league, card segment). An
+        # event is the .next of one programme, the current game of the next
+        # and the .last of the one after, and fillers reuse them per day, so
+        # each is built once. Entries are only served for the same Event
+        # object, so a refreshed event is never given a stale context.
+        self._game_context_cache: dict[tuple[str, str, str, str | None], GameContext] = {}
 
     def build_for_event(
         self,
@@ -74,9 +98,20 @@ class ContextBuilder:
             team_abbrev=team.abbreviation,
         )
 
+        # Fetch our stats and every opponent's stats (current/next/last)
+        # concurrently, so a cold cache costs one round-trip instead of four
+        stats_keys = [
+            (self.opponent_of(e, team_id).id, league)
+            for e in (event, next_event, last_event)
+            if e is not None
+        ]
+        if team_stats is None:
+            stats_keys.append((team_id, league))
+        self.prefetch_team_stats(stats_keys)
+
         # Fetch team stats if not provided
         if team_stats is None:
-            team_stats = self._get_team_stats(team_id, league)
+            team_stats = self.get_team_stats(team_id, league)
 
         # Build game context for current event
         game_context = self._build_game_context(
@@ -131,7 +166,7 @@ class ContextBuilder:
             team_abbrev=team_abbrev,
         )
 
-        team_stats = self._get_team_stats(team_id, league)
+        team_stats = self.get_team_stats(team_id, league)
 
         return TemplateContext(
             game_context=None,
@@ -146,18 +181,23 @@ class ContextBuilder:
         league: str,
         card_segment: str | None = None,
     ) -> GameContext:
-        """Build GameContext for a single event."""
+        """Build GameContext for a single event (memoized per event and team)."""
+        cache_key = (event.id, team_id, league, card_segment)
+        cached = self._game_context_cache.get(cache_key)
+        if cached is not None and cached.event is event:
+            return cached
+
         is_home = event.home_team.id == team_id
         team = event.home_team if is_home else event.away_team
         opponent = event.away_team if is_home else event.home_team
 
-        # Fetch opponent stats
-        opponent_stats = self._get_team_stats(opponent.id, league)
+        # Fetch opponent stats (cache hit when prefetched by build_for_event)
+        opponent_stats = self.get_team_stats(opponent.id, league)
 
         # Convert odds data to Odds dataclass
         odds = self._build_odds(event.odds_data, is_home) if event.odds_data else None
 
-        return GameContext(
+        game_context = self._game_context_cache[cache_key] = GameContext(
             event=event,
             is_home=is_home,
             team=team,
@@ -166,6 +206,7 @@ class ContextBuilder:
             odds=odds,
             card_segment=card_segment,
         )
+        return game_context
 
     def _build_odds(self, odds_data: dict, is_home: bool) -> Odds:
         """Convert raw odds dict to Odds dataclass.
@@ -182,23 +223,59 @@ class ContextBuilder:
 
         return Odds(
             provider=odds_data.get("provider", ""),
-            spread=abs(odds_data.get("spread", 0.0)),  # Absolute value
-            over_under=odds_data.get("over_under", 0.0),
+            spread_quarter=abs(to_quarter_points(odds_data.get("spread"))),  # Absolute value
+            over_under_quarter=to_quarter_points(odds_data.get("over_under")),
             details=odds_data.get("details", ""),
             team_moneyline=team_ml,
             opponent_moneyline=opp_ml,
         )
 
-    def _get_team_stats(self, team_id: str, league: str) -> TeamStats | None:
-        """Get team stats with caching."""
+    @staticmethod
+    def opponent_of(event: Event, team_id: str) -> Team:
+        """The team our team plays against in event."""
+        return event.away_team if event.home_team.id == team_id else event.home_team
+
+    def prefetch_team_stats(self, keys: Iterable[tuple[str, str]]) -> None:
+        """Fetch uncached (team_id, league) stats in parallel into the cache.
+
+        All fetches are submitted to the builder's I/O pool before any
+        result is read. Without a pool, or with fewer than two misses, there
+        is nothing to overlap, so this is a no-op and get_team_stats fetches
+        inline.
+        """
+        if self._io_pool is None:
+            return
+        missing = [key for key in dict.fromkeys(keys) if key not in self._stats_cache]
+        if len(missing) < 2:
+            return
+        futures = [self._io_pool.submit(self.get_team_stats, *key) for key in missing]
+        for future in futures:
+            future.result()
+
+    def get_team_stats(self, team_id: str, league: str) -> TeamStats | None:
+        """Get team stats with caching (safe to call from several threads)."""
         cache_key = (team_id, league)
-        if cache_key not in self._stats_cache:
-            try:
-                self._stats_cache[cache_key] = self._service.get_team_stats(team_id, league)
-            except Exception as e:
-                logger.warning("[CONTEXT] Failed to fetch stats for team %s: %s", team_id, e)
-                self._stats_cache[cache_key] = None
-        return self._stats_cache[cache_key]
+        # Fast path: no lock for a cached entry
+        if cache_key in self._stats_cache:
+            return self._stats_cache[cache_key]
+
+        with self._key_lock(cache_key):
+            # Re-check: another thread may have fetched it while we waited
+            if cache_key not in self._stats_cache:
+                try:
+                    self._stats_cache[cache_key] = self._service.get_team_stats(team_id, league)
+                except Exception as e:
+                    logger.warning("[CONTEXT] Failed to fetch stats for team %s: %s", team_id, e)
+                    self._stats_cache[cache_key] = None
+            return self._stats_cache[cache_key]
+
+    def _key_lock(self, cache_key: tuple[str, str]) -> threading.Lock:
+        """Get (creating on first use) the fetch lock for one stats key."""
+        with self._key_locks_lock:
+            lock = self._key_locks.get(cache_key)
+            if lock is None:
+                lock = self._key_locks[cache_key] = threading.Lock()
+            return lock
 
     def _get_sport(self, league: str) -> str:
         """Derive sport from league identifier (fallback).
@@ -209,8 +286,11 @@ class ContextBuilder:
         return get_sport_from_league(league)
 
     def clear_cache(self) -> None:
-        """Clear the stats cache."""
-        self._stats_cache.clear()
+        """Clear the stats and game context caches."""
+        with self._key_locks_lock:
+            self._stats_cache.clear()
+            self._key_locks.clear()
+        self._game_context_cache.clear()
 
 
 def build_context_for_event(
@@ -245,23 +325,11 @@ def find_adjacent_games(
     if not events:
         return None, None
 
-    # Sort by start time
-    sorted_events = sorted(events, key=lambda e: e.start_time)
-
-    next_event = None
-    last_event = None
+    # Bisect the start times instead of walking the whole schedule. Strict
+    # bounds on both sides exclude current_event itself.
+    table = EventTable.from_events(events)
     current_time = current_event.start_time
-
-    for event in sorted_events:
-        if event.id == current_event.id:
-            continue
-
-        if event.start_time > current_time and next_event is None:
-            next_event = event
-        elif event.start_time < current_time:
-            last_event = event  # Keep updating until we pass current
-
-    return next_event, last_event
+    return table.first_after(current_time), table.last_before(current_time)
 
 
 def find_next_and_last_from_schedule(
@@ -287,17 +355,7 @@ def find_next_and_last_from_schedule(
     if reference_time is None:
         reference_time = datetime.now(UTC)
 
-    # Sort by start time
-    sorted_events = sorted(events, key=lambda e: e.start_time)
-
-    next_event = None
-    last_event = None
-
-    for event in sorted_events:
-        if event.start_time > reference_time:
-            if next_event is None:
-                next_event = event
-        else:
-            last_event = event  # Keep updating - last one before reference
-
-    return next_event, last_event
+    # Next is the first game strictly after the reference; last is the
+    # final one at or before it
+    table = EventTable.from_events(events)
+    return table.first_after(reference_time), table.last_at_or_before(reference_time)
@@ -38,6 +38,13 @@ class TemplateResolver:
     def __init__(self) -> None:
         self._registry = get_registry()
         self._condition_selector = get_condition_selector()
+        # Variables built for the most recently resolved context, as
+        # (context, its extra_vars, variables). Callers resolve several
+        # fields (title, subtitle, description, art, categories) against one
+        # context in a row, and building every variable for every suffix is
+        # most of the cost, so it is done once per context. One tuple, so
+        # threads sharing a resolver always read a consistent entry.
+        self._last_variables: tuple[TemplateContext, dict, dict[str, str]] | None = None
 
     def resolve(self, template: str, context: TemplateContext) -> str:
         """Replace all {variable} placeholders with values.
@@ -53,7 +60,7 @@ class TemplateResolver:
             return ""
 
         # Build all variables (base + suffixed)
-        variables = self._build_all_variables(context)
+        variables = self._variables_for(context)
 
         unreplaced = []
 
@@ -93,6 +100,19 @@ class TemplateResolver:
 
         return text.strip()
 
+    def _variables_for(self, ctx: TemplateContext) -> dict[str, str]:
+        """All variables for ctx, reusing the last build for the same context.
+
+        The entry is matched by identity, of the context and of its
+        extra_vars (which callers may assign after building the context).
+        """
+        cached = self._last_variables
+        if cached is not None and cached[0] is ctx and cached[1] is ctx.extra_vars:
+            return cached[2]
+        variables = self._build_all_variables(ctx)
+        self._last_variables = (ctx, ctx.extra_vars, variables)
+        return variables
+
     def _build_all_variables(self, ctx: TemplateContext) -> dict[str, str]:
         """Build complete variable dict with all suffixes.
 
@@ -40,14 +40,14 @@ NATIONAL_NETWORKS = {
 }
 
 
-def _get_broadcasts(game_ctx: GameContext | None) -> list[str]:
+def _get_broadcasts(game_ctx: GameContext | None) -> tuple[str, ...]:
     """Get broadcast networks from event."""
     if not game_ctx or not game_ctx.event:
-        return []
-    return game_ctx.event.broadcasts or []
+        return ()
+    return game_ctx.event.broadcasts
 
 
-def _sort_broadcasts(broadcasts: list[str]) -> list[str]:
+def _sort_broadcasts(broadcasts: tuple[str, ...]) -> list[str]:
     """Sort broadcasts: national first, regional middle, subscription last."""
     national = [b for b in broadcasts if b in NATIONAL_NETWORKS]
     subscription = [b for b in broadcasts if b in SUBSCRIPTION_NETWORKS]
@@ -17,6 +17,13 @@ def _has_odds(game_ctx: GameContext | None) -> bool:
     return game_ctx is not None and game_ctx.odds is not None
 
 
+def _format_quarter_points(quarters: int) -> str:
+    """Format a quarter-point line: 28 -> '7', 190 -> '47.5', 9 -> '2.25'."""
+    if quarters % 4 == 0:
+        return str(quarters // 4)
+    return str(quarters / 4)
+
+
 @register_variable(
     name="odds_provider",
     category=Category.ODDS,
@@ -36,12 +43,8 @@ def extract_odds_provider(ctx: TemplateContext, game_ctx: GameContext | None) ->
     description="Point spread (absolute value, e.g., '7')",
 )
 def extract_odds_spread(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    if _has_odds(game_ctx) and game_ctx.odds.spread:
-        spread = game_ctx.odds.spread
-        # Format as integer if whole number
-        if spread == int(spread):
-            return str(int(spread))
-        return str(spread)
+    if _has_odds(game_ctx) and game_ctx.odds.spread_quarter:
+        return _format_quarter_points(game_ctx.odds.spread_quarter)
     return ""
 
 
@@ -52,11 +55,8 @@ def extract_odds_spread(ctx: TemplateContext, game_ctx: GameContext | None) -> s
     description="Over/under total (e.g., '47.5')",
 )
 def extract_odds_over_under(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
-    if _has_odds(game_ctx) and game_ctx.odds.over_under:
-        ou = game_ctx.odds.over_under
-        if ou == int(ou):
-            return str(int(ou))
-        return str(ou)
+    if _has_odds(game_ctx) and game_ctx.odds.over_under_quarter:
+        return _format_quarter_points(game_ctx.odds.over_under_quarter)
     return ""
 
 
@@ -3,6 +3,8 @@
 Variables for team records (W-L-T), win percentages, etc.
 """
 
+from functools import lru_cache
+
 from teamarr.templates.context import GameContext, TemplateContext
 from teamarr.templates.variables.registry import (
     Category,
@@ -217,6 +219,16 @@ def _parse_record_for_pct(record: str | None) -> tuple[int, int, int]:
         return 0, 0, 0
 
 
+@lru_cache(maxsize=1024)
+def _record_win_pct(record: str) -> str:
+    """Win percentage of a record string: '5-2' -> '.714'.
+
+    Memoized: home/away win pct are resolved for every programme, but a
+    run only sees a few distinct records per team.
+    """
+    return _get_win_pct(*_parse_record_for_pct(record))
+
+
 @register_variable(
     name="home_win_pct",
     category=Category.RECORDS,
@@ -225,8 +237,7 @@ def _parse_record_for_pct(record: str | None) -> tuple[int, int, int]:
 )
 def extract_home_win_pct(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if ctx.team_stats and ctx.team_stats.home_record:
-        wins, losses, ties = _parse_record_for_pct(ctx.team_stats.home_record)
-        return _get_win_pct(wins, losses, ties)
+        return _record_win_pct(ctx.team_stats.home_record)
     return ""
 
 
@@ -238,8 +249,7 @@ def extract_home_win_pct(ctx: TemplateContext, game_ctx: GameContext | None) ->
 )
 def extract_away_win_pct(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     if ctx.team_stats and ctx.team_stats.away_record:
-        wins, losses, ties = _parse_record_for_pct(ctx.team_stats.away_record)
-        return _get_win_pct(wins, losses, ties)
+        return _record_win_pct(ctx.team_stats.away_record)
     return ""
 
 
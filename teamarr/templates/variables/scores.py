@@ -3,6 +3,7 @@
 Variables for game scores. These only apply to completed games (LAST_ONLY).
 """
 
+from teamarr.core import EventState
 from teamarr.templates.context import GameContext, TemplateContext
 from teamarr.templates.variables.registry import (
     Category,
@@ -190,7 +191,7 @@ def extract_event_result(ctx: TemplateContext, game_ctx: GameContext | None) ->
     if event.home_score is None or event.away_score is None:
         return ""
     # Check if game is final
-    if event.status.state not in ("final", "post"):
+    if event.status.code is not EventState.FINAL:
         return ""
     home_name = event.home_team.name if event.home_team else ""
     away_name = event.away_team.name if event.away_team else ""
@@ -210,7 +211,7 @@ def extract_event_result_abbrev(ctx: TemplateContext, game_ctx: GameContext | No
     if event.home_score is None or event.away_score is None:
         return ""
     # Check if game is final
-    if event.status.state not in ("final", "post"):
+    if event.status.code is not EventState.FINAL:
         return ""
     home_abbrev = event.home_team.abbreviation.upper() if event.home_team else ""
     away_abbrev = event.away_team.abbreviation.upper() if event.away_team else ""
@@ -229,7 +230,7 @@ def extract_winner(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     event = game_ctx.event
     if event.home_score is None or event.away_score is None:
         return ""
-    if event.status.state not in ("final", "post"):
+    if event.status.code is not EventState.FINAL:
         return ""
     if event.home_score > event.away_score:
         return event.home_team.name if event.home_team else ""
@@ -250,7 +251,7 @@ def extract_winner_abbrev(ctx: TemplateContext, game_ctx: GameContext | None) ->
     event = game_ctx.event
     if event.home_score is None or event.away_score is None:
         return ""
-    if event.status.state not in ("final", "post"):
+    if event.status.code is not EventState.FINAL:
         return ""
     if event.home_score > event.away_score:
         return event.home_team.abbreviation.upper() if event.home_team else ""
@@ -271,7 +272,7 @@ def extract_loser(ctx: TemplateContext, game_ctx: GameContext | None) -> str:
     event = game_ctx.event
     if event.home_score is None or event.away_score is None:
         return ""
-    if event.status.state not in ("final", "post"):
+    if event.status.code is not EventState.FINAL:
         return ""
     if event.home_score < event.away_score:
         return event.home_team.name if event.home_team else ""
@@ -292,7 +293,7 @@ def extract_loser_abbrev(ctx: TemplateContext, game_ctx: GameContext | None) ->
     event = game_ctx.event
     if event.home_score is None or event.away_score is None:
         return ""
-    if event.status.state not in ("final", "post"):
+    if event.status.code is not EventState.FINAL:
         return ""
     if event.home_score < event.away_score:
         return event.home_team.abbreviation.upper() if event.home_team else ""
@@ -28,16 +28,13 @@ def _get_streak_info(stats: TeamStats | None) -> tuple[str, int, str]:
         - length: 3 (absolute value)
         - type: "win" or "loss"
     """
-    if not stats or not stats.streak:
+    if not stats or not stats.streak_count:
         return "", 0, ""
 
-    formatted = stats.streak  # "W3" or "L2"
     count = stats.streak_count  # signed: 3 or -2
+    streak_type = "win" if count > 0 else "loss"
 
-    length = abs(count)
-    streak_type = "win" if count > 0 else "loss" if count < 0 else ""
-
-    return formatted, length, streak_type
+    return stats.streak, abs(count), streak_type
 
 
 # =============================================================================
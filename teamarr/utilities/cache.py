@@ -101,7 +101,9 @@ class TTLCache:
 
     def _evict_if_needed(self) -> None:
         """Evict entries if cache is at max size. Called with lock held."""
-        if self._max_size <= 0:
+        # Below capacity there is nothing to evict, so skip the full scan;
+        # expired entries are still dropped on access or by cleanup_expired
+        if self._max_size <= 0 or len(self._cache) < self._max_size:
             return
 
         # First, remove expired entries
@@ -3,7 +3,7 @@
 Single source of truth for determining event final status.
 """
 
-from teamarr.core import Event
+from teamarr.core import Event, EventState
 
 
 def is_event_final(event: Event) -> bool:
@@ -27,13 +27,12 @@ def is_event_final(event: Event) -> bool:
     if not event or not event.status:
         return False
 
-    status_state = event.status.state.lower() if event.status.state else ""
-    status_detail = event.status.detail.lower() if event.status.detail else ""
-
-    # Check state for common final indicators
-    if status_state in ("final", "post", "completed"):
+    # Check state for common final indicators ("final", "post", "completed")
+    if event.status.code is EventState.FINAL:
         return True
 
+    status_detail = event.status.detail.lower() if event.status.detail else ""
+
     # Check detail for "final" (e.g., "Final", "Final OT", "Final - 3OT")
     if "final" in status_detail:
         return True
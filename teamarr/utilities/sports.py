@@ -52,6 +52,9 @@ SOCCER_COUNTRY_CODES = frozenset(
     }
 )
 
+# Undotted league identifiers that are soccer (e.g., "mls")
+SOCCER_LEAGUES = frozenset(lg for lg, sport in LEAGUE_SPORT_MAP.items() if sport == "Soccer")
+
 
 def get_sport_from_league(league: str) -> str:
     """Derive sport name from league identifier (FALLBACK).
@@ -78,9 +81,9 @@ def get_sport_from_league(league: str) -> str:
     league_lower = league.lower()
 
     # Check for soccer-style leagues (country.division format)
-    if "." in league_lower:
-        parts = league_lower.split(".")
-        if parts[0] in SOCCER_COUNTRY_CODES:
+    country, dot, _ = league_lower.partition(".")
+    if dot:
+        if country in SOCCER_COUNTRY_CODES:
             return "Soccer"
         # Unknown dotted format - default to Sports
         return "Sports"
@@ -98,7 +101,10 @@ def is_soccer_league(league: str) -> bool:
     Returns:
         True if the league is soccer
     """
-    return get_sport_from_league(league) == "Soccer"
+    country, dot, _ = league.lower().partition(".")
+    if dot:
+        return country in SOCCER_COUNTRY_CODES
+    return country in SOCCER_LEAGUES
 
 
 def get_sport_duration(
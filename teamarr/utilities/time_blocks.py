@@ -7,8 +7,8 @@ This provides consistent EPG structure (4 blocks per day).
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
-# Time block boundaries (hours)
-TIME_BLOCK_HOURS = [0, 6, 12, 18]
+# Hours per time block; the boundaries (0, 6, 12, 18) are its multiples
+BLOCK_LENGTH_HOURS = 6
 
 
 def get_next_time_block(dt: datetime) -> datetime:
@@ -26,12 +26,10 @@ def get_next_time_block(dt: datetime) -> datetime:
         2:00 PM → 6:00 PM (1800)
         7:00 PM → 12:00 AM next day (0000)
     """
-    current_hour = dt.hour
-
-    # Find next block boundary
-    for block_hour in TIME_BLOCK_HOURS:
-        if current_hour < block_hour:
-            return dt.replace(hour=block_hour, minute=0, second=0, microsecond=0)
+    # Next boundary is the next multiple of the block length
+    next_hour = (dt.hour // BLOCK_LENGTH_HOURS + 1) * BLOCK_LENGTH_HOURS
+    if next_hour < 24:
+        return dt.replace(hour=next_hour, minute=0, second=0, microsecond=0)
 
     # No more blocks today, return first block of next day (midnight)
     next_day = dt + timedelta(days=1)
@@ -51,16 +49,10 @@ def get_previous_time_block(dt: datetime) -> datetime:
         2:00 PM → 12:00 PM (1200)
         5:00 AM → 12:00 AM same day (0000)
     """
-    current_hour = dt.hour
-
-    # Find previous block boundary (iterate in reverse)
-    for block_hour in reversed(TIME_BLOCK_HOURS):
-        if current_hour >= block_hour:
-            return dt.replace(hour=block_hour, minute=0, second=0, microsecond=0)
-
-    # Before first block, return last block of previous day (1800)
-    prev_day = dt - timedelta(days=1)
-    return prev_day.replace(hour=18, minute=0, second=0, microsecond=0)
+    # Every hour is at or after midnight, so the start of the current
+    # block is always a boundary on the same day
+    block_hour = dt.hour - dt.hour % BLOCK_LENGTH_HOURS
+    return dt.replace(hour=block_hour, minute=0, second=0, microsecond=0)
 
 
 def create_filler_chunks(start_dt: datetime, end_dt: datetime) -> list[tuple[datetime, datetime]]:
@@ -83,18 +75,16 @@ def create_filler_chunks(start_dt: datetime, end_dt: datetime) -> list[tuple[dat
     if start_dt >= end_dt:
         return []
 
-    chunks = []
-    current_start = start_dt
-
-    while current_start < end_dt:
-        # Find next block boundary
-        next_block = get_next_time_block(current_start)
-
-        # Don't go past end_dt
-        chunk_end = min(next_block, end_dt)
-
-        chunks.append((current_start, chunk_end))
-        current_start = chunk_end
+    # The grid is fixed: past the first boundary, each chunk is one whole
+    # block (wall-clock, like the boundaries themselves), and only the
+    # first and last chunks can be cut short
+    block = timedelta(hours=BLOCK_LENGTH_HOURS)
+    boundary = get_next_time_block(start_dt)
+    chunks = [(start_dt, min(boundary, end_dt))]
+    while boundary < end_dt:
+        next_boundary = boundary + block
+        chunks.append((boundary, min(next_boundary, end_dt)))
+        boundary = next_boundary
 
     return chunks
 
@@ -112,15 +102,7 @@ def get_block_for_time(dt: datetime) -> int:
         - 2: 12:00-17:59
         - 3: 18:00-23:59
     """
-    hour = dt.hour
-    if hour < 6:
-        return 0
-    elif hour < 12:
-        return 1
-    elif hour < 18:
-        return 2
-    else:
-        return 3
+    return dt.hour // BLOCK_LENGTH_HOURS
 
 
 def crosses_midnight(start_dt: datetime, end_dt: datetime, tz: ZoneInfo | None = None) -> bool:
@@ -7,7 +7,8 @@ Display settings (time_format, show_timezone) are read from user configuration.
 """
 
 import platform
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime, tzinfo
+from functools import lru_cache
 
 from teamarr.config import (
     get_show_timezone,
@@ -26,6 +27,8 @@ __all__ = [
     "now_utc",
     "to_user_tz",
     "to_utc",
+    "local_date",
+    "parse_iso_datetime",
     "format_time",
     "format_date",
     "format_date_short",
@@ -92,6 +95,30 @@ def to_utc(dt: datetime) -> datetime:
     return dt.astimezone(UTC)
 
 
+@lru_cache(maxsize=65536)
+def local_date(ts: int, tz: tzinfo) -> date:
+    """Calendar date of a Unix timestamp in tz.
+
+    Memoized: matching compares every candidate event's date for every
+    stream, and the same few hundred (start, tz) pairs recur throughout
+    a run. Pass Event.start_ts.
+    """
+    return datetime.fromtimestamp(ts, tz).date()
+
+
+@lru_cache(maxsize=8192)
+def parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 string to a datetime (a trailing "Z" is UTC).
+
+    Memoized: cached events are rebuilt from their stored strings on every
+    read, and the same kickoff times recur across them. datetimes are
+    immutable, so sharing the parsed value is safe. fromisoformat accepts
+    "Z" since Python 3.11, so no replace() is needed; invalid strings
+    raise ValueError, as fromisoformat does.
+    """
+    return datetime.fromisoformat(value)
+
+
 def format_time(dt: datetime, include_tz: bool | None = None) -> str:
     """Format time for display using user's display settings.
 
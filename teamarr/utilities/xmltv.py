@@ -4,6 +4,7 @@ Converts Programme dataclasses to XMLTV format.
 All times are output in the user's configured timezone.
 """
 
+from operator import attrgetter, itemgetter
 from xml.dom import minidom
 from xml.etree.ElementTree import Element, SubElement, tostring
 
@@ -40,7 +41,7 @@ def programmes_to_xmltv(
         _add_channel(root, channel)
 
     # Sort programmes by channel ID, then by start time (XMLTV standard convention)
-    sorted_programmes = sorted(programmes, key=lambda p: (p.channel_id, p.start))
+    sorted_programmes = sorted(programmes, key=attrgetter("channel_id", "start"))
     for programme in sorted_programmes:
         _add_programme(root, programme)
 
@@ -163,7 +164,9 @@ def merge_xmltv_content(
 
     seen_channels: set[str] = set()
     seen_programmes: set[tuple[str, str, str]] = set()  # (channel, start, stop)
-    all_programmes: list[Element] = []
+    # ((channel, start) sort key, programme): the key is taken from the
+    # attributes already read for dedup rather than re-read by the sort
+    all_programmes: list[tuple[tuple[str, str], Element]] = []
 
     for content in xmltv_contents:
         if not content or not content.strip():
@@ -188,15 +191,14 @@ def merge_xmltv_content(
                 key = (channel_id, start, stop)
                 if key not in seen_programmes:
                     seen_programmes.add(key)
-                    all_programmes.append(programme)
+                    all_programmes.append(((channel_id or "", start or ""), programme))
 
         except ET.ParseError:
             continue
 
     # Sort programmes by channel ID, then by start time (XMLTV standard convention)
-    all_programmes.sort(key=lambda p: (p.get("channel", ""), p.get("start", "")))
-    for programme in all_programmes:
-        root.append(programme)
+    all_programmes.sort(key=itemgetter(0))
+    root.extend(map(itemgetter(1), all_programmes))
 
     xml_str = tostring(root, encoding="unicode")
     return _prettify(xml_str)
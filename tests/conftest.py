@@ -0,0 +1,76 @@
+"""Shared test helpers: minimal Team/Event factories and service stubs."""
+
+from datetime import datetime
+
+import pytest
+
+from teamarr.core import Event, EventStatus, Team
+
+
+def make_team(
+    team_id: str,
+    name: str | None = None,
+    abbreviation: str | None = None,
+    *,
+    short_name: str | None = None,
+    league: str = "nba",
+    sport: str = "basketball",
+) -> Team:
+    """Create a minimal Team. Names default to "Team <id>", abbreviation to the id."""
+    name = name or f"Team {team_id}"
+    return Team(
+        id=team_id,
+        provider="espn",
+        name=name,
+        short_name=short_name or name,
+        abbreviation=abbreviation or team_id,
+        league=league,
+        sport=sport,
+    )
+
+
+def make_event(
+    event_id: str,
+    start_time: datetime,
+    home: Team | None = None,
+    away: Team | None = None,
+    *,
+    state: str = "scheduled",
+    score: int | None = None,
+    league: str = "nba",
+    sport: str = "basketball",
+) -> Event:
+    """Create a minimal Event. Teams default to teams "1" (home) and "2" (away)."""
+    home = home or make_team("1", league=league, sport=sport)
+    away = away or make_team("2", league=league, sport=sport)
+    return Event(
+        id=event_id,
+        provider="espn",
+        name=f"{home.name} vs {away.name}",
+        short_name=f"{home.short_name} vs {away.short_name}",
+        start_time=start_time,
+        home_team=home,
+        away_team=away,
+        status=EventStatus(state=state),
+        league=league,
+        sport=sport,
+        home_score=score,
+        away_score=score,
+    )
+
+
+class _StubLeagueMappings:
+    """Answers every league lookup with a fixed name."""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: "NBA"
+
+
+@pytest.fixture
+def stub_league_mappings(monkeypatch):
+    """Stub the league mapping service used by identity template variables."""
+    from teamarr.services import league_mappings
+
+    monkeypatch.setattr(
+        league_mappings, "get_league_mapping_service", lambda: _StubLeagueMappings()
+    )
@@ -0,0 +1,61 @@
+"""Tests for the ESPN provider's shared scoreboard team index."""
+
+from teamarr.providers.espn.provider import SCOREBOARD_DOWN_AFTER, ESPNProvider
+
+
+class FakeClient:
+    """ESPN client stub that answers every scoreboard with a fixed result."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls: list[str] = []
+
+    def get_scoreboard_with_status(self, league, date_str, sport_league=None):
+        self.calls.append(date_str)
+        return self.result
+
+
+def _days(n: int) -> list[str]:
+    return [f"202603{day:02d}" for day in range(1, n + 1)]
+
+
+class TestScoreboardDownMarker:
+    def test_http_errors_stop_retries_of_failed_days_only(self):
+        client = FakeClient((None, 500))
+        provider = ESPNProvider(client=client)
+        failed = _days(SCOREBOARD_DOWN_AFTER)
+        for date_str in failed:
+            assert provider._scoreboard_team_index("nfl", date_str) == {}
+        assert client.calls == failed
+
+        # League is down: failed days are not refetched...
+        for date_str in failed:
+            assert provider._scoreboard_team_index("nfl", date_str) == {}
+        assert client.calls == failed
+
+        # ...but a day nobody has fetched yet still is
+        provider._scoreboard_team_index("nfl", "20260401")
+        assert client.calls == [*failed, "20260401"]
+
+        # Other leagues are unaffected
+        provider._scoreboard_team_index("nba", failed[0])
+        assert client.calls[-1] == failed[0]
+
+    def test_timeouts_never_mark_league_down(self):
+        client = FakeClient((None, None))
+        provider = ESPNProvider(client=client)
+        for _ in range(SCOREBOARD_DOWN_AFTER + 2):
+            provider._scoreboard_team_index("nfl", "20260301")
+        assert len(client.calls) == SCOREBOARD_DOWN_AFTER + 2
+
+    def test_success_clears_marker(self):
+        client = FakeClient((None, 503))
+        provider = ESPNProvider(client=client)
+        days = _days(SCOREBOARD_DOWN_AFTER)
+        for date_str in days:
+            provider._scoreboard_team_index("nfl", date_str)
+
+        client.result = ({"events": []}, None)
+        provider._scoreboard_team_index("nfl", "20260401")
+        provider._scoreboard_team_index("nfl", days[0])
+        assert client.calls[-2:] == ["20260401", days[0]]
@@ -0,0 +1,62 @@
+"""Tests for the EventTable structure-of-arrays schedule view."""
+
+from datetime import UTC, datetime, timedelta
+
+from conftest import make_event
+
+from teamarr.core import EventState, EventStatus, EventTable
+from teamarr.core.event_table import NO_SCORE
+
+T0 = datetime(2026, 3, 1, 18, 0, tzinfo=UTC)
+
+
+def _event(event_id: str, hours: int, state: str = "scheduled", score: int | None = None):
+    return make_event(event_id, T0 + timedelta(hours=hours), state=state, score=score)
+
+
+class TestEventTable:
+    def test_from_events_sorts_by_start_time(self):
+        table = EventTable.from_events([_event("b", 24), _event("a", 0), _event("c", 48)])
+        assert table.ids == ["a", "b", "c"]
+        assert len(table) == 3
+
+    def test_missing_scores_use_sentinel(self):
+        table = EventTable.from_events([_event("a", 0, score=None), _event("b", 24, score=7)])
+        assert list(table.home_score) == [NO_SCORE, 7]
+
+    def test_last_before_is_strict(self):
+        table = EventTable.from_events([_event("a", 0), _event("b", 24)])
+        assert table.last_before(T0) is None
+        assert table.last_before(T0 + timedelta(hours=1)).id == "a"
+        assert table.last_before(T0 + timedelta(hours=24)).id == "a"
+
+    def test_last_at_or_before_is_inclusive(self):
+        table = EventTable.from_events([_event("a", 0), _event("b", 24)])
+        assert table.last_at_or_before(T0 - timedelta(hours=1)) is None
+        assert table.last_at_or_before(T0).id == "a"
+        assert table.last_at_or_before(T0 + timedelta(hours=24)).id == "b"
+
+    def test_first_at_or_after_and_first_after(self):
+        table = EventTable.from_events([_event("a", 0), _event("b", 24)])
+        assert table.first_at_or_after(T0).id == "a"
+        assert table.first_after(T0).id == "b"
+        assert table.first_after(T0 + timedelta(hours=24)) is None
+
+    def test_window_is_half_open(self):
+        table = EventTable.from_events([_event("a", 0), _event("b", 24), _event("c", 48)])
+        start = T0.timestamp()
+        assert list(table.window(start, start + 48 * 3600)) == [0, 1]
+        assert list(table.window(start + 1, start + 49 * 3600)) == [1, 2]
+        assert list(table.window(start + 49 * 3600, start + 99 * 3600)) == []
+
+    def test_with_state(self):
+        table = EventTable.from_events(
+            [_event("a", 0, state="final"), _event("b", 24, state="live"), _event("c", 48)]
+        )
+        assert [e.id for e in table.with_state(EventState.LIVE)] == ["b"]
+        assert list(table.state_code) == [EventState.FINAL, EventState.LIVE, 0]
+
+    def test_state_codes_from_provider_strings(self):
+        assert EventStatus(state="post").code is EventState.FINAL
+        assert EventStatus(state="Postponed").code is EventState.POSTPONED
+        assert EventStatus(state="unknown").code is EventState.SCHEDULED
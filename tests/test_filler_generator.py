@@ -0,0 +1,104 @@
+"""Tests for the filler generator's cross-day resolved text reuse."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from conftest import make_event, make_team
+
+from teamarr.consumers.filler.generator import FillerGenerator
+from teamarr.core import Event
+from teamarr.core.filler_types import FillerConfig, FillerOptions, FillerTemplate
+from teamarr.templates.variables import SuffixRules, get_registry
+
+T0 = datetime(2026, 3, 1, 23, 30, tzinfo=UTC)
+
+
+class _StubService:
+    def get_team_stats(self, team_id, league):
+        return None
+
+    def refresh_event_status(self, event):
+        return event
+
+
+def _event(day: int, state: str = "scheduled") -> Event:
+    """A game every 26 hours, each against a different opponent."""
+    return make_event(
+        str(day), T0 + timedelta(hours=26 * day), away=make_team(str(day + 20)), state=state
+    )
+
+
+def _every_variable(suffixes: set[str]) -> str:
+    """A template using every registered variable with each allowed suffix."""
+    names = []
+    for var_def in get_registry().all_variables():
+        rules = var_def.suffix_rules
+        if rules != SuffixRules.LAST_ONLY:
+            names.append(var_def.name)
+        if "next" in suffixes and rules in (SuffixRules.ALL, SuffixRules.BASE_NEXT_ONLY):
+            names.append(f"{var_def.name}.next")
+        if "last" in suffixes and rules in (SuffixRules.ALL, SuffixRules.LAST_ONLY):
+            names.append(f"{var_def.name}.last")
+    return " | ".join(f"{name}={{{name}}}" for name in names)
+
+
+def _generate(generator: FillerGenerator, suffixes: set[str]) -> list[tuple]:
+    template = FillerTemplate(title="Filler", description=_every_variable(suffixes))
+    config = FillerConfig(
+        pregame_template=template,
+        postgame_template=template,
+        idle_template=template,
+        xmltv_categories=["{sport}"],
+        categories_apply_to="all",
+    )
+    events = [_event(day, "postponed" if day == 7 else "scheduled") for day in (-2, 0, 1, 7, 12)]
+    programmes = generator.generate(
+        events,
+        "1",
+        "nba",
+        "ch",
+        "Team 1",
+        options=FillerOptions(
+            generation_time=T0 - timedelta(hours=12),
+            epg_timezone="America/New_York",
+            output_days_ahead=14,
+        ),
+        config=config,
+    )
+    return [
+        (p.start, p.stop, p.title, p.subtitle, p.description, p.icon, p.categories, p.filler_type)
+        for p in programmes
+    ]
+
+
+@pytest.mark.usefixtures("stub_league_mappings")
+class TestFillerTextReuse:
+    # Which of .next/.last the templates use decides which games are in the
+    # context, and so which parts of the memo key tell days apart
+    @pytest.mark.parametrize("suffixes", [{"next", "last"}, {"next"}, {"last"}])
+    def test_reused_text_matches_per_day_resolution(self, monkeypatch, suffixes):
+        generator = FillerGenerator(_StubService())
+        calls = 0
+        resolve_filler_text = generator._resolve_filler_text
+
+        def counting_resolve(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return resolve_filler_text(*args, **kwargs)
+
+        monkeypatch.setattr(generator, "_resolve_filler_text", counting_resolve)
+        reused = _generate(generator, suffixes)
+        reused_calls = calls
+
+        # Same run with the cross-day memo disabled
+        create = generator._create_filler_programmes
+        monkeypatch.setattr(
+            generator,
+            "_create_filler_programmes",
+            lambda *args, **kwargs: create(*args, **{**kwargs, "resolved": None}),
+        )
+        calls = 0
+        fresh = _generate(generator, suffixes)
+
+        assert reused == fresh
+        assert reused_calls < calls
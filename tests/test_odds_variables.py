@@ -0,0 +1,38 @@
+"""Tests for odds line storage and the odds template variables."""
+
+import pytest
+
+from teamarr.templates.context import GameContext, Odds, to_quarter_points
+from teamarr.templates.variables.odds import extract_odds_over_under, extract_odds_spread
+
+
+def _render(spread: float, over_under: float) -> tuple[str, str]:
+    game_ctx = GameContext(
+        odds=Odds(
+            spread_quarter=abs(to_quarter_points(spread)),
+            over_under_quarter=to_quarter_points(over_under),
+        )
+    )
+    return extract_odds_spread(None, game_ctx), extract_odds_over_under(None, game_ctx)
+
+
+class TestOddsLines:
+    @pytest.mark.parametrize(
+        ("spread", "over_under", "expected"),
+        [
+            (-7.0, 47.5, ("7", "47.5")),
+            (3.5, 220.0, ("3.5", "220")),
+            (0.25, 2.25, ("0.25", "2.25")),
+            (-1.75, 2.75, ("1.75", "2.75")),
+        ],
+    )
+    def test_lines_render_exactly(self, spread, over_under, expected):
+        assert _render(spread, over_under) == expected
+
+    def test_missing_line_renders_empty(self):
+        assert _render(None, None) == ("", "")
+
+    def test_float_properties(self):
+        odds = Odds(spread_quarter=to_quarter_points(0.25), over_under_quarter=190)
+        assert odds.spread == 0.25
+        assert odds.over_under == 47.5
@@ -36,7 +36,8 @@ class TestLeagueScopingByGroupMode:
             proc._db_factory.return_value = mock_conn
 
             # Mock cached helpers
-            proc._load_sport_durations_cached = MagicMock(return_value={})
+            proc._run_settings = {}
+            proc._load_sport_durations = MagicMock(return_value={})
             proc._get_all_known_leagues = MagicMock(
                 return_value=["nfl", "nba", "college-softball", "mens-college-basketball"]
             )
@@ -0,0 +1,114 @@
+"""Tests for SportsDataService coalescing of concurrent cache misses."""
+
+import threading
+from datetime import UTC, date, datetime
+
+import pytest
+from conftest import make_event
+
+from teamarr.services import sports_data
+from teamarr.services.sports_data import SportsDataService
+from teamarr.utilities.cache import TTLCache
+
+WAITERS = 4
+DAY = date(2026, 3, 1)
+
+
+class BlockingProvider:
+    """Provider stub whose get_events blocks until the test releases it."""
+
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def supports_league(self, league):
+        return True
+
+    def get_events(self, league, target_date):
+        self.calls += 1
+        self.started.set()
+        assert self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return [make_event("1", datetime(2026, 3, 1, 18, 0, tzinfo=UTC))]
+
+
+class _WatchedInflight(dict):
+    """In-flight map that signals once every caller has looked up its key."""
+
+    def __init__(self, lookups: int):
+        super().__init__()
+        self._lookups = lookups
+        self._lock = threading.Lock()
+        self.all_joined = threading.Event()
+
+    def get(self, key, default=None):
+        with self._lock:
+            self._lookups -= 1
+            if self._lookups == 0:
+                self.all_joined.set()
+        return super().get(key, default)
+
+
+@pytest.fixture(autouse=True)
+def _private_cache(monkeypatch):
+    """Keep the service off the shared SQLite-backed cache."""
+    cache = TTLCache()
+    monkeypatch.setattr(sports_data, "_get_shared_cache", lambda: cache)
+
+
+def _get_events_concurrently(provider: BlockingProvider) -> tuple[SportsDataService, list]:
+    """Call get_events from an owner and WAITERS threads that join its fetch.
+
+    Returns the service and each thread's list of events or raised exception.
+    """
+    service = SportsDataService(providers=[provider])
+    inflight = service._inflight = _WatchedInflight(1 + WAITERS)
+    outcomes: list = [None] * (1 + WAITERS)
+
+    def call(i: int) -> None:
+        try:
+            outcomes[i] = service.get_events("nba", DAY)
+        except Exception as e:
+            outcomes[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(1 + WAITERS)]
+    threads[0].start()
+    assert provider.started.wait(timeout=5)
+    for thread in threads[1:]:
+        thread.start()
+    # Only release the fetch once every waiter is attached to it
+    assert inflight.all_joined.wait(timeout=5)
+    provider.release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+    return service, outcomes
+
+
+class TestFetchOnce:
+    def test_concurrent_misses_share_one_fetch(self):
+        provider = BlockingProvider()
+        service, results = _get_events_concurrently(provider)
+
+        assert provider.calls == 1
+        assert all(r == results[0] for r in results)
+        assert [e.id for e in results[0]] == ["1"]
+        # Each caller owns its list
+        assert len({id(r) for r in results}) == len(results)
+        assert service._inflight == {}
+
+    def test_fetch_error_reaches_every_waiter(self):
+        error = RuntimeError("provider down")
+        provider = BlockingProvider(error=error)
+        service, outcomes = _get_events_concurrently(provider)
+
+        assert provider.calls == 1
+        assert all(outcome is error for outcome in outcomes)
+        assert service._inflight == {}
+
+        # The failure is not remembered: the next call fetches again
+        provider.error = None
+        assert [e.id for e in service.get_events("nba", DAY)] == ["1"]
+        assert provider.calls == 2
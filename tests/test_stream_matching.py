@@ -5,13 +5,16 @@ Validates that tournament/international streams using 3-letter country codes
 introducing false positives from similar abbreviations.
 """
 
-from datetime import UTC, datetime
+import threading
+from datetime import UTC, date, datetime, timedelta
 
 import pytest
+from conftest import make_event, make_team
 
+from teamarr.consumers.matching import MATCH_WINDOW_DAYS
 from teamarr.consumers.matching.result import MatchMethod
 from teamarr.consumers.matching.team_matcher import TeamMatcher
-from teamarr.core.types import Event, EventStatus, Team
+from teamarr.core.types import Event, Team
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -22,31 +25,21 @@ def _make_team(
     abbreviation: str,
     short_name: str = "",
 ) -> Team:
-    """Create a minimal Team for testing."""
-    return Team(
-        id="t-" + abbreviation.lower(),
-        provider="espn",
-        name=name,
-        short_name=short_name or name,
-        abbreviation=abbreviation,
+    """Create a minimal hockey Team keyed by its abbreviation."""
+    return make_team(
+        "t-" + abbreviation.lower(),
+        name,
+        abbreviation,
+        short_name=short_name or None,
         league="test",
         sport="hockey",
     )
 
 
 def _make_event(home: Team, away: Team) -> Event:
-    """Create a minimal Event for testing."""
-    return Event(
-        id="evt-1",
-        provider="espn",
-        name=f"{home.name} vs {away.name}",
-        short_name=f"{home.short_name} vs {away.short_name}",
-        start_time=datetime(2026, 2, 11, 19, 0, tzinfo=UTC),
-        home_team=home,
-        away_team=away,
-        status=EventStatus(state="scheduled"),
-        league="test",
-        sport="hockey",
+    """Create a minimal Event between two teams."""
+    return make_event(
+        "evt-1", datetime(2026, 2, 11, 19, 0, tzinfo=UTC), home, away, league="test", sport="hockey"
     )
 
 
@@ -280,3 +273,49 @@ class TestMatchTeamsToEventAbbreviationIntegration:
 
         result = matcher._match_teams_to_event("DEN", "PHI", event)
         assert result is None
+
+
+# ---------------------------------------------------------------------------
+# Window event fetch: _fetch_window_events
+# ---------------------------------------------------------------------------
+
+
+class _RecordingService:
+    """Returns one marker per date and records every get_events call."""
+
+    def __init__(self, provider: str):
+        self.provider = provider
+        self.calls: list[tuple[date, bool]] = []
+        self._lock = threading.Lock()
+
+    def get_provider_name(self, league):
+        return self.provider
+
+    def get_events(self, league, target_date, cache_only=False):
+        with self._lock:
+            self.calls.append((target_date, cache_only))
+        return [target_date]
+
+
+class TestFetchWindowEvents:
+    TARGET = date(2026, 2, 11)
+
+    def _fetch(self, provider: str) -> tuple[list, _RecordingService]:
+        service = _RecordingService(provider)
+        m = object.__new__(TeamMatcher)
+        m._service = service
+        m._days_ahead = 3
+        return m._fetch_window_events("nhl", self.TARGET), service
+
+    def _window(self) -> list[date]:
+        return [self.TARGET + timedelta(days=d) for d in range(-MATCH_WINDOW_DAYS, 4)]
+
+    def test_api_days_fetched_past_days_cache_only_in_date_order(self):
+        events, service = self._fetch("espn")
+        assert events == self._window()
+        assert sorted(service.calls) == [(d, d < self.TARGET) for d in self._window()]
+
+    def test_tsdb_is_cache_only(self):
+        events, service = self._fetch("tsdb")
+        assert events == self._window()
+        assert service.calls == [(d, True) for d in self._window()]
@@ -200,3 +200,47 @@ class TestTemplateResolutionIntegration:
         for sport, league, expected, desc in test_cases:
             result = get_template_for_event(test_db, 1, sport, league)
             assert result == expected, f"Failed: {desc} - got {result}, expected {expected}"
+
+
+@pytest.fixture
+def resolver(stub_league_mappings):
+    """TemplateResolver with league lookups stubbed out."""
+    from teamarr.templates.resolver import TemplateResolver
+
+    return TemplateResolver()
+
+
+def _team_context(team_name: str):
+    from teamarr.templates.context import TeamChannelContext, TemplateContext
+
+    return TemplateContext(
+        game_context=None,
+        team_config=TeamChannelContext(
+            team_id="1", league="nfl", sport="football", team_name=team_name
+        ),
+        team_stats=None,
+    )
+
+
+class TestResolverVariableReuse:
+    """The resolver reuses variables built for the last context it resolved."""
+
+    def test_reassigned_extra_vars_are_picked_up(self, resolver):
+        ctx = _team_context("Lions")
+        template = "{team_name} {exception_keyword}"
+
+        assert resolver.resolve(template, ctx) == "Lions"
+        ctx.extra_vars = {"exception_keyword": "Spanish"}
+        assert resolver.resolve(template, ctx) == "Lions Spanish"
+        ctx.extra_vars = {"exception_keyword": "French"}
+        assert resolver.resolve(template, ctx) == "Lions French"
+
+    def test_alternating_contexts(self, resolver):
+        lions = _team_context("Lions")
+        bears = _team_context("Bears")
+        # Same extra_vars object, so only the context itself tells them apart
+        bears.extra_vars = lions.extra_vars
+
+        for _ in range(2):
+            assert resolver.resolve("{team_name}", lions) == "Lions"
+            assert resolver.resolve("{team_name}", bears) == "Bears"